@@ -1,34 +1,76 @@
 import random
 import time
+from instrument import timed
+from solver import PathSolver
+
+# How many boards to try before accepting a degenerate one
+MAX_REROLLS = 20
 
 class GameEngine:
-    def __init__(self, level_manager):
+    def __init__(self, level_manager, reject_degenerate=True, clock=time.time, rng=random, puzzle_cache=None):
+        # clock/rng can be swapped for a simulated clock and a seeded random.Random
         self.level_manager = level_manager
-        self.focus_level = 100.0
+        self.puzzle_cache = puzzle_cache
+        self.reject_degenerate = reject_degenerate
+        self.clock = clock
+        self.rng = rng
         self.is_focused = True
+        self.focus_level = 100.0
         self.reset_for_next_level()
 
-    def reset_for_next_level(self):
+    def reset_for_next_level(self, puzzle=None):
+        # puzzle: optional (grid, target) pair, e.g. from puzzles.generate_batch
         config = self.level_manager.get_current_config()
         self.grid_size = config['size']
         self.moves_left = config['moves']
-        self.grid = self._generate_grid()
-        self.target_sum = self._calculate_valid_target()
-        self.current_sum = 0
-        self.path = []
-        self.start_time = time.time()
+        if puzzle is None and self.puzzle_cache is not None:
+            puzzle = self.puzzle_cache.get(config)
+            # Get the following level's board generating while this one is played
+            if self.level_manager.current_level < self.level_manager.max_levels:
+                self.puzzle_cache.prefetch_level(self.level_manager.current_level + 1)
+        if puzzle is None:
+            self.grid, self.target_sum = self._generate_puzzle()
+        else:
+            self.grid, self.target_sum = puzzle
+            if len(self.grid) != self.grid_size:
+                raise ValueError(f"Puzzle is {len(self.grid)}x{len(self.grid)}, level needs {self.grid_size}x{self.grid_size}")
+        self._clear_path()
+        self.start_time = self.clock()
+        # The drain rate depends on the level, so start a new segment here
+        self.focus_level = self.focus_level
 
     def reset_current_level(self):
         self.moves_left = self.level_manager.get_current_config()['moves']
+        self._clear_path()
+
+    def _clear_path(self):
         self.current_sum = 0
         self.path = []
+        self.visited = 0      # bitmask of path cells, bit r*size+c
+        self.redo_stack = []
+        self.move_log = []    # replay log: ("move" | "undo" | "redo", r, c)
+
+    def _generate_puzzle(self):
+        # Re-roll boards that can't be won within the move limit or are won in 1-2 clicks
+        for _ in range(MAX_REROLLS):
+            self.grid = self._generate_grid()
+            target = self._calculate_valid_target()
+            if not self.reject_degenerate:
+                break
+            shortest = PathSolver(self.grid, target, self.moves_left).shortest_length()
+            if shortest is not None and shortest >= 3:
+                break
+        return self.grid, target
+
+    def rate_puzzle(self):
+        return PathSolver(self.grid, self.target_sum, self.level_manager.get_current_config()['moves']).rate()
 
     def _generate_grid(self):
-        return [[random.randint(1, 9) for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        return [[self.rng.randint(1, 9) for _ in range(self.grid_size)] for _ in range(self.grid_size)]
 
     def _calculate_valid_target(self):
         # Ensure there is at least one valid path of reasonable length
-        path_len = random.randint(3, self.grid_size + 1)
+        path_len = self.rng.randint(3, self.grid_size + 1)
         r, c = 0, 0
         target = self.grid[r][c]
         visited = {(0,0)}
@@ -40,15 +82,28 @@ class GameEngine:
                 if 0 <= nr < self.grid_size and 0 <= nc < self.grid_size and (nr, nc) not in visited:
                     adj.append((nr, nc))
             if not adj: break
-            r, c = random.choice(adj)
+            r, c = self.rng.choice(adj)
             target += self.grid[r][c]
             visited.add((r, c))
         return target
 
+    @timed("GameEngine.process_move")
     def process_move(self, r, c):
-        if (r, c) in self.path:
+        result = self._step(r, c)
+        if result in ("ALREADY_VISITED", "INVALID_MOVE"):
+            return result
+        # A new move invalidates anything that was undone
+        if self.redo_stack:
+            self.redo_stack = []
+        self.move_log.append(("move", r, c))
+        return result
+
+    def _step(self, r, c):
+        # O(1) visited check against the bitmask instead of scanning the path
+        bit = 1 << (r * self.grid_size + c)
+        if self.visited & bit:
             return "ALREADY_VISITED"
-        
+
         # Check adjacency if path started
         if self.path:
             pr, pc = self.path[-1]
@@ -56,9 +111,12 @@ class GameEngine:
                 return "INVALID_MOVE"
 
         self.path.append((r, c))
+        self.visited |= bit
         self.current_sum += self.grid[r][c]
         self.moves_left -= 1
+        return self._result()
 
+    def _result(self):
         if self.current_sum == self.target_sum:
             return "WIN"
         if self.moves_left <= 0 or self.current_sum > self.target_sum:
@@ -66,25 +124,89 @@ class GameEngine:
         
         return "CONTINUE"
 
+    # Undo/redo are O(1): pop the path, flip one bit, adjust the sum
+    def undo(self):
+        if not self.path:
+            return None
+        r, c = self.path.pop()
+        self.visited &= ~(1 << (r * self.grid_size + c))
+        self.current_sum -= self.grid[r][c]
+        self.moves_left += 1
+        self.redo_stack.append((r, c))
+        self.move_log.append(("undo", r, c))
+        return (r, c)
+
+    def redo(self):
+        if not self.redo_stack:
+            return None
+        r, c = self.redo_stack.pop()
+        result = self._step(r, c)
+        self.move_log.append(("redo", r, c))
+        return result
+
+    def get_replay(self):
+        return list(self.move_log)
+
+    def replay(self, move_log):
+        # Plays a replay log back on the current board from an empty path
+        self.reset_current_level()
+        result = None
+        for action, r, c in move_log:
+            if action == "move":
+                result = self.process_move(r, c)
+            elif action == "undo":
+                self.undo()
+            else:
+                result = self.redo()
+        return result
+
     def get_grid(self): return self.grid
     def get_path(self): return self.path
 
+    # Focus is not stepped by a timer any more: it is a value at an anchor
+    # time plus a constant drain rate, evaluated whenever someone reads it.
+    # The anchor moves only when the rate changes (focus in/out, new level)
+    # or when focus_level is assigned.
+    @property
+    def focus_level(self):
+        return self.focus_at(self.clock())
+
+    @focus_level.setter
+    def focus_level(self, value):
+        self._focus_value = min(value, 100)
+        self._focus_time = self.clock()
+        self._focus_rate = self.focus_rate()
+
+    def focus_rate(self):
+        # Focus drains faster if window is inactive (units per second)
+        drain_rate = 0.5 if self.is_focused else 3.0
+        # Difficulty multiplier
+        multiplier = 1 + (self.level_manager.current_level * 0.1)
+        return drain_rate * multiplier
+
+    def focus_at(self, now):
+        return self._focus_value - self._focus_rate * (now - self._focus_time)
+
+    def seconds_until_focus(self, level):
+        # How long until focus drops to `level` (0 if it already has)
+        return max(0.0, (self.focus_level - level) / self._focus_rate)
+
     def handle_focus_loss(self):
+        value = self.focus_level
         self.is_focused = False
+        self.focus_level = value
 
     def handle_focus_gain(self):
+        value = self.focus_level
         self.is_focused = True
+        self.focus_level = value
 
     def tick(self):
-        # Focus drains faster if window is inactive
-        drain_rate = 0.5 if self.is_focused else 3.0
-        # Difficulty multiplier
-        multiplier = 1 + (self.level_manager.current_level * 0.1)
-        self.focus_level -= (drain_rate * multiplier * 0.1)
-        if self.focus_level > 100: self.focus_level = 100
+        # Kept for old callers: focus is computed on demand, nothing to step
+        return self.focus_level
 
     def calculate_round_score(self):
         base = 100 * self.level_manager.current_level
-        time_bonus = max(0, 500 - int(time.time() - self.start_time))
+        time_bonus = max(0, 500 - int(self.clock() - self.start_time))
         focus_bonus = int(self.focus_level * 2)
         return base + time_bonus + focus_bonus
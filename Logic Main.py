@@ -1,10 +1,112 @@
 import tkinter as tk
 from tkinter import messagebox
-import json
+from collections import deque
+import importlib.util
+import os
 import time
-from game_logic import GameEngine
-from levels import LevelManager
-from score import ScoreSystem
+from importlib.machinery import SourceFileLoader
+import instrument
+from Level import LevelManager
+
+# ScoreSystem lives in ScoreData.js (Python despite the extension), which a
+# plain import will not find
+_loader = SourceFileLoader("ScoreData", os.path.join(os.path.dirname(os.path.abspath(__file__)), "ScoreData.js"))
+ScoreData = importlib.util.module_from_spec(importlib.util.spec_from_loader("ScoreData", _loader))
+_loader.exec_module(ScoreData)
+ScoreSystem = ScoreData.ScoreSystem
+
+CELL_BG, CELL_FG = "#2a2a2a", "#ffffff"
+PATH_BG, PATH_FG = "#00ffcc", "#000000"
+
+class FrameStats:
+    """Render timings: our own widget work and the time until Tk is idle again."""
+    def __init__(self, window=200):
+        self.count = 0
+        self.render_ms = deque(maxlen=window)
+        self.frame_ms = deque(maxlen=window)
+        self.cells_changed = 0
+
+    def record_render(self, ms, changed):
+        self.count += 1
+        self.render_ms.append(ms)
+        self.cells_changed += changed
+
+    def record_frame(self, ms):
+        self.frame_ms.append(ms)
+
+    @staticmethod
+    def _p95(values):
+        if not values: return 0.0
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def summary(self):
+        if not self.count:
+            return "no updates yet"
+        r, f = self.render_ms, self.frame_ms
+        return (f"updates {self.count} | render last {r[-1]:.2f} ms p95 {self._p95(r):.2f} ms"
+                f" | frame p95 {self._p95(f):.2f} ms | cells changed {self.cells_changed}")
+
+class GridRenderer:
+    """Keeps a persistent pool of grid buttons and only reconfigures the cells
+    whose value or path highlight changed since the last render."""
+    def __init__(self, root, parent, on_click):
+        self.root = root
+        self.parent = parent
+        self.on_click = on_click
+        self.buttons = {}   # (r, c) -> tk.Button, hidden instead of destroyed
+        self.shown = {}     # (r, c) -> (value, highlighted) currently on screen
+        self.size = 0
+        self.stats = FrameStats()
+
+    def _button(self, r, c):
+        btn = self.buttons.get((r, c))
+        if btn is None:
+            btn = tk.Button(
+                self.parent,
+                width=5,
+                height=2,
+                font=("Courier", 14, "bold"),
+                bg=CELL_BG,
+                fg=CELL_FG,
+                activebackground="#444444",
+                command=lambda r=r, c=c: self.on_click(r, c)
+            )
+            self.buttons[(r, c)] = btn
+        return btn
+
+    def render(self, grid, visited):
+        start = time.perf_counter()
+        size = len(grid)
+        if size != self.size:
+            for (r, c), btn in self.buttons.items():
+                if r >= size or c >= size:
+                    btn.grid_remove()
+                    self.shown.pop((r, c), None)
+            for r in range(size):
+                for c in range(size):
+                    self._button(r, c).grid(row=r, column=c, padx=2, pady=2)
+            self.size = size
+
+        changed = 0
+        for r in range(size):
+            row = grid[r]
+            for c in range(size):
+                state = (row[c], bool(visited >> (r * size + c) & 1))
+                if self.shown.get((r, c)) != state:
+                    value, highlighted = state
+                    self.buttons[(r, c)].config(
+                        text=str(value),
+                        bg=PATH_BG if highlighted else CELL_BG,
+                        fg=PATH_FG if highlighted else CELL_FG
+                    )
+                    self.shown[(r, c)] = state
+                    changed += 1
+
+        self.stats.record_render((time.perf_counter() - start) * 1000, changed)
+        # Frame latency: from render start until Tk has processed the redraw
+        self.root.after_idle(lambda: self.stats.record_frame((time.perf_counter() - start) * 1000))
+        return changed
 
 class MindStrikeApp:
     def __init__(self, root):
@@ -13,15 +115,24 @@ class MindStrikeApp:
         self.root.geometry("900x700")
         self.root.configure(bg="#121212")
 
-        # Initialize Components
-        self.score_system = ScoreSystem()
+        # Initialize Components (scores.json is read while the window comes up)
+        self.score_system = ScoreSystem(background=True)
         self.level_manager = LevelManager()
-        self.engine = GameEngine(self.level_manager)
-        
+
         self.setup_ui()
+        # Paint the first frame before importing the game modules and generating a board
+        self.root.update()
+        self.load_game()
         self.bind_events()
         self.start_game()
 
+    def load_game(self):
+        from Game import GameEngine
+        from puzzle_cache import PuzzleCache
+        # Next level's board is generated in the background, so a win moves on instantly
+        self.puzzle_cache = PuzzleCache()
+        self.engine = GameEngine(self.level_manager, puzzle_cache=self.puzzle_cache)
+
     def setup_ui(self):
         # Header Section
         self.header = tk.Frame(self.root, bg="#1a1a1a", pady=10)
@@ -46,6 +157,7 @@ class MindStrikeApp:
         # Grid Container
         self.grid_frame = tk.Frame(self.root, bg="#333333", pading=2)
         self.grid_frame.pack(expand=True)
+        self.renderer = GridRenderer(self.root, self.grid_frame, self.make_move)
 
         # Focus Meter
         self.focus_frame = tk.Frame(self.root, bg="#121212", pady=10)
@@ -56,66 +168,69 @@ class MindStrikeApp:
         self.focus_bar.pack()
         self.focus_rect = self.focus_bar.create_rectangle(0, 0, 400, 10, fill="#00ffcc")
 
+        # MINDSTRIKE_STATS=1 shows render/frame latency under the focus meter
+        self.stats_label = None
+        if os.environ.get("MINDSTRIKE_STATS"):
+            self.stats_label = tk.Label(self.root, text="", fg="#555555", bg="#121212", font=("Courier", 9))
+            self.stats_label.pack(side="bottom")
+
     def bind_events(self):
-        self.root.bind("<FocusOut>", lambda e: self.engine.handle_focus_loss())
-        self.root.bind("<FocusIn>", lambda e: self.engine.handle_focus_gain())
+        self.root.bind("<FocusOut>", lambda e: self.on_focus_change(self.engine.handle_focus_loss))
+        self.root.bind("<FocusIn>", lambda e: self.on_focus_change(self.engine.handle_focus_gain))
+        self.root.bind("<Control-z>", lambda e: self.undo_move())
+        self.root.bind("<Control-y>", lambda e: self.redo_move())
 
     def start_game(self):
+        self._bar_width = None
+        self._bar_color = None
+        self._loop_id = None
         self.update_grid()
         self.game_loop()
 
+    def on_focus_change(self, handler):
+        # The drain rate just changed, so the scheduled wake-up is stale
+        handler()
+        if self._loop_id is not None:
+            self.root.after_cancel(self._loop_id)
+        self.game_loop()
+
+    @instrument.timed("MindStrikeApp.update_grid")
     def update_grid(self):
-        # Clear current grid
-        for widget in self.grid_frame.winfo_children():
-            widget.destroy()
-
-        grid_data = self.engine.get_grid()
-        self.buttons = []
-        
-        for r in range(len(grid_data)):
-            row_btns = []
-            for c in range(len(grid_data[0])):
-                val = grid_data[r][c]
-                btn = tk.Button(
-                    self.grid_frame, 
-                    text=str(val), 
-                    width=5, 
-                    height=2, 
-                    font=("Courier", 14, "bold"),
-                    bg="#2a2a2a",
-                    fg="#ffffff",
-                    activebackground="#444444",
-                    command=lambda r=r, c=c: self.make_move(r, c)
-                )
-                btn.grid(row=r, column=c, padx=2, pady=2)
-                row_btns.append(btn)
-            self.buttons.append(row_btns)
-        
+        # Diff against what is on screen - no widgets are destroyed or recreated
+        self.renderer.render(self.engine.get_grid(), self.engine.visited)
         self.refresh_ui_labels()
+        if self.stats_label is not None:
+            self.stats_label.config(text=self.renderer.stats.summary())
 
     def make_move(self, r, c):
-        result = self.engine.process_move(r, c)
+        self.handle_result(self.engine.process_move(r, c))
+
+    def undo_move(self):
+        if self.engine.undo():
+            self.update_grid()
+
+    def redo_move(self):
+        result = self.engine.redo()
+        if result:
+            self.handle_result(result)
+
+    def handle_result(self, result):
         if result == "WIN":
             self.score_system.add_points(self.engine.calculate_round_score())
+            # Submits the score and writes a new high score once per level
+            self.score_system.finish_level(self.level_manager.current_level)
             if self.level_manager.next_level():
                 messagebox.showinfo("Success", "Logic Level Cleared!")
                 self.engine.reset_for_next_level()
-                self.update_grid()
             else:
                 messagebox.showinfo("MindStrike Master", "You have conquered all levels!")
                 self.root.quit()
         elif result == "LOSE":
             messagebox.showerror("Failed", "Logic Error: Out of moves or invalid path.")
             self.engine.reset_current_level()
-            self.update_grid()
-        
-        self.refresh_ui_labels()
-        self.highlight_path()
 
-    def highlight_path(self):
-        path = self.engine.get_path()
-        for r, c in path:
-            self.buttons[r][c].config(bg="#00ffcc", fg="#000000")
+        # One diff-render covers new boards, resets and the newly highlighted cell
+        self.update_grid()
 
     def refresh_ui_labels(self):
         self.lvl_label.config(text=f"LEVEL: {self.level_manager.current_level}")
@@ -124,26 +239,44 @@ class MindStrikeApp:
         self.status_label.config(text=f"Current Sum: {self.engine.current_sum} | Moves Left: {self.engine.moves_left}")
 
     def game_loop(self):
-        # Update Focus Bar
-        focus_pct = self.engine.focus_level / 100
-        self.focus_bar.coords(self.focus_rect, 0, 0, 400 * focus_pct, 10)
-        
-        # Color shift for focus
-        if focus_pct < 0.3: color = "#ff3366"
-        elif focus_pct < 0.6: color = "#ffcc00"
-        else: color = "#00ffcc"
-        self.focus_bar.itemconfig(self.focus_rect, fill=color)
-
+        self._loop_id = None
         if self.engine.focus_level <= 0:
-            messagebox.showwarning("DISTRACTED", "Focus Lost. Penalty Applied.")
+            # Apply the penalty before the dialog: showwarning runs a nested
+            # event loop, and a focus-in handler there could re-enter game_loop
             self.engine.focus_level = 50
             self.score_system.penalty(50)
             self.refresh_ui_labels()
+            messagebox.showwarning("DISTRACTED", "Focus Lost. Penalty Applied.")
+            if self._loop_id is not None:
+                return  # A nested call already redrew the bar and rescheduled
+
+        # Update Focus Bar only when its pixel width or colour bucket changes
+        focus_pct = max(0.0, self.engine.focus_level / 100)
+        width = int(400 * focus_pct)
+        if width != self._bar_width:
+            self.focus_bar.coords(self.focus_rect, 0, 0, width, 10)
+            self._bar_width = width
+
+        # Color shift for focus
+        if focus_pct < 0.3: color = "#ff3366"
+        elif focus_pct < 0.6: color = "#ffcc00"
+        else: color = "#00ffcc"
+        if color != self._bar_color:
+            self.focus_bar.itemconfig(self.focus_rect, fill=color)
+            self._bar_color = color
 
-        self.engine.tick()
-        self.root.after(100, self.game_loop)
+        # Sleep until the bar loses its next pixel (the colour thresholds sit on
+        # pixel boundaries) or focus runs out; focus in/out wakes us up early
+        next_level = width / 4 if width > 0 else 0
+        delay_ms = int(self.engine.seconds_until_focus(next_level) * 1000) + 1
+        self._loop_id = self.root.after(min(max(delay_ms, 16), 1000), self.game_loop)
 
 if __name__ == "__main__":
+    # INSTRUMENT=1 / INSTRUMENT_PROFILE=session.pstats, see instrument.py
+    instrument.configure()
     root = tk.Tk()
     app = MindStrikeApp(root)
-    root.mainloop()```
+    root.mainloop()
+    if os.environ.get("MINDSTRIKE_STATS"):
+        print(app.renderer.stats.summary())
+        print(f"puzzle cache: {app.puzzle_cache.stats()}")
@@ -1,31 +1,76 @@
+import atexit
 import json
 import os
+import threading
+from instrument import timed
 
 class ScoreSystem:
-    def __init__(self):
+    def __init__(self, player="player", leaderboard=None, file_path="scores.json", background=False):
         self.total_score = 0
         self.high_score = 0
-        self.file_path = "scores.json"
-        self.load_high_score()
+        # None keeps the high score in memory only (e.g. server-side sessions)
+        self.file_path = file_path
+        self.player = player
+        # Optional leaderboard.Leaderboard; finished levels are submitted to it
+        self.leaderboard = leaderboard
+        self._dirty = False
+        self._loaded = threading.Event()
+        if self.file_path is None:
+            self._loaded.set()
+        else:
+            if background:
+                # The window comes up while the file is read; add_points waits for it
+                threading.Thread(target=self._load, daemon=True).start()
+            else:
+                self._load()
+            atexit.register(self.flush)
+
+    def _load(self):
+        try:
+            self.load_high_score()
+        finally:
+            self._loaded.set()
 
     def add_points(self, points):
+        self._loaded.wait()
         self.total_score += points
         if self.total_score > self.high_score:
             self.high_score = self.total_score
-            self.save_high_score()
+            # Written on level end / exit, not on every point during play
+            self._dirty = True
 
     def penalty(self, points):
         self.total_score = max(0, self.total_score - points)
 
-    def load_high_score(self):
+    def finish_level(self, level):
+        if self.leaderboard is not None:
+            self.leaderboard.submit(self.player, level, self.total_score)
+        self.flush()
+
+    def flush(self):
+        if self._dirty and self.file_path is not None:
+            self.save_high_score()
+
+    def _read_high_score(self):
         if os.path.exists(self.file_path):
             try:
                 with open(self.file_path, "r") as f:
                     data = json.load(f)
-                    self.high_score = data.get("high_score", 0)
+                    return data.get("high_score", 0)
             except:
-                self.high_score = 0
+                pass
+        return 0
+
+    def load_high_score(self):
+        self.high_score = self._read_high_score()
 
+    @timed("ScoreSystem.save_high_score")
     def save_high_score(self):
-        with open(self.file_path, "w") as f:
+        # Another game instance may have saved a higher score since we loaded
+        self.high_score = max(self.high_score, self._read_high_score())
+        # Temp file + rename, so another game instance never reads half a file
+        tmp = f"{self.file_path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
             json.dump({"high_score": self.high_score}, f)
+        os.replace(tmp, self.file_path)
+        self._dirty = False
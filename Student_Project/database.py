@@ -1,54 +1,250 @@
 # FILE: database.py
+import csv
 import json
 import os
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from itertools import islice
 from model import Student  # model.py mathi Student class import karyo
+from storage import RecordLog, LOG_FILE, atomic_write
+from indexes import CourseIndex, NameIndex, CompactCourseIndex, CompactNameIndex
+from streaming import iter_records
+from snapshot import SNAPSHOT_FILE, write_snapshot
+
+# instrument.py repo root ma che (main.py path umere che); na male to timing vagar chale
+try:
+    from instrument import timed
+except ImportError:
+    def timed(name=None):
+        return lambda method: method
 
 DB_FILE = "students.json"
 
+def _needs_data(method):
+    # Background load chalu hoy to data aave tya sudhi raah jove
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._loaded.wait()
+        if self.load_error is not None:
+            raise self.load_error
+        return method(self, *args, **kwargs)
+    return wrapper
+
 class Database:
-    def __init__(self):
-        self.students = []
-        self.load_data()
+    def __init__(self, log_file=LOG_FILE, json_file=DB_FILE, compact=False, background=False):
+        self.json_file = json_file
+        # compact=True: lakho students mate columnar store (ochhi memory)
+        self.storage = RecordLog(log_file, compact_mode=compact)
+        self.storage.on_change = self._on_change
+        self.storage.on_reload = self._rebuild_indexes
+        self.compact = compact
+        # Compact mode ma indexes pan student dith ek int j rakhe che
+        self.course_index = self._new_course_index()
+        self.name_index = CompactNameIndex(self._name_of) if compact else NameIndex()
+        self._defer_indexes = False  # bulk import vakhte indexes chhelle ek var banavva
+        self._loaded = threading.Event()
+        self.load_error = None
+
+        # background=True: menu turant dekhay, data pachal thi load thay
+        self._background = background
+        if background:
+            threading.Thread(target=self._load_in_background, daemon=True).start()
+        else:
+            self._load_in_background()
+
+    def _load_in_background(self):
+        try:
+            self.load_data()
+        except Exception as e:
+            # Kharab file hoy to khali roster thi chalu nathi karvanu - error batavvi
+            self.load_error = e
+            if not self._background:
+                raise
+        finally:
+            self._loaded.set()
+
+    def is_loading(self):
+        return not self._loaded.is_set()
+
+    @property
+    def students(self):
+        """roll_no -> Student (storage no hash index)"""
+        return self.storage.index
 
     def load_data(self):
-        """JSON file mathi data lavshe"""
-        if not os.path.exists(DB_FILE):
+        """Record log mathi data lavshe; log na hoy to JSON file import karshe"""
+        # Lock ni andar check karvanu, etle be process sathe JSON import na kare
+        with self.storage.lock:
+            if self.storage.exists() or not os.path.exists(self.json_file):
+                self.storage.load()
+                self._rebuild_indexes()
+            else:
+                self.import_json(self.json_file)
+
+    def refresh(self):
+        """Bija process e karela add/delete aa process ma lavo"""
+        self._loaded.wait()
+        self.storage.sync()
+
+    def _on_change(self, old, new):
+        if self._defer_indexes:
             return
+        if old is not None:
+            self.course_index.remove(old)
+            self.name_index.remove(old)
+        if new is not None:
+            self.course_index.add(new)
+            self.name_index.add(new)
 
-        try:
-            with open(DB_FILE, "r") as f:
-                data_list = json.load(f)
+    def _new_course_index(self):
+        return CompactCourseIndex() if self.compact else CourseIndex()
+
+    def _name_of(self, roll_no):
+        return self.students[roll_no].name
+
+    def _rebuild_indexes(self):
+        self.course_index = self._new_course_index()
+        for s in self.students.values():
+            self.course_index.add(s)
+        self.name_index.rebuild(self.students.values())
+
+    def import_json(self, path):
+        """JSON array (juno format) ke JSON-lines mathi students log ma umere che"""
+        count = 0
+        # Aakhi file ek sathe parse nathi karta, ek-ek record stream thay che
+        with self._txn(bulk=True):
+            for d in iter_records(path):
                 # Darek dictionary ne Student object ma convert kare che
-                self.students = [Student.from_dict(d) for d in data_list]
-        except Exception:
-            self.students = []
+                self.storage.add(Student.from_dict(d))
+                count += 1
+        return count
+
+    @timed("Database.export_json")
+    @_needs_data
+    def export_json(self, path=None):
+        """Badha students ne JSON array format ma export kare che"""
+        data_list = [s.to_dict() for s in self.students.values()]
+        atomic_write(path or self.json_file, lambda f: json.dump(data_list, f, indent=4))
+
+    @timed("Database.export_snapshot")
+    @_needs_data
+    def export_snapshot(self, path=SNAPSHOT_FILE):
+        """Reporting scripts mate binary snapshot (snapshot.Snapshot thi mmap kari vanchay)"""
+        return write_snapshot(self.students.values(), path)
 
     def save_data(self):
         """Data ne JSON file ma save karshe"""
-        data_list = [s.to_dict() for s in self.students]
-        with open(DB_FILE, "w") as f:
-            json.dump(data_list, f, indent=4)
+        self.export_json()
+
+    def transaction(self, bulk=False):
+        """with db.transaction(): ... - andar na badha add/delete ek j commit ma.
 
+        bulk=True: indexes darek record par nahi, chhelle ek j var bane che.
+        """
+        self._loaded.wait()
+        return self._txn(bulk)
+
+    @contextmanager
+    def _txn(self, bulk=False):
+        outer_bulk = bulk and not self._defer_indexes
+        if outer_bulk:
+            self._defer_indexes = True
+        try:
+            with self.storage.transaction():
+                yield self
+        except BaseException:
+            # Storage e rollback kari didhu, have indexes pan fari banavo
+            if outer_bulk:
+                self._defer_indexes = False
+            self._rebuild_indexes()
+            raise
+        if outer_bulk:
+            self._defer_indexes = False
+            self._rebuild_indexes()
+
+    @timed("Database.import_students")
+    @_needs_data
+    def import_students(self, path):
+        """CSV (name,course) ke JSON/JSON-lines mathi nava students ek transaction ma umere che"""
+        if path.lower().endswith(".csv"):
+            f = open(path, newline="")
+            rows = csv.DictReader(f)
+        else:
+            f = None
+            rows = iter_records(path)
+
+        added = 0
+        try:
+            with self.transaction(bulk=True):
+                for row in rows:
+                    name = (row.get("name") or "").strip()
+                    course = (row.get("course") or "").strip()
+                    if not name or not course:
+                        raise ValueError(f"Row {added + 1}: name/course cannot be empty")
+                    self.add_student(name, course)
+                    added += 1
+        finally:
+            if f is not None:
+                f.close()
+        return added
+
+    @timed("Database.add_student")
+    @_needs_data
     def add_student(self, name, course):
-        # Auto-increment Roll Number logic
-        new_roll = 1
-        if self.students:
-            new_roll = self.students[-1].roll_no + 1
-        
-        new_student = Student(new_roll, name, course)
-        self.students.append(new_student)
-        self.save_data()
+        # Auto-increment Roll Number logic: log no monotonic sequence vapray che,
+        # etle chhello student delete thay to pan eno number fari nathi aavto.
+        # Lock ni andar j number levay che, etle bija process sathe takrav na thay.
+        with self._txn():
+            new_student = Student(self.storage.next_roll(), name, course)
+            self.storage.add(new_student)
         return new_student
 
+    @_needs_data
     def get_all_students(self):
-        return self.students
+        return list(self.students.values())
 
+    @timed("Database.delete_student")
+    @_needs_data
     def delete_student(self, roll_no):
-        initial_count = len(self.students)
-        # Filter logic: Je roll number match na thay e rakhiyu
-        self.students = [s for s in self.students if s.roll_no != roll_no]
-        
-        if len(self.students) < initial_count:
-            self.save_data()
-            return True
-        return False
\ No newline at end of file
+        # Hash index ma direct lookup, aakhi list scan nathi karvi padti
+        return self.storage.delete(roll_no)
+
+    # --- QUERY API ---
+    # Badha find_* lazy iterator aape che; offset/limit thi page pasand karay
+
+    @_needs_data
+    def get_student(self, roll_no):
+        return self.students.get(roll_no)
+
+    def _resolve(self, rolls, offset, limit):
+        stop = None if limit is None else offset + limit
+        return (self.students[r] for r in islice(rolls, offset, stop))
+
+    @_needs_data
+    def find_by_course(self, course, offset=0, limit=None):
+        return self._resolve(self.course_index.lookup(course), offset, limit)
+
+    @_needs_data
+    def find_by_name_prefix(self, prefix, offset=0, limit=None):
+        return self._resolve(self.name_index.prefix(prefix), offset, limit)
+
+    @_needs_data
+    def find_by_name_range(self, lo, hi=None, offset=0, limit=None):
+        return self._resolve(self.name_index.range(lo, hi), offset, limit)
+
+    @_needs_data
+    def count_by_course(self, course):
+        return len(self.course_index.by_course.get(course, ()))
+
+    @staticmethod
+    def pages(results, page_size=10):
+        """Koi pan find_* iterator ne page_size ni lists ma vahenche che"""
+        while True:
+            page = list(islice(results, page_size))
+            if not page:
+                return
+            yield page
+
+    def close(self):
+        self.storage.close()
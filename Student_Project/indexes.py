@@ -0,0 +1,238 @@
+# FILE: indexes.py
+from array import array
+from bisect import bisect_left, insort
+from heapq import merge
+
+class CourseIndex:
+    """course -> roll_no set (dict vapryo che etle insertion order jalvay)"""
+
+    def __init__(self):
+        self.by_course = {}
+
+    def add(self, student):
+        self.by_course.setdefault(student.course, {})[student.roll_no] = None
+
+    def remove(self, student):
+        rolls = self.by_course.get(student.course)
+        if rolls is None:
+            return
+        rolls.pop(student.roll_no, None)
+        if not rolls:
+            del self.by_course[student.course]
+
+    def lookup(self, course):
+        return iter(self.by_course.get(course, ()))
+
+    def courses(self):
+        return list(self.by_course)
+
+
+class NameIndex:
+    """(name.lower(), roll_no) ni sorted list - prefix ane range lookup mate.
+
+    add/remove O(1) che: nava keys `pending` ma ane kadhela keys `removed`
+    ma jay che, ane sorted list ma name query aave tyare j bhega thay.
+    """
+
+    MERGE_INSORT = 32  # aatla sudhi na changes insort/del thi, vadhare hoy to ek sort
+
+    def __init__(self):
+        self.keys = []
+        self.pending = set()
+        self.removed = set()
+
+    def add(self, student):
+        key = (student.name.lower(), student.roll_no)
+        if key in self.removed:
+            self.removed.discard(key)  # Haju keys ma j che
+        else:
+            self.pending.add(key)
+
+    def remove(self, student):
+        key = (student.name.lower(), student.roll_no)
+        if key in self.pending:
+            self.pending.discard(key)
+        else:
+            self.removed.add(key)
+
+    def _merge(self):
+        keys = self.keys
+        if self.removed:
+            if len(self.removed) <= self.MERGE_INSORT:
+                for key in self.removed:
+                    i = bisect_left(keys, key)
+                    if i < len(keys) and keys[i] == key:
+                        del keys[i]
+            else:
+                removed = self.removed
+                keys[:] = [k for k in keys if k not in removed]
+            self.removed = set()
+        if self.pending:
+            if len(self.pending) <= self.MERGE_INSORT:
+                for key in self.pending:
+                    insort(keys, key)
+            else:
+                # Timsort be sorted runs ne O(n) ma bhega kare che
+                keys += sorted(self.pending)
+                keys.sort()
+            self.pending = set()
+        return keys
+
+    def range(self, lo, hi=None):
+        """lo <= name < hi vala roll numbers (case-insensitive)"""
+        keys = self._merge()
+        i = bisect_left(keys, (lo.lower(),))
+        hi = hi.lower() if hi is not None else None
+        while i < len(keys):
+            name, roll_no = keys[i]
+            if hi is not None and name >= hi:
+                return
+            yield roll_no
+            i += 1
+
+    def prefix(self, prefix):
+        keys = self._merge()
+        prefix = prefix.lower()
+        i = bisect_left(keys, (prefix,))
+        # Sorted order che, etle pehlo mismatch aave tya atki javay
+        while i < len(keys) and keys[i][0].startswith(prefix):
+            yield keys[i][1]
+            i += 1
+
+    def rebuild(self, students):
+        self.keys = sorted((s.name.lower(), s.roll_no) for s in students)
+        self.pending = set()
+        self.removed = set()
+
+
+# --- COMPACT MODE ---
+# Database(compact=True) mate: student dith fakt ek int64 (roll_no), Student
+# object ke (name, roll) tuple nahi. Name jarur pade tyare store mathi levay.
+
+class CompactCourseIndex:
+    """course -> sorted array('q') of roll numbers"""
+
+    def __init__(self):
+        self.by_course = {}
+
+    def add(self, student):
+        rolls = self.by_course.get(student.course)
+        if rolls is None:
+            rolls = self.by_course[student.course] = array('q')
+        roll_no = student.roll_no
+        # Roll numbers vadhta kram ma aave, etle mota bhage append j thay
+        if not rolls or roll_no > rolls[-1]:
+            rolls.append(roll_no)
+            return
+        i = bisect_left(rolls, roll_no)
+        if i == len(rolls) or rolls[i] != roll_no:
+            rolls.insert(i, roll_no)
+
+    def remove(self, student):
+        rolls = self.by_course.get(student.course)
+        if rolls is None:
+            return
+        i = bisect_left(rolls, student.roll_no)
+        if i < len(rolls) and rolls[i] == student.roll_no:
+            del rolls[i]
+        if not rolls:
+            del self.by_course[student.course]
+
+    def lookup(self, course):
+        return iter(self.by_course.get(course, ()))
+
+    def courses(self):
+        return list(self.by_course)
+
+
+class CompactNameIndex:
+    """NameIndex jevu j, pan name kram ma roll numbers nu array('q') rakhe che.
+
+    name_of(roll_no) store mathi naam aape che (binary search darek pagle
+    ek lookup kare). add/remove NameIndex ni jem pending/removed ma jay che;
+    removed ma juna naam rakhvu pade, kem ke store ma e haju array ma padela
+    roll nu navu naam (ke kashu j nahi) hoy shake.
+    """
+
+    MERGE_INSORT = 32
+
+    def __init__(self, name_of):
+        self.name_of = name_of
+        self.rolls = array('q')
+        self.pending = set()   # nava roll numbers (naam store ma che)
+        self.removed = {}      # array mathi kadhvana roll -> e vakhte nu name.lower()
+
+    def add(self, student):
+        self.pending.add(student.roll_no)
+
+    def remove(self, student):
+        roll_no = student.roll_no
+        if roll_no in self.pending:
+            self.pending.discard(roll_no)
+        elif roll_no not in self.removed:
+            self.removed[roll_no] = student.name.lower()
+
+    def _key(self, roll_no):
+        name = self.removed.get(roll_no)
+        if name is None:
+            name = self.name_of(roll_no).lower()
+        return name, roll_no
+
+    def _find(self, key):
+        """Array ma key thi pehlo index (bisect_left, key store mathi)"""
+        rolls, lo, hi = self.rolls, 0, len(self.rolls)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(rolls[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _merge(self):
+        rolls = self.rolls
+        if self.removed:
+            if len(self.removed) <= self.MERGE_INSORT:
+                for roll_no, name in list(self.removed.items()):
+                    i = self._find((name, roll_no))
+                    if i < len(rolls) and rolls[i] == roll_no:
+                        del rolls[i]
+                    del self.removed[roll_no]
+            else:
+                removed = self.removed
+                rolls = self.rolls = array('q', (r for r in rolls if r not in removed))
+            self.removed = {}
+        if self.pending:
+            if len(self.pending) <= self.MERGE_INSORT:
+                for roll_no in self.pending:
+                    rolls.insert(self._find(self._key(roll_no)), roll_no)
+            else:
+                # Pending sort karo, pachi array sathe ek linear merge
+                added = sorted(self.pending, key=self._key)
+                self.rolls = array('q', merge(rolls, added, key=self._key))
+            self.pending = set()
+        return self.rolls
+
+    def range(self, lo, hi=None):
+        """lo <= name < hi vala roll numbers (case-insensitive)"""
+        rolls = self._merge()
+        i = self._find((lo.lower(),))
+        hi = hi.lower() if hi is not None else None
+        while i < len(rolls):
+            if hi is not None and self._key(rolls[i])[0] >= hi:
+                return
+            yield rolls[i]
+            i += 1
+
+    def prefix(self, prefix):
+        rolls = self._merge()
+        prefix = prefix.lower()
+        i = self._find((prefix,))
+        while i < len(rolls) and self._key(rolls[i])[0].startswith(prefix):
+            yield rolls[i]
+            i += 1
+
+    def rebuild(self, students):
+        self.rolls = array('q', (roll for _, roll in sorted((s.name.lower(), s.roll_no) for s in students)))
+        self.pending = set()
+        self.removed = {}
@@ -1,8 +1,66 @@
 # FILE: main.py
+import os
+import sys
+# Repo root na instrument.py mate (INSTRUMENT=1 thi timing chalu thay)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 from database import Database
+from snapshot import SNAPSHOT_FILE
+
+try:
+    import instrument
+except ImportError:
+    instrument = None
+
+def search_students(db):
+    mode = input("Search by (c)ourse or (n)ame prefix: ").strip().lower()
+    if mode == 'c':
+        results = db.find_by_course(input("Enter Course: ").strip())
+    elif mode == 'n':
+        results = db.find_by_name_prefix(input("Enter Name Prefix: ").strip())
+    else:
+        print("Invalid Choice.")
+        return
+
+    found = False
+    for page in db.pages(results, page_size=10):
+        found = True
+        for s in page:
+            print("   " + str(s))
+        if input("-- Enter for more, q to stop: ").strip().lower() == 'q':
+            break
+    if not found:
+        print("   (No data found)")
+
+def bulk_import(db, path):
+    try:
+        added = db.import_students(path)
+        print(f"✅ Imported {added} students from {path}")
+    except FileNotFoundError:
+        print(f"❌ File not found: {path}")
+    except ValueError as e:
+        # Transaction rollback thai gayu - ek pan student umerayo nathi
+        print(f"❌ Import cancelled, nothing was saved. ({e})")
 
 def main():
-    db = Database() # Database object banavyo
+    if instrument is not None:
+        instrument.configure()  # INSTRUMENT=1 / INSTRUMENT_PROFILE=session.pstats
+
+    # python main.py import students.csv -> menu vagar direct bulk import
+    if len(sys.argv) == 3 and sys.argv[1] == "import":
+        db = Database()
+        bulk_import(db, sys.argv[2])
+        db.close()
+        return
+
+    # python main.py snapshot [students.snap] -> reporting mate binary snapshot
+    if len(sys.argv) in (2, 3) and sys.argv[1] == "snapshot":
+        db = Database()
+        path = sys.argv[2] if len(sys.argv) == 3 else SNAPSHOT_FILE
+        print(f"✅ {db.export_snapshot(path)} students written to {path}")
+        db.close()
+        return
+
+    db = Database(background=True) # Database object banavyo (data pachal thi load thay)
 
     while True:
         print("\n" + "="*30)
@@ -11,7 +69,10 @@ def main():
         print("1. Add Student")
         print("2. View All")
         print("3. Delete Student")
-        print("4. Exit")
+        print("4. Search Students")
+        print("5. Export to JSON")
+        print("6. Bulk Import (CSV/JSON)")
+        print("7. Exit")
         
         choice = input("👉 Choose Option: ")
 
@@ -25,6 +86,9 @@ def main():
                 print("❌ Name/Course cannot be empty.")
 
         elif choice == '2':
+            if db.is_loading():
+                print("⏳ Data load thai rahyo che, thodi var...")
+            db.refresh()  # bija intake workers e umerela students pan dekhay
             students = db.get_all_students()
             print("\n📋 List of Students:")
             if not students:
@@ -43,6 +107,17 @@ def main():
                 print("❌ Please enter valid number.")
 
         elif choice == '4':
+            search_students(db)
+
+        elif choice == '5':
+            db.export_json()
+            print(f"✅ Exported to {db.json_file}")
+
+        elif choice == '6':
+            bulk_import(db, input("Enter File Path: ").strip())
+
+        elif choice == '7':
+            db.close()
             print("👋 Bye Bye!")
             break
         else:
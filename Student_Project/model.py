@@ -1,6 +1,12 @@
 # FILE: model.py
+from array import array
+from bisect import bisect_left
+import sys
 
 class Student:
+    # __slots__ thi darek object ni __dict__ nathi banti (memory ochhi vapray)
+    __slots__ = ("roll_no", "name", "course")
+
     def __init__(self, roll_no, name, course):
         self.roll_no = roll_no
         self.name = name
@@ -20,4 +26,134 @@ class Student:
         return Student(data["roll_no"], data["name"], data["course"])
 
     def __str__(self):
-        return f"🆔 {self.roll_no} | 👤 {self.name} | 📚 {self.course}"
\ No newline at end of file
+        return f"🆔 {self.roll_no} | 👤 {self.name} | 📚 {self.course}"
+
+
+class StudentColumns:
+    """Compact mode: students ne columns ma rakhe che, Student object nahi.
+
+    roll numbers array('q') ma (sorted), course strings intern kari ne
+    array('I') ma fakt teno id rakhay che. Student object fakt mangiye tyare
+    (view tarike) banay che. Dict jevu j interface aape che etle RecordLog
+    ane Database ne farak nathi padto.
+    """
+
+    def __init__(self):
+        self.rolls = array('q')
+        self.names = []
+        self.course_ids = array('I')
+        self.alive = bytearray()
+        self.courses = []       # course id -> course string
+        self._course_ids = {}   # course string -> id
+        self.live = 0
+        self.dead = 0
+
+    def _course_id(self, course):
+        cid = self._course_ids.get(course)
+        if cid is None:
+            cid = len(self.courses)
+            course = sys.intern(course)
+            self.courses.append(course)
+            self._course_ids[course] = cid
+        return cid
+
+    def _find(self, roll_no):
+        i = bisect_left(self.rolls, roll_no)
+        if i < len(self.rolls) and self.rolls[i] == roll_no:
+            return i
+        return -1
+
+    def _view(self, i):
+        return Student(self.rolls[i], self.names[i], self.courses[self.course_ids[i]])
+
+    def __setitem__(self, roll_no, student):
+        cid = self._course_id(student.course)
+        rolls = self.rolls
+        if not rolls or roll_no > rolls[-1]:
+            # Roll numbers vadhta kram ma j aave, etle mota bhage append j thay
+            rolls.append(roll_no)
+            self.names.append(student.name)
+            self.course_ids.append(cid)
+            self.alive.append(1)
+            self.live += 1
+            return
+
+        i = self._find(roll_no)
+        if i >= 0:
+            self.names[i] = student.name
+            self.course_ids[i] = cid
+            if not self.alive[i]:
+                self.alive[i] = 1
+                self.live += 1
+                self.dead -= 1
+            return
+
+        i = bisect_left(rolls, roll_no)
+        rolls.insert(i, roll_no)
+        self.names.insert(i, student.name)
+        self.course_ids.insert(i, cid)
+        self.alive.insert(i, 1)
+        self.live += 1
+
+    def __getitem__(self, roll_no):
+        i = self._find(roll_no)
+        if i < 0 or not self.alive[i]:
+            raise KeyError(roll_no)
+        return self._view(i)
+
+    def get(self, roll_no, default=None):
+        i = self._find(roll_no)
+        if i < 0 or not self.alive[i]:
+            return default
+        return self._view(i)
+
+    def pop(self, roll_no, default=None):
+        i = self._find(roll_no)
+        if i < 0 or not self.alive[i]:
+            return default
+        student = self._view(i)
+        self.alive[i] = 0
+        self.names[i] = None
+        self.live -= 1
+        self.dead += 1
+        if self.dead > 1024 and self.dead > self.live:
+            self._compact()
+        return student
+
+    def _compact(self):
+        """Delete thayela rows kadhi nakhe che"""
+        keep = [i for i in range(len(self.rolls)) if self.alive[i]]
+        self.rolls = array('q', (self.rolls[i] for i in keep))
+        self.names = [self.names[i] for i in keep]
+        self.course_ids = array('I', (self.course_ids[i] for i in keep))
+        self.alive = bytearray(b"\x01") * len(keep)
+        self.dead = 0
+
+    def __contains__(self, roll_no):
+        i = self._find(roll_no)
+        return i >= 0 and bool(self.alive[i])
+
+    def __len__(self):
+        return self.live
+
+    def __iter__(self):
+        for i in range(len(self.rolls)):
+            if self.alive[i]:
+                yield self.rolls[i]
+
+    def __reversed__(self):
+        for i in range(len(self.rolls) - 1, -1, -1):
+            if self.alive[i]:
+                yield self.rolls[i]
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        for i in range(len(self.rolls)):
+            if self.alive[i]:
+                yield self._view(i)
+
+    def items(self):
+        for s in self.values():
+            yield s.roll_no, s
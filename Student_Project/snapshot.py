@@ -0,0 +1,169 @@
+# FILE: snapshot.py
+import mmap
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from model import Student
+from storage import atomic_write
+
+SNAPSHOT_FILE = "students.snap"
+MAGIC = b"STUSNAP1"
+
+# Header (64 bytes): magic, byte order, students N, courses C, heap bytes, created (unix time)
+HEADER = struct.Struct("<8s2s6xQQQd")
+HEADER_SIZE = 64
+
+# Layout (header pachi, kram ma):
+#   rolls      int64[N]      roll_no, sorted - binary search aa column par thay
+#   name_off   uint32[N+1]   heap ma name i = heap[name_off[i]:name_off[i+1]]
+#   course_id  uint32[N]     course table ma index
+#   course_off uint32[C+1]   heap ma course j = heap[course_off[j]:course_off[j+1]]
+#   heap       UTF-8 bytes   badha names (roll kram ma), pachi distinct courses
+# Arrays native byte order ma che (mmap par sidhu memoryview.cast), etle
+# file e j byte order vala machine par vanchay; roster log mathi fari banavay.
+
+
+def write_snapshot(students, path=SNAPSHOT_FILE, created=None):
+    """Student objects (koi pan kram) mathi snapshot file banave che, atomic rename thi"""
+    students = sorted(students, key=lambda s: s.roll_no)
+    rolls = array('q', (s.roll_no for s in students))
+    name_off = array('I', [0])
+    course_id = array('I')
+    courses = {}  # course string -> id (darek course heap ma ek j var)
+    heap = bytearray()
+    for s in students:
+        heap += s.name.encode("utf-8")
+        name_off.append(len(heap))
+        course_id.append(courses.setdefault(s.course, len(courses)))
+    course_off = array('I', [len(heap)])
+    for course in courses:
+        heap += course.encode("utf-8")
+        course_off.append(len(heap))
+    if len(heap) >= 1 << 32:
+        raise ValueError("snapshot string heap is over 4 GB")
+
+    header = HEADER.pack(MAGIC, sys.byteorder[:2].encode(), len(rolls), len(courses), len(heap),
+                         time.time() if created is None else created)
+
+    def write(f):
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        for column in (rolls, name_off, course_id, course_off):
+            column.tofile(f)
+        f.write(heap)
+    atomic_write(path, write, mode="wb")
+    return len(rolls)
+
+
+class Snapshot:
+    """mmap kareli snapshot: roll_no thi lookup, aakhi file parse karya vagar.
+
+    Open karvu O(1) che - fakt header vanchay. Lookup rolls column par
+    binary search che ane fakt e ek student na bytes decode thay. File
+    read-only map thay che, etle ghana process ek j page cache share kare.
+    """
+
+    def __init__(self, path=SNAPSHOT_FILE):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._map()
+        except Exception:
+            self._mm.close()
+            raise
+
+    def _map(self):
+        if len(self._mm) < HEADER_SIZE:
+            raise ValueError(f"{self.path}: not a student snapshot")
+        magic, order, n, c, heap_size, self.created = HEADER.unpack_from(self._mm)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: not a student snapshot")
+        if order != sys.byteorder[:2].encode():
+            raise ValueError(f"{self.path}: written on a {order.decode()}-endian machine, rebuild it here")
+        if len(self._mm) != HEADER_SIZE + 8 * n + 4 * (n + 1) + 4 * n + 4 * (c + 1) + heap_size:
+            raise ValueError(f"{self.path}: truncated snapshot")
+
+        view = self._view = memoryview(self._mm)
+        pos = HEADER_SIZE
+
+        def column(code, count):
+            nonlocal pos
+            size = count * struct.calcsize(code)
+            col = view[pos:pos + size].cast(code)
+            pos += size
+            return col
+
+        self.rolls = column('q', n)
+        self._name_off = column('I', n + 1)
+        self._course_id = column('I', n)
+        self._course_off = column('I', c + 1)
+        self._heap = view[pos:pos + heap_size]
+        self._courses = {}  # course id -> str, vaparata j decode thay
+
+    def _course(self, cid):
+        course = self._courses.get(cid)
+        if course is None:
+            off = self._course_off
+            course = self._courses[cid] = str(self._heap[off[cid]:off[cid + 1]], "utf-8")
+        return course
+
+    def _student(self, i):
+        off = self._name_off
+        return Student(self.rolls[i], str(self._heap[off[i]:off[i + 1]], "utf-8"),
+                       self._course(self._course_id[i]))
+
+    def _find(self, roll_no):
+        i = bisect_left(self.rolls, roll_no)
+        if i < len(self.rolls) and self.rolls[i] == roll_no:
+            return i
+        return -1
+
+    def get(self, roll_no, default=None):
+        i = self._find(roll_no)
+        return self._student(i) if i >= 0 else default
+
+    def __getitem__(self, roll_no):
+        i = self._find(roll_no)
+        if i < 0:
+            raise KeyError(roll_no)
+        return self._student(i)
+
+    def __contains__(self, roll_no):
+        return self._find(roll_no) >= 0
+
+    def __len__(self):
+        return len(self.rolls)
+
+    def __iter__(self):
+        """Badha students roll_no na kram ma (ek-ek decode thay)"""
+        for i in range(len(self.rolls)):
+            yield self._student(i)
+
+    def range(self, lo, hi):
+        """lo <= roll_no < hi vala students"""
+        for i in range(bisect_left(self.rolls, lo), bisect_left(self.rolls, hi)):
+            yield self._student(i)
+
+    def close(self):
+        # memoryview chhuta karya vagar mmap band na thay
+        for view in (self.rolls, self._name_off, self._course_id, self._course_off, self._heap, self._view):
+            view.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    # python snapshot.py students.snap 17 42  -> e roll numbers na students
+    path = sys.argv[1] if len(sys.argv) > 1 else SNAPSHOT_FILE
+    with Snapshot(path) as snap:
+        print(f"{path}: {len(snap)} students")
+        for roll in sys.argv[2:]:
+            s = snap.get(int(roll))
+            print("   " + (str(s) if s else f"{roll}: not found"))
@@ -0,0 +1,322 @@
+# FILE: storage.py
+import json
+import os
+import threading
+from contextlib import contextmanager
+from model import Student, StudentColumns
+
+# File locking: Linux/Mac par fcntl, Windows par msvcrt
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    import msvcrt
+    HAS_FCNTL = False
+
+LOG_FILE = "students.log"
+
+BEGIN = json.dumps({"op": "begin"}) + "\n"
+COMMIT = json.dumps({"op": "commit"}) + "\n"
+
+class StorageError(Exception):
+    """Log file kharab (corrupt) hoy tyare - khali roster thi chalu nathi karvanu"""
+
+
+def _fsync_dir(path):
+    # Rename durable banavva directory pan fsync karvi pade (Windows ma nathi thatu)
+    if os.name == "nt":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path, write, mode="w"):
+    """Temp file ma lakhi, fsync kari, rename kare che - adhuri file kyarey na dekhay"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, mode) as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _fsync_dir(path)
+
+
+class FileLock:
+    """Process vachhe exclusive lock (ek j process ek samaye log ma lakhe).
+
+    Re-entrant che: same process ma nested `with lock:` block chale.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fh = None
+        self._depth = 0
+        self._thread_lock = threading.RLock()
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            self._fh = open(self.path, "a+")
+            if HAS_FCNTL:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+            else:
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_LOCK, 1)
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth == 0:
+            if HAS_FCNTL:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+            else:
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+            self._fh.close()
+            self._fh = None
+        self._thread_lock.release()
+
+
+class RecordLog:
+    """Append-only record log + roll_no par in-memory hash index.
+
+    Darek add/delete ek JSON line tarike file na end ma lakhay che, etle
+    ek change ni cost O(1) che. Delete thayela records log ma garbage tarike
+    pada rahe che; garbage live records karta vadhi jay tyare compact() log
+    ne fari thi lakhe che (amortized O(1)).
+
+    transaction() ma thayela badha changes begin/commit markers vachhe ek j
+    write + fsync thi lakhay che. Crash pachi adhuri line ke commit vagar ni
+    transaction load() vakhte kadhi nakhay che.
+
+    Ghana process ek j log vapri shake: darek transaction FileLock pakde,
+    bija process e lakhelo navo bhag vanchi le (sync), pachi j lakhe. Roll
+    number mate last_roll monotonic sequence che - compaction pachi pan
+    "seq" record thi jalvay che, etle delete thayelo number fari nathi malto.
+    """
+
+    def __init__(self, path=LOG_FILE, min_compact=1000, compact_mode=False):
+        self.path = path
+        self.min_compact = min_compact
+        self.compact_mode = compact_mode
+        self.index = self._new_index()   # roll_no -> Student
+        self.last_roll = 0  # atyar sudhi aapelo sauthi moto roll number
+        self.dead = 0     # log ma rahela nakama (overwritten/deleted) records
+        self.discarded_bytes = 0  # recovery vakhte kadhi nakhelo adhuro tail
+        self.lock = FileLock(path + ".lock")
+        self.on_change = None  # callback(old, new) - Database na indexes mate
+        self.on_reload = None  # callback() - aakho index navo banyo tyare
+        self._fh = None
+        self._offset = 0   # log ma ketla bytes sudhi vanchi/lakhi lidhu
+        self._ino = None
+        self._batch = None  # transaction chalu hoy tyare pending lines
+        self._undo = None
+
+    def _new_index(self):
+        # compact_mode ma dict ni jagya e columnar store vapray che
+        return StudentColumns() if self.compact_mode else {}
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        """Log ne sharuat thi replay kari ne index banave che"""
+        with self.lock:
+            self._reset()
+            if self.exists():
+                self._replay(notify=False)
+
+    def _reset(self):
+        self.close()
+        self.index = self._new_index()
+        self.last_roll = 0
+        self.dead = 0
+        self.discarded_bytes = 0
+        self._offset = 0
+        self._ino = None
+
+    def _replay(self, notify):
+        """self._offset thi aagal na records apply kare (lock pakdelo hovo joie)"""
+        offset = good = self._offset
+        pending = None
+        with open(self.path, "rb") as f:
+            self._ino = os.fstat(f.fileno()).st_ino
+            f.seek(offset)
+            for line in f:
+                offset += len(line)
+                if not line.endswith(b"\n"):
+                    break  # crash vakhte adhuri lakhayeli chhelli line
+                try:
+                    rec = json.loads(line) if line.strip() else None
+                except ValueError:
+                    if f.read(1):
+                        raise StorageError(f"{self.path}: corrupt record at byte {offset - len(line)}")
+                    break
+                if rec is None:
+                    pass
+                elif rec["op"] == "begin":
+                    pending = []
+                elif rec["op"] == "commit":
+                    for r in pending or ():
+                        self._apply(r, notify)
+                    pending = None
+                elif pending is not None:
+                    pending.append(rec)
+                else:
+                    self._apply(rec, notify)
+                if pending is None:
+                    good = offset
+            size = f.seek(0, os.SEEK_END)
+
+        self._offset = good
+        if good < size:
+            # Commit na thayeli transaction / adhuri line kadhi nakho
+            self.discarded_bytes += size - good
+            with open(self.path, "r+b") as f:
+                f.truncate(good)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def sync(self):
+        """Bija process e lakhela navo records vanchi le"""
+        with self.lock:
+            self._sync()
+
+    def _sync(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if self._ino is not None and (st.st_ino != self._ino or st.st_size < self._offset):
+            # Bija process e compact kari ne file badli nakhi - aakhi fari vancho
+            self._reset()
+            self._replay(notify=False)
+            if self.on_reload:
+                self.on_reload()
+        elif st.st_size != self._offset or self._ino is None:
+            self._replay(notify=True)
+
+    def _apply(self, rec, notify=True):
+        if rec["op"] == "seq":
+            self.last_roll = max(self.last_roll, rec["last"])
+            return
+
+        roll_no = rec["roll_no"]
+        old = self.index.get(roll_no)
+        if self._undo is not None:
+            self._undo.append((roll_no, old))
+        new = None
+        if rec["op"] == "add":
+            if old is not None:
+                self.dead += 1
+            new = Student(roll_no, rec["name"], rec["course"])
+            self.index[roll_no] = new
+            if roll_no > self.last_roll:
+                self.last_roll = roll_no
+        elif rec["op"] == "del":
+            if self.index.pop(roll_no, None) is not None:
+                self.dead += 1
+            self.dead += 1
+        if notify and self.on_change:
+            self.on_change(old, new)
+
+    def _append(self, data):
+        if self._fh is None:
+            self._fh = open(self.path, "ab")
+            self._ino = os.fstat(self._fh.fileno()).st_ino
+        data = data.encode("utf-8")
+        self._fh.write(data)
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._offset += len(data)
+
+    def _write(self, rec):
+        self._batch.append(json.dumps(rec) + "\n")
+
+    @contextmanager
+    def transaction(self):
+        """Block na badha changes ek durable commit ma; exception aave to rollback"""
+        if self._batch is not None:
+            yield  # nested transaction: bahar vali j commit karshe
+            return
+
+        with self.lock:
+            self._sync()
+            self._batch, self._undo = [], []
+            dead_before, last_before = self.dead, self.last_roll
+            try:
+                yield
+            except BaseException:
+                undo = self._undo
+                self._batch = self._undo = None
+                for roll_no, previous in reversed(undo):
+                    current = self.index.get(roll_no)
+                    if previous is None:
+                        self.index.pop(roll_no, None)
+                    else:
+                        self.index[roll_no] = previous
+                    if self.on_change:
+                        self.on_change(current, previous)
+                self.dead, self.last_roll = dead_before, last_before
+                raise
+
+            batch = self._batch
+            self._batch = self._undo = None
+            if len(batch) == 1:
+                self._append(batch[0])  # ek j line pote j atomic che
+            elif batch:
+                self._append(BEGIN + "".join(batch) + COMMIT)
+            self._maybe_compact()
+
+    def in_transaction(self):
+        return self._batch is not None
+
+    def next_roll(self):
+        """Navo roll number - transaction ni andar j bolavvo (lock jaruri che)"""
+        return self.last_roll + 1
+
+    def add(self, student):
+        with self.transaction():
+            rec = {"op": "add", **student.to_dict()}
+            self._write(rec)
+            self._apply(rec)
+
+    def delete(self, roll_no):
+        with self.transaction():
+            if roll_no not in self.index:
+                return False
+            rec = {"op": "del", "roll_no": roll_no}
+            self._write(rec)
+            self._apply(rec)
+            return True
+
+    def _maybe_compact(self):
+        # Transaction vakhte compact na thay - index ma haju commit na thayela changes che
+        if self._batch is None and self.dead >= self.min_compact and self.dead > len(self.index):
+            self.compact()
+
+    def compact(self):
+        """Fakt live records navi file ma lakhi ne juni log replace kare che"""
+        with self.lock:
+            self._sync()
+            self.close()
+
+            def write(f):
+                # Sequence pehla lakho, etle delete thayela roll numbers fari na vapray
+                f.write(json.dumps({"op": "seq", "last": self.last_roll}) + "\n")
+                for s in self.index.values():
+                    f.write(json.dumps({"op": "add", **s.to_dict()}) + "\n")
+
+            atomic_write(self.path, write)
+            st = os.stat(self.path)
+            self._ino, self._offset = st.st_ino, st.st_size
+            self.dead = 0
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
@@ -0,0 +1,42 @@
+# FILE: streaming.py
+import json
+import os
+import sys
+
+# Chunk reader repo root na jsonstream.py ma che (StudyAlert.py pan e j vapre che)
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+from jsonstream import CHUNK_SIZE, ChunkReader  # noqa: E402
+
+
+def iter_json_array(f, chunk_size=CHUNK_SIZE):
+    """Juna '[{...}, {...}]' format mathi ek-ek record yield kare che"""
+    reader = ChunkReader(f, chunk_size)
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        ch = reader.peek()
+        if ch == "]":
+            return
+        reader.expect(",")
+
+
+def iter_json_lines(f):
+    """JSON-lines format (ek line = ek record)"""
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_records(path, chunk_size=CHUNK_SIZE):
+    """File no format jate olkhi ne (array ke JSON-lines) records stream kare che"""
+    with open(path, "r") as f:
+        first = ChunkReader(f, chunk_size).peek()
+        f.seek(0)
+        if first == "[":
+            yield from iter_json_array(f, chunk_size)
+        else:
+            yield from iter_json_lines(f)
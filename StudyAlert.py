@@ -1,21 +1,36 @@
-
+import atexit
+import bisect
+import heapq
 import json
 import time
 import os
 import threading
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional
 
-# Attempt to import plyer for desktop notifications
-try:
-    from plyer import notification
-    HAS_NOTIFICATIONS = True
-except ImportError:
-    HAS_NOTIFICATIONS = False
+import instrument
+from jsonstream import ChunkReader
+
+# plyer (desktop notifications) is imported on the first notification, not
+# at startup; None until then
+HAS_NOTIFICATIONS = None
+notification = None
+
+def load_notifier():
+    global HAS_NOTIFICATIONS, notification
+    if HAS_NOTIFICATIONS is None:
+        try:
+            from plyer import notification
+            HAS_NOTIFICATIONS = True
+        except ImportError:
+            HAS_NOTIFICATIONS = False
+    return notification
 
 # --- CONFIGURATION & CONSTANTS ---
 DATA_FILE = "study_data.json"
+LOG_FILE = "study_logs.jsonl"  # One session log per line, append-only
+SAVE_DEBOUNCE = 2.0  # Seconds of quiet before profile/alert changes are written
 STRICT_MESSAGES = [
     "Discipline beats talent when talent doesn't work hard.",
     "GPSC doesn't crack itself. Get back to work.",
@@ -28,6 +43,16 @@ PRAISE_MESSAGES = [
     "Great work today. One step closer to your goal!",
     "The grind is hard, but the result is worth it. Keep going."
 ]
+# StudyAlert.repeat values; anything else may list days, e.g. "Mon,Wed,Fri"
+REPEAT_DAYS = {
+    "Daily": range(7),
+    "Weekdays": range(5),
+    "Weekends": (5, 6),
+}
+WEEKDAY_NAMES = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+MAX_SLEEP = 60.0  # Re-check the heap at least this often (clock changes, suspend)
+DAY_MINUTES = 24 * 60
+WEEK_MINUTES = 7 * DAY_MINUTES
 
 # --- DATA MODELS ---
 
@@ -39,6 +64,7 @@ class StudyAlert:
     duration_mins: int
     repeat: str = "Daily"
     status: str = "Pending" # Pending, Completed, Skipped
+    status_date: str = ""  # YYYY-MM-DD the status was set; older ones reset on load
 
 @dataclass
 class UserProfile:
@@ -50,24 +76,304 @@ class UserProfile:
 # --- CORE MODULES ---
 
 class StorageManager:
-    """Handles persistence for Profile, Schedules, and Analytics."""
-    @staticmethod
-    def save_data(profile: UserProfile, alerts: List[StudyAlert], logs: List[Dict]):
-        data = {
-            "profile": asdict(profile),
-            "alerts": [asdict(a) for a in alerts],
-            "logs": logs
-        }
-        with open(DATA_FILE, "w") as f:
-            json.dump(data, f, indent=4)
+    """Handles persistence for Profile, Schedules, and Analytics.
 
-    @staticmethod
-    def load_data():
-        if not os.path.exists(DATA_FILE):
+    DATA_FILE holds the profile and alerts; the session history is appended
+    to LOG_FILE. Files written by older versions keep the logs inside
+    DATA_FILE and are migrated on first load. Pass other paths to keep
+    several profiles apart.
+    """
+    def __init__(self, data_file: str = DATA_FILE, log_file: str = LOG_FILE):
+        self.data_file = data_file
+        self.log_file = log_file
+
+    @instrument.timed("StorageManager.save_snapshot")
+    def save_snapshot(self, profile: Dict, alerts: List[Dict]):
+        """Atomically replaces the data file with the profile and alerts (no logs)."""
+        tmp = self.data_file + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"profile": profile, "alerts": alerts}, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.data_file)
+
+    @instrument.timed("StorageManager.append_logs")
+    def append_logs(self, entries: List[Dict]):
+        with open(self.log_file, "a") as f:
+            f.write("".join(json.dumps(e) + "\n" for e in entries))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def write_logs(self, entries: List[Dict]):
+        """Atomically replaces the log file (used when migrating an old data file)."""
+        tmp = self.log_file + ".tmp"
+        with open(tmp, "w") as f:
+            f.write("".join(json.dumps(e) + "\n" for e in entries))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.log_file)
+
+    def iter_logs(self):
+        if not os.path.exists(self.log_file):
+            return
+        with open(self.log_file, "r") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def repair_log_tail(self):
+        """Drops a half-written last line left by a crash mid-append."""
+        if not os.path.exists(self.log_file):
+            return
+        with open(self.log_file, "rb+") as f:
+            # Only the tail is read, so a long history doesn't delay startup
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            pos = end
+            while pos > 0:
+                step = min(pos, 1 << 16)
+                pos -= step
+                f.seek(pos)
+                cut = f.read(step).rfind(b"\n")
+                if cut >= 0:
+                    f.truncate(pos + cut + 1)
+                    return
+            f.truncate(0)
+
+    def load_data(self):
+        if not os.path.exists(self.data_file):
             return None
-        with open(DATA_FILE, "r") as f:
+        with open(self.data_file, "r") as f:
             return json.load(f)
 
+    def iter_load(self, chunk_size: int = 1 << 16):
+        """Streams the data file without parsing it all at once.
+
+        Yields ("profile", dict) and ("alerts", list) as soon as they are read,
+        then ("log", entry) for each entry of the (possibly huge) logs array.
+        Returns None if there is no saved data.
+        """
+        if not os.path.exists(self.data_file):
+            return None
+        return self._stream_sections(self.data_file, chunk_size)
+
+    @staticmethod
+    def _stream_sections(path: str, chunk_size: int):
+        with open(path, "r") as f:
+            reader = ChunkReader(f, chunk_size)
+            reader.expect("{")
+            if reader.peek() == "}":
+                return
+            while True:
+                key = reader.value()
+                reader.expect(":")
+                if key == "logs":
+                    reader.expect("[")
+                    if reader.peek() != "]":
+                        while True:
+                            yield "log", reader.value()
+                            if reader.peek() == "]":
+                                break
+                            reader.expect(",")
+                    reader.expect("]")
+                else:
+                    yield key, reader.value()
+                if reader.peek() == "}":
+                    return
+                reader.expect(",")
+
+
+class WriteBehindStore:
+    """Background writer in front of StorageManager.
+
+    Session logs are appended to LOG_FILE as soon as the writer thread wakes.
+    Profile/alert changes are coalesced: only the latest snapshot is written,
+    once no new change has arrived for `debounce` seconds. Nothing is written
+    before `ready` is set (the history is still loading), and nothing at all
+    after hold() (writing would lose history that failed to load). flush()
+    writes everything pending right away; close() runs at exit.
+    """
+    def __init__(self, storage: Optional[StorageManager] = None, debounce: float = SAVE_DEBOUNCE,
+                 ready: Optional[threading.Event] = None):
+        self.storage = storage or StorageManager()
+        self.debounce = debounce
+        self.ready = ready
+        self.error: Optional[Exception] = None
+        self._held = False
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._logs: List[Dict] = []
+        self._snapshot = None
+        self._changed_at = 0.0
+        self._closed = False
+        self.storage.repair_log_tail()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def save(self, profile: UserProfile, alerts: List[StudyAlert]):
+        # Copied now, so later edits on the UI thread can't race the writer
+        snapshot = (asdict(profile), [asdict(a) for a in alerts])
+        with self._cond:
+            if self._snapshot is not None:
+                instrument.count("WriteBehindStore.snapshots_coalesced")
+            self._snapshot = snapshot
+            self._changed_at = time.monotonic()
+            self._cond.notify()
+
+    def append_log(self, entry: Dict):
+        with self._cond:
+            self._logs.append(dict(entry))
+            self._cond.notify()
+
+    def hold(self, error: Exception):
+        """Stops all writes for this run; pending changes stay in memory."""
+        with self._cond:
+            self.error = error
+            self._held = True
+
+    def _write_pending(self, force: bool):
+        with self._io_lock:
+            with self._cond:
+                if self._held:
+                    return
+                logs, self._logs = self._logs, []
+                snapshot = None
+                if self._snapshot is not None and (force or time.monotonic() - self._changed_at >= self.debounce):
+                    snapshot, self._snapshot = self._snapshot, None
+            try:
+                if logs:
+                    self.storage.append_logs(logs)
+                if snapshot is not None:
+                    self.storage.save_snapshot(*snapshot)
+                self.error = None
+            except OSError as e:
+                # Put the work back; the next wake-up (or flush) retries it
+                self.error = e
+                with self._cond:
+                    self._logs[:0] = logs
+                    if snapshot is not None and self._snapshot is None:
+                        self._snapshot = snapshot
+                raise
+
+    def _run(self):
+        if self.ready is not None:
+            self.ready.wait()
+        while True:
+            with self._cond:
+                while not self._closed and (self._held or (not self._logs and self._snapshot is None)):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                if not self._logs:
+                    # Only a snapshot waiting: restart the quiet period on every change
+                    delay = self._changed_at + self.debounce - time.monotonic()
+                    if delay > 0:
+                        self._cond.wait(delay)
+                        continue
+            try:
+                self._write_pending(force=False)
+            except OSError:
+                time.sleep(self.debounce)
+
+    def flush(self):
+        """Writes all pending logs and the latest snapshot now."""
+        if self.ready is not None:
+            self.ready.wait()
+        self._write_pending(force=True)
+
+    def close(self):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        atexit.unregister(self.close)
+        self.flush()
+        self._thread.join()
+
+class SessionRollup:
+    """Running totals of the session history, by day and by subject.
+
+    add() is O(1), so reports read a handful of counters instead of scanning
+    every log ever written. Each bucket is [minutes, completed, skipped].
+    Runs of active days (a completed session each) are kept by both ends as
+    day ordinals, so a new active day joins its neighbours in O(1).
+    """
+    def __init__(self):
+        self.by_day: Dict[str, List[int]] = {}
+        self.by_subject: Dict[str, List[int]] = {}
+        self.completed = 0
+        self.skipped = 0
+        self.longest_streak = 0
+        self._run_end: Dict[int, int] = {}    # first day of a run -> last day
+        self._run_start: Dict[int, int] = {}  # last day of a run -> first day
+
+    @staticmethod
+    def _bump(bucket: List[int], entry: Dict):
+        bucket[0] += entry["minutes"]
+        if entry["status"] == "Completed":
+            bucket[1] += 1
+        elif entry["status"] == "Skipped":
+            bucket[2] += 1
+
+    def add(self, entry: Dict):
+        day = self.by_day.setdefault(entry["date"], [0, 0, 0])
+        first_completion = entry["status"] == "Completed" and day[1] == 0
+        self._bump(day, entry)
+        self._bump(self.by_subject.setdefault(entry["subject"], [0, 0, 0]), entry)
+        if entry["status"] == "Completed":
+            self.completed += 1
+        elif entry["status"] == "Skipped":
+            self.skipped += 1
+        if first_completion:
+            # A newly active day can join the runs on either side of it
+            d = date.fromisoformat(entry["date"]).toordinal()
+            start = self._run_start.pop(d - 1, d)
+            end = self._run_end.pop(d + 1, d)
+            self._run_end[start] = end
+            self._run_start[end] = start
+            self.longest_streak = max(self.longest_streak, end - start + 1)
+
+    def _active(self, d: date) -> bool:
+        bucket = self.by_day.get(d.isoformat())
+        return bucket is not None and bucket[1] > 0
+
+    def _run_from(self, d: date, step: int) -> int:
+        n = 0
+        while self._active(d):
+            n += 1
+            d += timedelta(days=step)
+        return n
+
+    def day(self, d: date) -> List[int]:
+        return self.by_day.get(d.isoformat(), [0, 0, 0])
+
+    def window(self, end: date, days: int) -> List[int]:
+        """Totals for the `days` days ending on `end` (inclusive)."""
+        total = [0, 0, 0]
+        for i in range(days):
+            bucket = self.by_day.get((end - timedelta(days=i)).isoformat())
+            if bucket:
+                total = [a + b for a, b in zip(total, bucket)]
+        return total
+
+    def current_streak(self, today: date) -> int:
+        # A streak survives until the end of today even if today has no session yet
+        if not self._active(today):
+            today -= timedelta(days=1)
+        start = self._run_start.get(today.toordinal())
+        if start is not None:
+            return today.toordinal() - start + 1
+        return self._run_from(today, -1)  # Days after `today` are active too
+
+    def subjects(self):
+        return sorted(self.by_subject.items(), key=lambda kv: kv[1][0], reverse=True)
+
 class MentorEngine:
     """Rule-based logic for motivation and discipline enforcement."""
     @staticmethod
@@ -82,7 +388,7 @@ class MentorEngine:
     @staticmethod
     def send_notification(title, message, urgent=False):
         print(f"\n[{'!!!' if urgent else 'INFO'}] {title}: {message}")
-        if HAS_NOTIFICATIONS:
+        if load_notifier() is not None:
             notification.notify(
                 title=title,
                 message=message,
@@ -91,44 +397,406 @@ class MentorEngine:
             )
 
 class StudyScheduler:
-    """Background engine that monitors time and triggers alerts."""
-    def __init__(self, app_instance):
+    """Background engine that monitors time and triggers alerts.
+
+    Keeps a min-heap of (next fire timestamp, alert) and sleeps on a
+    condition variable until the earliest one is due, so the cost per wake
+    is O(log n) however many alerts there are. add()/remove()/reschedule()
+    wake the thread. Removal marks the heap entry dead and it is skipped
+    when it reaches the top. A midnight entry resets repeating alerts back
+    to "Pending" for the new day; rebuild() does the same for statuses saved
+    on an earlier day, so a restart does not keep them silenced.
+    """
+    _MIDNIGHT = object()
+
+    def __init__(self, app_instance, clock=time.time):
         self.app = app_instance
+        self.clock = clock
         self.running = True
+        self._cond = threading.Condition()
+        self._heap = []
+        self._entries: Dict[int, list] = {}  # id(alert) -> live heap entry
+        self._seq = 0
+        self.fired = 0
 
-    def run(self):
-        while self.running:
-            now = datetime.now().strftime("%H:%M")
+    # --- TIME CALCULATION ---
+
+    @staticmethod
+    def repeat_days(repeat: str):
+        if repeat in REPEAT_DAYS:
+            return REPEAT_DAYS[repeat]
+        if repeat == "Once":
+            return range(7)
+        days = [WEEKDAY_NAMES.index(d.strip().lower()[:3]) for d in repeat.split(",")
+                if d.strip().lower()[:3] in WEEKDAY_NAMES]
+        return days or REPEAT_DAYS["Daily"]
+
+    def next_fire(self, alert: StudyAlert, after: float) -> Optional[float]:
+        """Timestamp of the alert's first occurrence strictly after `after`."""
+        hour, minute = divmod(AlertIntervals.minute_of_day(alert.start_time), 60)
+        days = self.repeat_days(alert.repeat)
+        day = datetime.fromtimestamp(after).date()
+        for offset in range(8):
+            d = day + timedelta(days=offset)
+            if d.weekday() in days:
+                ts = datetime(d.year, d.month, d.day, hour, minute).timestamp()
+                if ts > after:
+                    return ts
+        return None
+
+    @staticmethod
+    def _day(ts: float) -> str:
+        return datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+
+    def refresh_status(self, alert: StudyAlert, now: float) -> bool:
+        """Resets a repeating alert whose status is from an earlier day; True if it changed."""
+        if alert.repeat != "Once" and alert.status != "Pending" and alert.status_date < self._day(now):
+            alert.status = "Pending"
+            return True
+        return False
+
+    def mark(self, alert: StudyAlert, status: str):
+        alert.status = status
+        alert.status_date = self._day(self.clock())
+
+    def _next_midnight(self, now: float) -> float:
+        tomorrow = datetime.fromtimestamp(now).date() + timedelta(days=1)
+        return datetime(tomorrow.year, tomorrow.month, tomorrow.day).timestamp()
+
+    # --- HEAP MAINTENANCE ---
+
+    def _push(self, when, item):
+        self._seq += 1
+        entry = [when, self._seq, item]
+        heapq.heappush(self._heap, entry)
+        return entry
+
+    def _arm(self, alert: StudyAlert, after: float):
+        try:
+            when = self.next_fire(alert, after)
+        except ValueError:
+            return  # Malformed start_time from an old file (see AlertIntervals.invalid)
+        if when is not None:
+            self._entries[id(alert)] = self._push(when, alert)
+
+    def _disarm(self, alert: StudyAlert):
+        entry = self._entries.pop(id(alert), None)
+        if entry is not None:
+            entry[2] = None
+
+    def rebuild(self):
+        with self._cond:
+            now = self.clock()
+            self._heap = []
+            self._entries = {}
+            stale = False
             for alert in self.app.alerts:
-                if alert.start_time == now and alert.status == "Pending":
-                    self.trigger_alert(alert)
-            time.sleep(30) # Check every 30 seconds
+                stale |= self.refresh_status(alert, now)
+                self._arm(alert, now)
+            self._push(self._next_midnight(now), self._MIDNIGHT)
+            self._changed()
+        if stale:
+            self.app.save_state()
+
+    def add(self, alert: StudyAlert):
+        with self._cond:
+            self._arm(alert, self.clock())
+            self._changed()
+
+    def remove(self, alert: StudyAlert):
+        with self._cond:
+            self._disarm(alert)
+            self._changed()
+
+    def reschedule(self, alert: StudyAlert):
+        with self._cond:
+            self._disarm(alert)
+            self._arm(alert, self.clock())
+            self._changed()
+
+    def _changed(self):
+        # Caller holds _cond; the run loop re-reads the heap top
+        self._cond.notify()
+
+    def _drop_dead(self):
+        while self._heap and self._heap[0][2] is None:
+            heapq.heappop(self._heap)
+
+    def next_due(self) -> Optional[float]:
+        with self._cond:
+            self._drop_dead()
+            if not self._heap or self._heap[0][2] is not self._MIDNIGHT:
+                return self._heap[0][0] if self._heap else None
+            # Midnight is on top: set it aside to see the alert under it
+            midnight = heapq.heappop(self._heap)
+            self._drop_dead()
+            due = self._heap[0][0] if self._heap else None
+            heapq.heappush(self._heap, midnight)
+            return due
+
+    # --- RUN LOOP ---
+
+    def _pop_ready(self):
+        """Caller holds _cond. Pops and re-arms the top entry if it is due.
+
+        Returns (timestamp, item) for a due entry, otherwise (seconds until
+        the next one or None if the heap is empty, None).
+        """
+        self._drop_dead()
+        if not self._heap:
+            return None, None
+        delay = self._heap[0][0] - self.clock()
+        if delay > 0:
+            return delay, None
+        when, _, item = heapq.heappop(self._heap)
+        if item is self._MIDNIGHT:
+            self._push(self._next_midnight(when), self._MIDNIGHT)
+        else:
+            self._entries.pop(id(item), None)
+            if item.repeat != "Once":
+                self._arm(item, when)
+        return when, item
+
+    def _dispatch(self, when: float, item):
+        if item is self._MIDNIGHT:
+            self.rearm_day()
+        # Woken late (laptop asleep)? Only alert while the session would still be running
+        elif item.status == "Pending" and self.clock() - when <= item.duration_mins * 60:
+            self.trigger_alert(item)
+
+    def run(self):
+        self.rebuild()
+        while True:
+            with self._cond:
+                if not self.running:
+                    return
+                when, item = self._pop_ready()
+                if item is None:
+                    self._cond.wait(MAX_SLEEP if when is None else min(when, MAX_SLEEP))
+                    continue
+            self._dispatch(when, item)
+
+    def rearm_day(self):
+        for alert in self.app.alerts:
+            if alert.repeat != "Once" and alert.status != "Pending":
+                alert.status = "Pending"
+        self.app.save_state()
+
+    def stop(self):
+        with self._cond:
+            self.running = False
+            self._cond.notify()
 
     def trigger_alert(self, alert: StudyAlert):
+        self.fired += 1
         MentorEngine.send_notification(
             "STUDY SESSION STARTING", 
             f"Subject: {alert.subject}\nTopic: {alert.topic}\nDuration: {alert.duration_mins}m",
             urgent=True
         )
         # Mark as notified so it doesn't trigger multiple times in the same minute
-        alert.status = "Notified" 
+        self.mark(alert, "Notified")
+
+class AlertIntervals:
+    """Sorted index of the minutes of the week taken by alerts.
+
+    An alert covers [start, start + duration) on each day its `repeat`
+    selects, as minutes from Monday 00:00; a session running past midnight
+    spills into the next day (and Sunday night into Monday). Segments are
+    kept sorted by start with bisect. Accepted segments never overlap, so
+    their ends are sorted too and a conflict check only looks at the one
+    segment starting just before the candidate's end. Overlaps loaded from
+    old files (or a session longer than a day) clear `disjoint`, and the
+    check then walks back over `longest` instead.
+    """
+    def __init__(self, alerts: List[StudyAlert] = ()):
+        self.starts: List[int] = []
+        self.segments: List[tuple] = []  # (start, end, id(alert)), same order as starts
+        self.longest = 0
+        self.disjoint = True
+        self.invalid: List[StudyAlert] = []  # Unreadable start_time: not indexed, never fires
+        for alert in alerts:
+            # Files saved before this check existed may already overlap, or
+            # hold a start time that was never validated
+            try:
+                self.add(alert, force=True)
+            except ValueError:
+                self.invalid.append(alert)
+
+    @staticmethod
+    def minute_of_day(hhmm: str) -> int:
+        try:
+            hour, minute = map(int, hhmm.split(":"))
+        except (AttributeError, ValueError):
+            hour = minute = -1
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError(f"not a HH:MM time: {hhmm!r}")
+        return hour * 60 + minute
+
+    @staticmethod
+    def _pieces(start: int, duration: int):
+        # [start, start + duration) in week minutes, split where the week wraps
+        end = start + max(1, min(duration, WEEK_MINUTES))
+        if end <= WEEK_MINUTES:
+            return [(start, end)]
+        return [(start, WEEK_MINUTES), (0, end - WEEK_MINUTES)]
+
+    def _week_pieces(self, start_minute: int, duration: int, repeat: str):
+        for day in StudyScheduler.repeat_days(repeat):
+            yield from self._pieces(day * DAY_MINUTES + start_minute, duration)
+
+    def _overlapping(self, s: int, e: int):
+        """A stored segment overlapping [s, e), or None."""
+        # Only segments starting before e can overlap
+        j = bisect.bisect_left(self.starts, e) - 1
+        if self.disjoint:
+            # ...and of those the last one ends latest
+            if j >= 0 and self.segments[j][1] > s:
+                return self.segments[j]
+            return None
+        # None longer than `longest` can reach s from further back
+        while j >= 0 and self.starts[j] > s - self.longest:
+            if self.segments[j][1] > s:
+                return self.segments[j]
+            j -= 1
+        return None
+
+    def conflict(self, alert: StudyAlert) -> Optional[int]:
+        """id() of an alert that overlaps `alert`, or None."""
+        start = self.minute_of_day(alert.start_time)
+        for s, e in self._week_pieces(start, alert.duration_mins, alert.repeat):
+            hit = self._overlapping(s, e)
+            if hit is not None:
+                return hit[2]
+        return None
+
+    def add(self, alert: StudyAlert, force: bool = False) -> bool:
+        if not force and self.conflict(alert) is not None:
+            return False
+        start = self.minute_of_day(alert.start_time)
+        for s, e in self._week_pieces(start, alert.duration_mins, alert.repeat):
+            if self.disjoint and self._overlapping(s, e) is not None:
+                self.disjoint = False
+            i = bisect.bisect_right(self.starts, s)
+            self.starts.insert(i, s)
+            self.segments.insert(i, (s, e, id(alert)))
+            self.longest = max(self.longest, e - s)
+        return True
+
+    def remove(self, alert: StudyAlert):
+        if any(a is alert for a in self.invalid):
+            self.invalid = [a for a in self.invalid if a is not alert]
+            return
+        start = self.minute_of_day(alert.start_time)
+        for s, _ in self._week_pieces(start, alert.duration_mins, alert.repeat):
+            i = bisect.bisect_left(self.starts, s)
+            while i < len(self.starts) and self.starts[i] == s:
+                if self.segments[i][2] == id(alert):
+                    del self.starts[i]
+                    del self.segments[i]
+                    break
+                i += 1
+
+    def next_free(self, duration: int, after: str = "00:00", repeat: str = "Daily") -> Optional[str]:
+        """Earliest HH:MM at or after `after` where such an alert would fit, or None.
+
+        Wraps to 00:00 after midnight; a blocker running into the next day
+        does not hide the early hours of the asked weekday:
+
+        >>> slots = AlertIntervals([StudyAlert("Polity", "Revision", "22:15", 600, "Sat")])
+        >>> slots.next_free(120, "21:48", "Sat")
+        '00:00'
+        >>> slots.next_free(60, "07:00", "Sun")
+        '08:15'
+        """
+        t = self.minute_of_day(after)
+        moved = 0
+        while moved < DAY_MINUTES:
+            # Jump past the furthest blocking segment; every start before it is blocked too.
+            # Not past midnight though: t wraps to 00:00 of the same weekdays, which a
+            # blocker running into the next day says nothing about
+            jump = 0
+            for s, e in self._week_pieces(t, duration, repeat):
+                hit = self._overlapping(s, e)
+                if hit is not None:
+                    jump = max(jump, min((hit[1] - s) % WEEK_MINUTES, DAY_MINUTES - t))
+            if not jump:
+                return f"{t // 60:02d}:{t % 60:02d}"
+            t = (t + jump) % DAY_MINUTES
+            moved += jump
+        return None
 
 class StudyAlertApp:
-    def __init__(self):
+    def __init__(self, storage: Optional[StorageManager] = None, profile: Optional[UserProfile] = None):
+        """`profile` is used instead of the setup wizard when there is no saved data yet."""
+        self.storage = storage or StorageManager()
         self.profile: Optional[UserProfile] = None
         self.alerts: List[StudyAlert] = []
         self.logs: List[Dict] = []
+        self.rollup = SessionRollup()
+        self.slots = AlertIntervals()
         self.scheduler = StudyScheduler(self)
-        self.load_state()
-
-    def load_state(self):
-        data = StorageManager.load_data()
-        if data:
-            self.profile = UserProfile(**data['profile'])
-            self.alerts = [StudyAlert(**a) for a in data['alerts']]
-            self.logs = data['logs']
-        else:
-            self.setup_wizard()
+        self.logs_loaded = threading.Event()
+        self.store = WriteBehindStore(self.storage, ready=self.logs_loaded)
+        self._legacy_logs: List[Dict] = []
+        self._migrating = False
+        self.load_error: Optional[Exception] = None
+        self.load_state(profile)
+
+    def load_state(self, profile: Optional[UserProfile] = None):
+        """Loads profile and alerts up front; the log history streams in the background."""
+        stream = self.storage.iter_load()
+        if stream is None:
+            self.logs_loaded.set()
+            if profile is None:
+                self.setup_wizard()
+            else:
+                self.profile = profile
+                self.save_state()
+            return
+
+        # An existing LOG_FILE is authoritative; logs inside DATA_FILE are
+        # only read from files that predate it
+        self._migrating = not os.path.exists(self.storage.log_file)
+        for key, value in stream:
+            if key == "profile":
+                self.profile = UserProfile(**value)
+            elif key == "alerts":
+                self.alerts = [StudyAlert(**a) for a in value]
+                self.slots = AlertIntervals(self.alerts)
+            elif key == "log":
+                self._legacy_log(value)
+            if self.profile is not None and key == "alerts":
+                break
+        threading.Thread(target=self._drain_logs, args=(stream,), daemon=True).start()
+
+    def _legacy_log(self, entry):
+        if self._migrating:
+            self.logs.append(entry)
+            self.rollup.add(entry)
+            self._legacy_logs.append(entry)
+
+    def _drain_logs(self, stream):
+        try:
+            for key, value in stream:
+                if key == "log":
+                    self._legacy_log(value)
+            if self._legacy_logs:
+                # Move the history out of DATA_FILE once; later saves skip it
+                self.storage.write_logs(self._legacy_logs)
+                self._legacy_logs = []
+                self.store.save(self.profile, self.alerts)
+            else:
+                for entry in self.storage.iter_logs():
+                    self.logs.append(entry)
+                    self.rollup.add(entry)
+        except Exception as e:
+            # A snapshot now would drop the history still in DATA_FILE, and a
+            # new LOG_FILE would hide it on the next start: save nothing
+            self.load_error = e
+            self.store.hold(e)
+        finally:
+            self.logs_loaded.set()
 
     def setup_wizard(self):
         print("=== WELCOME TO STUDY ALERT SYSTEM (DSP MINDSET) ===")
@@ -139,24 +807,81 @@ class StudyAlertApp:
         self.save_state()
 
     def save_state(self):
-        StorageManager.save_data(self.profile, self.alerts, self.logs)
+        # Queued for the writer thread; only profile and alerts are rewritten
+        self.store.save(self.profile, self.alerts)
+
+    def shutdown(self):
+        self.scheduler.stop()
+        self.store.close()
 
     def add_alert(self):
         print("\n--- ADD NEW STUDY ALERT ---")
         sub = input("Subject: ")
         topic = input("Topic: ")
         t_start = input("Start Time (HH:MM 24h): ")
-        dur = int(input("Duration (minutes): "))
-        
-        # Simple overlap check
-        for a in self.alerts:
-            if a.start_time == t_start:
-                print("Error: Conflict with existing alert!")
-                return
-        
-        self.alerts.append(StudyAlert(sub, topic, t_start, dur))
+        try:
+            AlertIntervals.minute_of_day(t_start)
+        except ValueError:
+            print(f"Error: start time must be HH:MM (24h), got {t_start!r}")
+            return
+        try:
+            dur = int(input("Duration (minutes): "))
+        except ValueError:
+            print("Error: duration must be a whole number of minutes.")
+            return
+
+        alert = StudyAlert(sub, topic, t_start, dur)
+        if self.schedule_alert(alert):
+            print("Alert scheduled successfully.")
+        else:
+            print("Error: Conflict with existing alert!")
+            slot = self.slots.next_free(dur, t_start, alert.repeat)
+            if slot:
+                print(f"Next free slot: {slot}")
+
+    def invalid_note(self, alert: StudyAlert) -> str:
+        """Schedule-listing suffix for an alert whose saved start time can't be read."""
+        return " | INVALID TIME, never fires (delete and re-add)" if any(a is alert for a in self.slots.invalid) else ""
+
+    def schedule_alert(self, alert: StudyAlert, save: bool = True) -> bool:
+        """Adds an alert unless its time overlaps an existing one."""
+        if not self.slots.add(alert):
+            return False
+        self.alerts.append(alert)
+        self.scheduler.add(alert)
+        if save:
+            self.save_state()
+        return True
+
+    def delete_alert(self, idx: int) -> StudyAlert:
+        alert = self.alerts.pop(idx)
+        self.slots.remove(alert)
+        self.scheduler.remove(alert)
         self.save_state()
-        print("Alert scheduled successfully.")
+        return alert
+
+    def import_timetable(self, path: str):
+        """Adds alerts from a CSV (subject,topic,start_time,duration_mins[,repeat])
+        or a JSON list of the same fields. Returns (added, rejected rows)."""
+        import csv  # Only needed here, so not paid for at startup
+        with open(path, "r", newline="") as f:
+            rows = json.load(f) if path.lower().endswith(".json") else list(csv.DictReader(f))
+        added, rejected = 0, []
+        for row in rows:
+            try:
+                alert = StudyAlert(row["subject"], row.get("topic", ""), row["start_time"],
+                                   int(row["duration_mins"]), row.get("repeat") or "Daily")
+                ok = self.schedule_alert(alert, save=False)
+            except (KeyError, ValueError) as e:
+                rejected.append((row, f"invalid: {e}"))
+                continue
+            if ok:
+                added += 1
+            else:
+                rejected.append((row, "overlaps an existing alert"))
+        if added:
+            self.save_state()
+        return added, rejected
 
     def start_focus_mode(self, duration_mins, subject="Emergency", topic="Intensive"):
         """Locks the user into a countdown timer."""
@@ -185,15 +910,20 @@ class StudyAlertApp:
             "minutes": minutes,
             "status": status
         }
+        self.logs_loaded.wait()
         self.logs.append(log_entry)
-        self.save_state()
+        self.rollup.add(log_entry)
+        self.store.append_log(log_entry)
 
     def show_analytics(self):
         print("\n--- DISCIPLINE REPORT ---")
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_mins = sum(l['minutes'] for l in self.logs if l['date'] == today)
-        completed = len([l for l in self.logs if l['status'] == "Completed"])
-        skipped = len([l for l in self.logs if l['status'] == "Skipped"])
+        if not self.logs_loaded.is_set():
+            print("(Loading session history...)")
+            self.logs_loaded.wait()
+        rollup = self.rollup
+        today = datetime.now().date()
+        today_mins = rollup.day(today)[0]
+        completed, skipped = rollup.completed, rollup.skipped
         
         total_sessions = completed + skipped
         score = completed / total_sessions if total_sessions > 0 else 1.0
@@ -202,6 +932,17 @@ class StudyAlertApp:
         print(f"Today's Study Time: {today_mins // 60}h {today_mins % 60}m")
         print(f"Total Sessions: {total_sessions} (✅ {completed} / ❌ {skipped})")
         print(f"Consistency Score: {score*100:.1f}%")
+
+        for label, days in (("Week", 7), ("Month", 30)):
+            now = rollup.window(today, days)[0]
+            before = rollup.window(today - timedelta(days=days), days)[0]
+            change = f"{(now - before) / before * 100:+.0f}%" if before else "new"
+            print(f"{label}: {now // 60}h {now % 60}m (prev {before // 60}h {before % 60}m, {change})")
+        print(f"Streak: {rollup.current_streak(today)} day(s) | Best: {rollup.longest_streak} day(s)")
+        if rollup.by_subject:
+            print("By subject:")
+            for subject, (mins, done, missed) in rollup.subjects():
+                print(f"  {subject:<16} {mins // 60:>4}h {mins % 60:02d}m  ✅ {done} / ❌ {missed}")
         print(f"\nMENTOR FEEDBACK: {MentorEngine.get_feedback(score)}")
 
     def run_cli(self):
@@ -210,6 +951,8 @@ class StudyAlertApp:
         thread.start()
 
         while True:
+            if self.load_error is not None:
+                print(f"\n⚠️  Session history failed to load ({self.load_error}); nothing is saved this run.")
             print(f"\n--- {self.profile.name.upper()}'S DASHBOARD ---")
             print("1. View/Add Study Alerts")
             print("2. Manual Focus Mode (Timer)")
@@ -240,19 +983,27 @@ class StudyAlertApp:
     def manage_alerts(self):
         print("\n--- CURRENT SCHEDULE ---")
         for i, a in enumerate(self.alerts):
-            print(f"{i+1}. [{a.start_time}] {a.subject} - {a.topic} ({a.duration_mins}m) | {a.status}")
+            print(f"{i+1}. [{a.start_time}] {a.subject} - {a.topic} ({a.duration_mins}m) | {a.status}"
+                  + self.invalid_note(a))
         
-        print("\na) Add Alert  d) Delete Alert  b) Back")
+        print("\na) Add Alert  d) Delete Alert  i) Import Timetable  b) Back")
         cmd = input(">> ")
         if cmd == "a": self.add_alert()
         elif cmd == "d":
             idx = int(input("Index to delete: ")) - 1
-            self.alerts.pop(idx)
-            self.save_state()
+            self.delete_alert(idx)
+        elif cmd == "i":
+            added, rejected = self.import_timetable(input("CSV/JSON file: "))
+            print(f"Imported {added} alert(s), {len(rejected)} rejected.")
+            for row, reason in rejected[:10]:
+                print(f"  {row.get('start_time')} {row.get('subject')}: {reason}")
 
 if __name__ == "__main__":
+    instrument.configure()  # INSTRUMENT=1 / INSTRUMENT_PROFILE=session.pstats
     app = StudyAlertApp()
     try:
         app.run_cli()
     except KeyboardInterrupt:
         print("\nApp closed. Stay disciplined.")
+    finally:
+        app.shutdown()
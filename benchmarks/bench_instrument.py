@@ -0,0 +1,66 @@
+"""Cost of instrument.timed on GameEngine.process_move: disabled vs enabled.
+
+Replays the same random clicks on one board with instrumentation off, on,
+and with a flag-checking wrapper (what a decorated plain function pays while
+disabled), and prints ns per move.
+
+    python benchmarks/bench_instrument.py --moves 500000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import instrument  # noqa: E402
+from Game import GameEngine  # noqa: E402
+from Level import LevelManager  # noqa: E402
+
+
+def clicks(engine, count, seed):
+    rng = random.Random(seed)
+    size = engine.grid_size
+    return [(rng.randrange(size), rng.randrange(size)) for _ in range(count)]
+
+
+def replay(engine, move, cells):
+    start = time.perf_counter()
+    for r, c in cells:
+        if move(r, c) != "CONTINUE":
+            engine.reset_current_level()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=500000)
+    parser.add_argument("--repeat", type=int, default=5, help="best of N runs per mode")
+    args = parser.parse_args()
+
+    lm = LevelManager()
+    lm.current_level = lm.max_levels
+    engine = GameEngine(lm, rng=random.Random(1))
+    cells = clicks(engine, args.moves, 2)
+    plain = GameEngine.process_move
+    flag_checked = instrument.timed("flag_checked")(plain).wrapper.__get__(engine)
+
+    modes = [("disabled", instrument.disable, lambda: engine.process_move),
+             ("flag-check wrapper", instrument.disable, lambda: flag_checked),
+             ("enabled", instrument.enable, lambda: engine.process_move)]
+    print(f"moves={args.moves:,} best of {args.repeat}")
+    base = None
+    for label, switch, move in modes:
+        switch()
+        best = min(replay(engine, move(), cells) for _ in range(args.repeat))
+        per_call = best / args.moves * 1e9
+        base = base or per_call
+        print(f"  {label:<18} {per_call:7.0f} ns/move  (+{per_call - base:4.0f} ns)")
+    instrument.disable()
+    print(f"  disabled method is the undecorated function: {GameEngine.process_move is plain}")
+    print(f"  recorded: {instrument.snapshot()['timers']['GameEngine.process_move']['count']:,} moves")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Score submissions per second: synchronous inserts vs the write-behind queue.
+
+Each process submits --scores results to one shared SQLite leaderboard; the
+run then checks that every score landed and times a top-K query.
+
+    python benchmarks/bench_leaderboard.py --scores 5000 --workers 4
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from leaderboard import Leaderboard  # noqa: E402
+
+
+def worker(path, worker_id, scores, write_behind):
+    rng = random.Random(worker_id)
+    board = Leaderboard(path, write_behind=write_behind)
+    start = time.perf_counter()
+    for i in range(scores):
+        board.submit(f"p{worker_id}-{i % 50}", rng.randint(1, 10), rng.randint(0, 5000))
+    # Time the game thread actually spent in submit()
+    submit_time = time.perf_counter() - start
+    board.close()
+    return submit_time
+
+
+def run(label, path, workers, scores, write_behind):
+    jobs = [(path, w, scores, write_behind) for w in range(workers)]
+    start = time.perf_counter()
+    if workers == 1:
+        submit_times = [worker(*jobs[0])]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            submit_times = pool.starmap(worker, jobs)
+    elapsed = time.perf_counter() - start
+    total = workers * scores
+    per_call = max(submit_times) / scores * 1e6
+    print(f"  {label:<14} {total / elapsed:10,.0f} scores/s durable   {per_call:8.1f} us per submit()")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scores", type=int, default=5000, help="scores per worker")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"workers={args.workers} scores/worker={args.scores:,}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, write_behind in (("synchronous", False), ("write-behind", True)):
+            path = os.path.join(tmp, f"{label}.db")
+            expected = run(label, path, args.workers, args.scores, write_behind)
+            board = Leaderboard(path, write_behind=False)
+            stored = len(board)
+            start = time.perf_counter()
+            board.top_for_level(5, k=10)
+            query_ms = (time.perf_counter() - start) * 1000
+            board.close()
+            status = "ok" if stored == expected else f"LOST {expected - stored}"
+            print(f"  {'':<14} stored {stored:,}/{expected:,} ({status}), top-10 query {query_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
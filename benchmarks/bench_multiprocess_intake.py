@@ -0,0 +1,61 @@
+"""Multi-process intake benchmark for Student_Project.Database.
+
+Starts --workers processes that all add students to the same roster log at
+once, then checks that no update was lost (every add got a unique roll
+number and survives a fresh reload) and reports adds per second.
+
+    python benchmarks/bench_multiprocess_intake.py --workers 4 --adds 500 --batch 50
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Student_Project"))
+
+from database import Database  # noqa: E402
+
+
+def worker(log_file, worker_id, adds, batch):
+    db = Database(log_file=log_file, json_file=log_file + ".json")
+    rolls = []
+    for start in range(0, adds, batch):
+        with db.transaction():
+            for i in range(start, min(start + batch, adds)):
+                rolls.append(db.add_student(f"w{worker_id}-{i}", f"C{i % 10}").roll_no)
+    db.close()
+    return rolls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--adds", type=int, default=500, help="adds per worker")
+    parser.add_argument("--batch", type=int, default=1, help="adds per transaction")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, "students.log")
+        jobs = [(log_file, w, args.adds, args.batch) for w in range(args.workers)]
+        start = time.perf_counter()
+        with multiprocessing.Pool(args.workers) as pool:
+            results = pool.starmap(worker, jobs)
+        elapsed = time.perf_counter() - start
+
+        rolls = [r for rs in results for r in rs]
+        expected = args.workers * args.adds
+        final = Database(log_file=log_file, json_file=log_file + ".json")
+        print(f"workers={args.workers} adds/worker={args.adds} batch={args.batch}")
+        print(f"  elapsed        {elapsed:8.2f} s")
+        print(f"  throughput     {expected / elapsed:8.0f} adds/s")
+        print(f"  unique rolls   {len(set(rolls))} / {expected}")
+        print(f"  after reload   {len(final.students)} / {expected}")
+        ok = len(set(rolls)) == expected == len(final.students)
+        print("  OK - no lost updates" if ok else "  FAILED - lost or duplicated updates")
+        sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Puzzles-per-second: GameEngine per-instance generation vs puzzles.generate_batch.
+
+    python benchmarks/bench_puzzles.py --count 20000 --size 6
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import puzzles  # noqa: E402
+from Game import GameEngine  # noqa: E402
+from Level import LevelManager  # noqa: E402
+
+
+def level_for_size(size):
+    return {4: 1, 5: 4, 6: 8}[size]
+
+
+def per_instance(count, size, reject_degenerate):
+    random.seed(1)
+    lm = LevelManager()
+    lm.current_level = level_for_size(size)
+    engine = GameEngine(lm, reject_degenerate=reject_degenerate)
+    for _ in range(count):
+        engine.reset_for_next_level()
+
+
+def report(label, count, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<32} {count / elapsed:12,.0f} puzzles/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--size", type=int, choices=(4, 5, 6), default=6)
+    args = parser.parse_args()
+    n, size = args.count, args.size
+
+    print(f"{n:,} puzzles, {size}x{size}")
+    lm = LevelManager()
+    lm.current_level = level_for_size(size)
+    moves = lm.get_current_config()["moves"]
+    for check in (False, True):
+        # check=True: degenerate boards re-rolled with the solver, on both paths
+        suffix = ", checked" if check else ""
+        report("GameEngine per-instance" + suffix, n, lambda: per_instance(n, size, check))
+        report("batch (pure Python)" + suffix, n, lambda: puzzles.generate_batch(
+            n, size, seed=1, use_numpy=False, moves=moves, reject_degenerate=check))
+        if puzzles.HAS_NUMPY:
+            report("batch (NumPy)" + suffix, n, lambda: puzzles.generate_batch(
+                n, size, seed=1, use_numpy=True, moves=moves, reject_degenerate=check))
+        else:
+            print(f"  {'batch (NumPy)' + suffix:<32} skipped, NumPy not installed")
+
+
+if __name__ == "__main__":
+    main()
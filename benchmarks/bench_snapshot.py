@@ -0,0 +1,141 @@
+"""Roster reads: mmap binary snapshot vs parsing students.json / loading the Database.
+
+Builds --records synthetic students once (students.json, the record log and
+students.snap), then for each mode starts fresh reader processes that open
+the roster and look up --lookups random roll numbers (10% misses). Prints
+open time, per-lookup p50/p99 and memory per reader. Snapshot readers run
+--readers at a time to show the mapped file being shared through the page
+cache (Pss is RSS with shared pages split between the processes; Linux only).
+
+    python benchmarks/bench_snapshot.py --records 1000000 --readers 4
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+STUDENT_PROJECT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Student_Project")
+sys.path.insert(0, STUDENT_PROJECT)
+
+from database import Database  # noqa: E402
+from model import Student  # noqa: E402
+from snapshot import Snapshot, write_snapshot  # noqa: E402
+
+COURSES = ["B.Tech.(CE)", "B.Tech.(IT)", "BCA", "MCA", "Python", "Java", "B.Sc.", "M.Sc."]
+
+
+def memory():
+    """RSS / Pss / shared in MB for this process (empty off Linux)."""
+    out = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("Rss", "Pss", "Shared_Clean"):
+                    out[key.lower()] = int(value.split()[0]) / 1024
+    except OSError:
+        pass
+    return out
+
+
+def open_roster(mode, directory):
+    if mode == "json":
+        # What a reporting script does today: parse the whole export into Students
+        with open(os.path.join(directory, "students.json")) as f:
+            roster = {d["roll_no"]: Student.from_dict(d) for d in json.load(f)}
+        return roster.get
+    if mode == "database":
+        db = Database(log_file=os.path.join(directory, "students.log"),
+                      json_file=os.path.join(directory, "students.json"))
+        return db.get_student
+    return Snapshot(os.path.join(directory, "students.snap")).get
+
+
+def child(mode, directory, lookups, seed, max_roll):
+    start = time.perf_counter()
+    get = open_roster(mode, directory)
+    opened = time.perf_counter() - start
+
+    rng = random.Random(seed)
+    rolls = [rng.randrange(1, max_roll * 10 // 9 + 1) for _ in range(lookups)]
+    latencies = []
+    found = 0
+    for roll in rolls:
+        t = time.perf_counter()
+        s = get(roll)
+        latencies.append(time.perf_counter() - t)
+        found += s is not None
+    latencies.sort()
+    result = {"open_s": opened, "found": found,
+              "p50_us": latencies[len(latencies) // 2] * 1e6,
+              "p99_us": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1e6}
+    print("ready", flush=True)
+    sys.stdin.read()  # Parent measures once every reader of this round is up
+    result.update(memory())
+    print(json.dumps(result), flush=True)
+
+
+def run_readers(mode, directory, count, args, max_roll):
+    procs = [subprocess.Popen([sys.executable, os.path.abspath(__file__), "--child", mode, directory,
+                               "--lookups", str(args.lookups), "--seed", str(args.seed + i),
+                               "--records", str(max_roll)],
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True) for i in range(count)]
+    for p in procs:
+        assert p.stdout.readline().strip() == "ready"
+    results = []
+    for p in procs:
+        out, _ = p.communicate("")
+        results.append(json.loads(out))
+    return results
+
+
+def build(directory, n, seed):
+    rng = random.Random(seed)
+    students = [Student(i, f"Student {rng.randrange(10 ** 6)} {rng.choice('ABCDEFGH')}.", rng.choice(COURSES))
+                for i in range(1, n + 1)]
+    with open(os.path.join(directory, "students.json"), "w") as f:
+        json.dump([s.to_dict() for s in students], f, indent=4)
+    start = time.perf_counter()
+    write_snapshot(students, os.path.join(directory, "students.snap"))
+    snap_s = time.perf_counter() - start
+    # First Database open imports students.json into the record log
+    Database(log_file=os.path.join(directory, "students.log"),
+             json_file=os.path.join(directory, "students.json")).close()
+    return snap_s
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--readers", type=int, default=4, help="concurrent snapshot readers")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child[0], args.child[1], args.lookups, args.seed, args.records)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snap_s = build(tmp, args.records, args.seed)
+        mb = {name: os.path.getsize(os.path.join(tmp, name)) / 1e6
+              for name in ("students.json", "students.log", "students.snap")}
+        print(f"records={args.records:,}  students.json {mb['students.json']:.1f} MB  "
+              f"students.log {mb['students.log']:.1f} MB  students.snap {mb['students.snap']:.1f} MB "
+              f"(written in {snap_s:.2f} s)")
+        print(f"  {'mode':<16} {'open':>9} {'p50':>9} {'p99':>9} {'RSS':>9} {'Pss':>9}")
+        for mode, count in (("json", 1), ("database", 1), ("snapshot", 1), ("snapshot", args.readers)):
+            results = run_readers(mode, tmp, count, args, args.records)
+            r = results[0]
+            label = mode if count == 1 else f"{mode} x{count}"
+            print(f"  {label:<16} {r['open_s'] * 1000:7.1f}ms {r['p50_us']:7.2f}us {r['p99_us']:7.2f}us "
+                  f"{r.get('rss', 0):7.1f}MB {r.get('pss', 0):7.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
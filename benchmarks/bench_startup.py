@@ -0,0 +1,112 @@
+"""Cold start: -X importtime per entry module and StudyAlert time-to-dashboard.
+
+For each --module, runs `python -X importtime -c "import <module>"` in a fresh
+interpreter --repeat times and reports the median cumulative import time plus
+the slowest modules it pulled in (dir/module imports from that directory,
+e.g. Student_Project/main). Then starts StudyAlert.py against a profile
+with --sessions logged sessions and times process start -> dashboard menu.
+--json writes everything to a file so releases can be compared.
+
+    python benchmarks/bench_startup.py --repeat 10 --json startup.json
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+MODULES = ["instrument", "Game", "StudyAlert", "study_runtime", "study_server", "tournament_server",
+           "Student_Project/main"]
+
+
+def import_times(spec):
+    """{module: (self_us, cumulative_us)} for one fresh `import spec`."""
+    where, _, module = spec.rpartition("/")
+    env = dict(os.environ, PYTHONPATH=os.path.join(ROOT, where) + os.pathsep + ROOT)
+    # Measure an installed release: bytecode cached, not recompiled every run
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times.setdefault(name.strip(), (int(self_us), int(cumulative_us)))
+    return module, times
+
+
+def bench_imports(spec, repeat, top):
+    import_times(spec)  # Warm-up: writes the .pyc files
+    runs = [import_times(spec) for _ in range(repeat)]
+    module = runs[0][0]
+    total = statistics.median(times[module][1] for _, times in runs)
+    slowest = {}
+    for _, times in runs:
+        for name, (self_us, _) in times.items():
+            slowest.setdefault(name, []).append(self_us)
+    slowest = sorted(((statistics.median(v), k) for k, v in slowest.items()), reverse=True)[:top]
+    print(f"  {spec:<22} {total / 1000:7.1f} ms   slowest: "
+          + ", ".join(f"{name} {us / 1000:.1f}" for us, name in slowest))
+    return {"median_ms": total / 1000, "slowest_self_ms": {name: us / 1000 for us, name in slowest}}
+
+
+def write_profile(directory, sessions):
+    rng = random.Random(0)
+    with open(os.path.join(directory, "study_data.json"), "w") as f:
+        json.dump({"profile": {"name": "Bench", "goal": "GPSC", "daily_hours_goal": 6, "joined_date": "2024-01-01"},
+                   "alerts": [{"subject": "Polity", "topic": "Revision", "start_time": f"{h:02d}:00",
+                               "duration_mins": 45, "repeat": "Daily", "status": "Pending"} for h in range(6, 22)]}, f)
+    with open(os.path.join(directory, "study_logs.jsonl"), "w") as f:
+        for i in range(sessions):
+            f.write(json.dumps({"date": f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}", "subject": "Polity",
+                                "minutes": rng.randrange(10, 90), "status": "Completed"}) + "\n")
+
+
+def time_to_dashboard(directory):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-u", os.path.join(ROOT, "StudyAlert.py")], cwd=directory, env=env,
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    for line in proc.stdout:
+        if "DASHBOARD" in line:
+            break
+    elapsed = time.perf_counter() - start
+    proc.communicate("6\n")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", nargs="+", default=MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=3, help="slowest modules listed per entry")
+    parser.add_argument("--sessions", type=int, default=200000, help="logged sessions for the dashboard timing")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = {"python": sys.version.split()[0], "imports": {}}
+    print(f"import time (median of {args.repeat}, ms)")
+    for spec in args.module:
+        results["imports"][spec] = bench_imports(spec, args.repeat, args.top)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_profile(tmp, args.sessions)
+        size_mb = os.path.getsize(os.path.join(tmp, "study_logs.jsonl")) / 1e6
+        dashboard = statistics.median(time_to_dashboard(tmp) for _ in range(args.repeat))
+    print(f"StudyAlert to dashboard ({args.sessions:,} sessions, {size_mb:.1f} MB log): {dashboard * 1000:.0f} ms")
+    results["studyalert_dashboard_ms"] = dashboard * 1000
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Startup-time benchmark: full json.load vs the streaming loaders.
+
+Writes a legacy students.json array and a legacy study_data.json with
+--records entries each, then reports time-to-first-record and time until
+each app is usable (Database(background=True) / StudyAlertApp()).
+
+    python benchmarks/bench_streaming_load.py --records 1000000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "Student_Project"))
+sys.path.insert(0, ROOT)
+
+from streaming import iter_records  # noqa: E402
+
+
+def write_students(path, n):
+    with open(path, "w") as f:
+        f.write("[\n")
+        for i in range(1, n + 1):
+            rec = {"roll_no": i, "name": f"Student {i}", "course": "B.Tech.(CE)"}
+            f.write(("    " if i == 1 else ",\n    ") + json.dumps(rec))
+        f.write("\n]")
+
+
+def write_study_data(path, n):
+    with open(path, "w") as f:
+        f.write('{"profile": {"name": "Bench", "goal": "GPSC", "daily_hours_goal": 6, '
+                '"joined_date": "2024-01-01"}, "alerts": [], "logs": [')
+        for i in range(n):
+            rec = {"date": "2024-01-01", "subject": "Polity", "minutes": 60, "status": "Completed"}
+            f.write(("" if i == 0 else ", ") + json.dumps(rec))
+        f.write("]}")
+
+
+TRACE_MEMORY = False
+
+
+def timed(label, fn):
+    # tracemalloc slows allocation-heavy code a lot, so it is opt-in
+    if TRACE_MEMORY:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    line = f"  {label:<36} {elapsed * 1000:10.1f} ms"
+    if TRACE_MEMORY:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        line += f"   peak {peak / 2**20:8.1f} MiB"
+    print(line)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--memory", action="store_true", help="also report peak traced memory")
+    args = parser.parse_args()
+    global TRACE_MEMORY
+    TRACE_MEMORY = args.memory
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        write_students("students.json", args.records)
+        write_study_data("study_data.json", args.records)
+        print(f"records: {args.records:,}")
+
+        print("students.json")
+        timed("json.load (full parse)", lambda: json.load(open("students.json")))
+        timed("streaming: first record", lambda: next(iter_records("students.json")))
+        timed("streaming: all records", lambda: sum(1 for _ in iter_records("students.json")))
+
+        from database import Database
+        db = timed("Database(background=True) usable", lambda: Database(background=True))
+        timed("  ...background import finished", lambda: db._loaded.wait())
+        db.close()
+
+        print("study_data.json")
+        import StudyAlert
+        timed("json.load (full parse)", lambda: json.load(open("study_data.json")))
+        app = timed("StudyAlertApp() usable", StudyAlert.StudyAlertApp)
+        timed("  ...log history finished", lambda: app.logs_loaded.wait())
+        app.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Memory + load-time benchmark for the Student_Project Database.
+
+Opens a roster of --records students with Database() (dict of __slots__
+Students, tuple name index) and Database(compact=True) (columnar store,
+roll-number arrays for the indexes) and reports what each keeps resident:
+the whole Database, split into the record store and the course/name
+indexes. The original dict-per-instance Student is listed for reference.
+
+    python benchmarks/bench_student_memory.py --records 1000000
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Student_Project"))
+
+from database import Database  # noqa: E402
+from model import Student  # noqa: E402
+from storage import RecordLog  # noqa: E402
+
+COURSES = ["B.Tech.(CE)", "B.Tech.(IT)", "BCA", "MCA", "Python", "Java", "B.Sc.", "M.Sc."]
+
+
+class LegacyStudent:
+    """Student class as it was before __slots__ (one __dict__ per object)."""
+    def __init__(self, roll_no, name, course):
+        self.roll_no = roll_no
+        self.name = name
+        self.course = course
+
+
+def legacy_memory(n):
+    gc.collect()
+    tracemalloc.start()
+    # A JSON parse gives every record its own copy of the course string
+    index = {i: LegacyStudent(i, f"Student {i}", "".join(COURSES[i % len(COURSES)])) for i in range(1, n + 1)}
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del index
+    return current
+
+
+def open_db(path, compact):
+    return Database(log_file=path, json_file=path + ".json", compact=compact)
+
+
+def database_memory(path, compact):
+    """(whole Database, record store, indexes) bytes after a load"""
+    gc.collect()
+    tracemalloc.start()
+    db = open_db(path, compact)
+    total, _ = tracemalloc.get_traced_memory()
+    # Drop the indexes to see how much of the total they held
+    db.course_index = db.name_index = None
+    gc.collect()
+    store, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.close()
+    return total, store, total - store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+    n = args.records
+
+    print(f"records: {n:,}")
+    mem = legacy_memory(n)
+    print(f"  {'legacy dict only':<18} {mem / 2**20:8.1f} MiB  ({mem / n:6.1f} B/record)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "students.log")
+        writer = RecordLog(path)
+        with writer.transaction():
+            for i in range(1, n + 1):
+                writer.add(Student(i, f"Student {i}", COURSES[i % len(COURSES)]))
+        writer.close()
+        for compact in (False, True):
+            label = "Database compact" if compact else "Database"
+            total, store, indexes = database_memory(path, compact)
+            start = time.perf_counter()
+            open_db(path, compact).close()
+            load = time.perf_counter() - start
+            print(f"  {label:<18} {total / 2**20:8.1f} MiB  ({total / n:6.1f} B/record: store {store / n:6.1f}, "
+                  f"indexes {indexes / n:6.1f})  load {load:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Load test for study_server.py: thousands of profiles over the HTTP API.
+
+Starts the service in a subprocess with a small in-memory cap, then drives
+it with --concurrency keep-alive connections through four phases (create
+profiles, add alerts, log sessions, read reports) and prints requests/s and
+p50/p99 latency per phase plus the server's LRU and memory stats.
+
+    python benchmarks/bench_study_server.py --profiles 5000 --max-loaded 500
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host, port):
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def request(self, method, path, body=None):
+        data = json.dumps(body).encode() if body is not None else b""
+        self.writer.write(f"{method} {path} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data)
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line == b"\r\n":
+                break
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        return status, json.loads(await self.reader.readexactly(length))
+
+    def close(self):
+        self.writer.close()
+
+
+def percentile(sorted_vals, pct):
+    return sorted_vals[min(len(sorted_vals) - 1, int(len(sorted_vals) * pct / 100))]
+
+
+async def phase(label, clients, jobs, expect):
+    queue = asyncio.Queue()
+    for job in jobs:
+        queue.put_nowait(job)
+    latencies, errors = [], []
+
+    async def worker(client):
+        while not queue.empty():
+            method, path, body = queue.get_nowait()
+            start = time.perf_counter()
+            status, payload = await client.request(method, path, body)
+            latencies.append(time.perf_counter() - start)
+            if status not in expect:
+                errors.append((status, path, payload))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(c) for c in clients))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(f"  {label:<10} {len(jobs):>7,} req {len(jobs) / elapsed:9,.0f} req/s   "
+          f"p50 {percentile(latencies, 50) * 1000:6.2f} ms   p99 {percentile(latencies, 99) * 1000:7.2f} ms"
+          + (f"   {len(errors)} errors, first {errors[0]}" if errors else ""))
+
+
+async def drive(host, port, args):
+    rng = random.Random(0)
+    clients = [await Client.connect(host, port) for _ in range(args.concurrency)]
+    users = [f"student{i:05d}" for i in range(args.profiles)]
+    subjects = ["Polity", "History", "Geography", "Economy", "Science"]
+
+    await phase("create", clients, [("POST", f"/users/{u}", {"name": u, "goal": "GPSC", "daily_hours_goal": 6})
+                                    for u in users], {201})
+    await phase("alerts", clients, [("POST", f"/users/{u}/alerts",
+                                     {"subject": rng.choice(subjects), "topic": "Revision",
+                                      "start_time": f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+                                      "duration_mins": 45}) for u in users], {201})
+    await phase("sessions", clients, [("POST", f"/users/{rng.choice(users)}/sessions",
+                                       {"subject": rng.choice(subjects), "minutes": rng.randrange(10, 90),
+                                        "status": rng.choice(["Completed", "Completed", "Skipped"])})
+                                      for _ in range(args.profiles * args.sessions)], {201})
+    await phase("reports", clients, [("GET", f"/users/{rng.choice(users)}/report", None)
+                                     for _ in range(args.profiles)], {200})
+
+    _, stats = await clients[0].request("GET", "/stats")
+    print(f"  server: {stats}")
+    for c in clients:
+        c.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=5000)
+    parser.add_argument("--sessions", type=int, default=2, help="sessions logged per profile")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--max-loaded", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "study_server.py"), "--root", tmp, "--port", "0",
+             "--max-loaded", str(args.max_loaded)],
+            stdout=subprocess.PIPE, text=True, cwd=tmp)
+        try:
+            banner = server.stdout.readline()
+            host, port = banner.split(" on ")[1].split(" ")[0].rsplit(":", 1)
+            print(f"profiles={args.profiles:,} concurrency={args.concurrency} max_loaded={args.max_loaded}")
+            asyncio.run(drive(host, int(port), args))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Move latency for tournament_server.py at 1k and 10k concurrent sessions.
+
+Starts the server in a subprocess, joins --sessions players spread over
+--connections TCP connections, and lets every session play --moves moves
+concurrently (each waits for its reply before the next move). Reports
+moves/s and p50/p99 round-trip latency for each session count.
+
+With --think 0 every session fires moves back to back, so latency mostly
+measures queueing; --think N waits a random 0..2N seconds between moves,
+like a human player.
+
+    python benchmarks/bench_tournament.py --sessions 1000 10000 --think 1
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+class Client:
+    """One connection multiplexing many sessions; replies matched by id."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.waiting = {}
+        self.ids = itertools.count()
+        self.events = 0
+        self.task = asyncio.create_task(self._read())
+
+    @classmethod
+    async def connect(cls, host, port):
+        return cls(*await asyncio.open_connection(host, port, limit=1 << 20))
+
+    async def _read(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                return
+            msg = json.loads(line)
+            future = self.waiting.pop(msg.get("id"), None)
+            if future is not None:
+                future.set_result(msg)
+            else:
+                self.events += 1
+
+    async def call(self, **msg):
+        msg["id"] = next(self.ids)
+        future = self.waiting[msg["id"]] = asyncio.get_running_loop().create_future()
+        self.writer.write(json.dumps(msg).encode() + b"\n")
+        return await future
+
+    async def close(self):
+        self.writer.close()
+        self.task.cancel()
+
+
+def next_cell(state, rng):
+    """A random cell adjacent to the path end (any cell to start)."""
+    size = len(state["grid"])
+    path = state["path"]
+    if not path:
+        return rng.randrange(size), rng.randrange(size)
+    r, c = path[-1]
+    options = [(nr, nc) for nr, nc in ((r, c + 1), (r + 1, c), (r, c - 1), (r - 1, c))
+               if 0 <= nr < size and 0 <= nc < size and (nr, nc) not in path]
+    return rng.choice(options) if options else (rng.randrange(size), rng.randrange(size))
+
+
+async def play(client, sid, moves, rng, latencies, think):
+    state = await client.call(op="state", session=sid)
+    state["path"] = []
+    for _ in range(moves):
+        if think:
+            await asyncio.sleep(rng.uniform(0, 2 * think))
+        r, c = next_cell(state, rng)
+        start = time.perf_counter()
+        reply = await client.call(op="move", session=sid, r=r, c=c)
+        latencies.append(time.perf_counter() - start)
+        if "board" in reply:
+            state.update(reply["board"])
+            state["path"] = []
+        elif reply["result"] in ("WIN", "LOSE"):
+            state["path"] = []
+        elif reply["result"] == "CONTINUE":
+            state["path"].append((r, c))
+        if reply.get("finished"):
+            return
+
+
+def percentile(sorted_vals, pct):
+    return sorted_vals[min(len(sorted_vals) - 1, int(len(sorted_vals) * pct / 100))]
+
+
+async def run(host, port, sessions, connections, moves, think):
+    clients = [await Client.connect(host, port) for _ in range(min(connections, sessions))]
+    start = time.perf_counter()
+    joined = await asyncio.gather(*(clients[i % len(clients)].call(op="join", player=f"p{i}")
+                                    for i in range(sessions)))
+    join_s = time.perf_counter() - start
+
+    latencies = []
+    rng = random.Random(sessions)
+    start = time.perf_counter()
+    await asyncio.gather(*(play(clients[i % len(clients)], j["session"], moves, random.Random(rng.random()), latencies, think)
+                           for i, j in enumerate(joined)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(f"  sessions {sessions:>6,}  joins {sessions / join_s:8,.0f}/s  moves {len(latencies) / elapsed:8,.0f}/s  "
+          f"p50 {percentile(latencies, 50) * 1000:7.2f} ms  p99 {percentile(latencies, 99) * 1000:7.2f} ms")
+    for client in clients:
+        await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--moves", type=int, default=20, help="moves per session")
+    parser.add_argument("--think", type=float, default=0.0, help="mean seconds between a session's moves")
+    args = parser.parse_args()
+
+    server = subprocess.Popen([sys.executable, os.path.join(ROOT, "tournament_server.py"), "--port", "0",
+                               "--seed", "1"], stdout=subprocess.PIPE, text=True)
+    try:
+        host, port = server.stdout.readline().split(" on ")[1].split(" ")[0].rsplit(":", 1)
+        print(f"connections={args.connections} moves/session={args.moves} think={args.think}s")
+        for n in args.sessions:
+            asyncio.run(run(host, int(port), n, args.connections, args.moves, args.think))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""Reproducible benchmark suite: one runner, fixed seeds, synthetic data.
+
+Suites (pick with --only):
+  database   Database bulk add, single add/delete and load at 10k/100k/1M students
+  game       GameEngine grid generation, target calculation, process_move
+  studyalert StudyAlertApp load, show_analytics and save_state at growing log sizes
+  scheduler  StudyScheduler rebuild, a day of due-entry pops and next_due with many alerts
+
+Every result is stored as seconds per operation (lower is better) together
+with the run's sizes, seed and environment. --compare flags any case that
+got slower than --threshold between two result files and exits 1.
+
+    python benchmarks/run.py --out base.json
+    python benchmarks/run.py --only game scheduler --quick --out new.json
+    python benchmarks/run.py --compare base.json new.json --threshold 0.15
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "Student_Project"))
+
+from Game import GameEngine  # noqa: E402
+from Level import LevelManager  # noqa: E402
+from StudyAlert import StorageManager, StudyAlert, StudyAlertApp, StudyScheduler  # noqa: E402
+from database import Database  # noqa: E402
+
+SEED = 1234
+SIZES = {
+    "database": [10_000, 100_000, 1_000_000],
+    "game": [4, 5, 6],  # grid sizes
+    "studyalert": [1_000, 10_000, 100_000],  # logged sessions
+    "scheduler": [1_000, 10_000, 100_000],  # alerts
+}
+QUICK_SIZES = {"database": [10_000], "game": [4, 6], "studyalert": [1_000, 10_000], "scheduler": [1_000, 10_000]}
+COURSES = ["B.Tech.(CE)", "B.Tech.(IT)", "BCA", "MCA", "Python", "Java", "B.Sc.", "M.Sc."]
+SUBJECTS = ["Polity", "History", "Geography", "Economy", "Science", "Ethics"]
+REPEATS = ["Daily", "Weekdays", "Weekends", "Mon,Wed,Fri", "Once"]
+
+
+class Recorder:
+    def __init__(self, repeat):
+        self.repeat = repeat
+        self.results = {}
+
+    def add(self, name, seconds, ops):
+        self.results[name] = {"per_op_s": seconds / ops, "ops": ops, "seconds": seconds}
+        print(f"  {name:<40} {ops:>10,} ops  {seconds / ops * 1e6:12.2f} us/op  {ops / seconds:14,.0f} ops/s",
+              flush=True)
+
+    def best(self, name, ops, fn, setup=None):
+        """Best of `repeat` runs of fn() (after setup(), untimed) for `ops` operations."""
+        times = []
+        for _ in range(self.repeat):
+            arg = setup() if setup is not None else None
+            start = time.perf_counter()
+            fn(arg) if setup is not None else fn()
+            times.append(time.perf_counter() - start)
+        self.add(name, min(times), ops)
+
+
+# --- SUITES ---
+
+def bench_database(rec, sizes, rng, tmp):
+    for n in sizes:
+        log, data = os.path.join(tmp, f"db{n}.log"), os.path.join(tmp, f"db{n}.json")
+        db = Database(log_file=log, json_file=data)
+        start = time.perf_counter()
+        with db.transaction(bulk=True):
+            for i in range(n):
+                db.add_student(f"Student {rng.randrange(10 ** 6)}", COURSES[i % len(COURSES)])
+        rec.add(f"database.add_bulk[{n}]", time.perf_counter() - start, n)
+
+        # One commit (write + fsync) per call, as from the menu
+        k = 200
+        start = time.perf_counter()
+        for _ in range(k):
+            db.add_student("Late Joiner", "BCA")
+        rec.add(f"database.add[{n}]", time.perf_counter() - start, k)
+        victims = rng.sample(range(1, n + 1), k)
+        start = time.perf_counter()
+        for roll in victims:
+            db.delete_student(roll)
+        rec.add(f"database.delete[{n}]", time.perf_counter() - start, k)
+        db.export_json()
+        db.close()
+
+        start = time.perf_counter()
+        Database(log_file=log, json_file=data).close()
+        rec.add(f"database.load[{n}]", time.perf_counter() - start, n)
+        # No log yet: load_data imports students.json instead
+        os.rename(log, log + ".old")
+        start = time.perf_counter()
+        Database(log_file=log, json_file=data).close()
+        rec.add(f"database.import_json[{n}]", time.perf_counter() - start, n)
+        for path in (log, log + ".old", data):
+            os.remove(path)
+
+
+def bench_game(rec, sizes, rng, tmp):
+    lm = LevelManager()
+    levels = {}  # grid size -> hardest level using it
+    for level in range(1, lm.max_levels + 1):
+        lm.current_level = level
+        levels[lm.get_current_config()["size"]] = level
+    for size in sizes:
+        lm.current_level = levels[size]
+        engine = GameEngine(lm, rng=random.Random(rng.random()))
+        k = 20_000
+        rec.best(f"game.generate_grid[{size}x{size}]", k, lambda: [engine._generate_grid() for _ in range(k)])
+        rec.best(f"game.target[{size}x{size}]", k, lambda: [engine._calculate_valid_target() for _ in range(k)])
+
+        clicks = [(rng.randrange(size), rng.randrange(size)) for _ in range(200_000)]
+
+        def replay():
+            engine.reset_current_level()
+            for r, c in clicks:
+                if engine.process_move(r, c) != "CONTINUE":
+                    engine.reset_current_level()
+        rec.best(f"game.process_move[{size}x{size}]", len(clicks), replay)
+
+
+def write_study_profile(directory, sessions, rng):
+    storage = StorageManager(os.path.join(directory, "study_data.json"), os.path.join(directory, "study_logs.jsonl"))
+    alerts = [{"subject": rng.choice(SUBJECTS), "topic": "Revision", "start_time": f"{h:02d}:00",
+               "duration_mins": 45, "repeat": "Daily", "status": "Pending"} for h in range(6, 22)]
+    storage.save_snapshot({"name": "Bench", "goal": "GPSC", "daily_hours_goal": 6, "joined_date": "2024-01-01"}, alerts)
+    # Dates end today, so the week/month windows in the report always hold data
+    day0 = time.time() - 400 * 86400
+    storage.write_logs([{"date": time.strftime("%Y-%m-%d", time.localtime(day0 + i * 400 * 86400 // sessions)),
+                         "subject": rng.choice(SUBJECTS), "minutes": rng.randrange(10, 120),
+                         "status": "Completed" if rng.random() < 0.8 else "Skipped"} for i in range(sessions)])
+    return storage
+
+
+def bench_studyalert(rec, sizes, rng, tmp):
+    for n in sizes:
+        directory = tempfile.mkdtemp(dir=tmp)
+        storage = write_study_profile(directory, n, rng)
+
+        def load(_=None):
+            app = StudyAlertApp(storage)
+            app.logs_loaded.wait()
+            return app
+        apps = []
+        rec.best(f"studyalert.load[{n}]", n, lambda: apps.append(load()))
+        for app in apps[:-1]:
+            app.shutdown()
+        app = apps[-1]
+
+        def analytics():
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(20):
+                    app.show_analytics()
+        rec.best(f"studyalert.show_analytics[{n}]", 20, analytics)
+
+        def save():
+            for _ in range(5):
+                app.save_state()
+                app.store.flush()  # Include the write (and fsync) the debounce would do later
+        rec.best(f"studyalert.save_state[{n}]", 5, save)
+        app.shutdown()
+
+
+class _Alerts:
+    """Stands in for StudyAlertApp: the scheduler only reads .alerts."""
+
+    def __init__(self, alerts):
+        self.alerts = alerts
+
+    def save_state(self):
+        pass
+
+
+def bench_scheduler(rec, sizes, rng, tmp):
+    start_ts = time.mktime((2024, 1, 1, 0, 0, 0, 0, 0, -1))
+    for n in sizes:
+        alerts = [StudyAlert(rng.choice(SUBJECTS), "Topic", f"{rng.randrange(24):02d}:{rng.randrange(60):02d}", 30,
+                             rng.choice(REPEATS)) for _ in range(n)]
+        now = [start_ts]
+        scheduler = StudyScheduler(_Alerts(alerts), clock=lambda: now[0])
+        rec.best(f"scheduler.rebuild[{n}]", n, scheduler.rebuild)
+
+        def day(_):
+            # Every entry due in the next 24h is popped and re-armed, as the run loop would
+            now[0] = start_ts + 86400
+            pops = 0
+            while scheduler._pop_ready()[1] is not None:
+                pops += 1
+            return pops
+
+        def fresh():
+            now[0] = start_ts
+            scheduler.rebuild()
+        fresh()
+        pops = day(None)
+        rec.best(f"scheduler.day_pops[{n}]", pops, day, setup=fresh)
+        rec.best(f"scheduler.next_due[{n}]", 10, lambda: [scheduler.next_due() for _ in range(10)])
+
+
+SUITES = {"database": bench_database, "game": bench_game, "studyalert": bench_studyalert,
+          "scheduler": bench_scheduler}
+
+
+# --- RUN / COMPARE ---
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine(),
+            "cpus": os.cpu_count(), "commit": commit, "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def run(only, quick, repeat, seed):
+    sizes = QUICK_SIZES if quick else SIZES
+    rec = Recorder(repeat)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in only:
+            print(f"{name} (sizes {sizes[name]})")
+            # Each suite gets its own seeded rng, so --only does not change the data
+            SUITES[name](rec, sizes[name], random.Random(f"{seed}:{name}"), tmp)
+    return {"env": environment(), "seed": seed, "repeat": repeat,
+            "sizes": {name: sizes[name] for name in only}, "results": rec.results}
+
+
+def compare(base, new, threshold):
+    """Prints per-case change in time/op; returns the names that regressed."""
+    regressions = []
+    print(f"{'case':<40} {'base us/op':>12} {'new us/op':>12} {'change':>8}")
+    for name in sorted(set(base["results"]) | set(new["results"])):
+        if name not in base["results"] or name not in new["results"]:
+            print(f"{name:<40} {'(only in ' + ('new' if name in new['results'] else 'base') + ')':>34}")
+            continue
+        old, cur = base["results"][name]["per_op_s"], new["results"][name]["per_op_s"]
+        change = cur / old - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+        print(f"{name:<40} {old * 1e6:12.2f} {cur * 1e6:12.2f} {change * 100:+7.1f}%{flag}")
+    for label, run_ in (("base", base), ("new", new)):
+        env = run_.get("env", {})
+        print(f"{label}: commit {env.get('commit')} python {env.get('python')} on {env.get('platform')}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=list(SUITES), default=list(SUITES))
+    parser.add_argument("--quick", action="store_true", help="small sizes only, for a smoke run")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N for the fast cases")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="compare two result files")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            base = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+        regressions = compare(base, new, args.threshold)
+        print(f"{len(regressions)} regression(s) over {args.threshold * 100:.0f}%")
+        return 1 if regressions else 0
+
+    results = run(args.only, args.quick, args.repeat, args.seed)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"results written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,326 @@
+import atexit
+import os
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+
+# Every app imports this module, so json/re/cProfile are only imported by
+# the code that dumps or profiles
+
+# INSTRUMENT=1 (or a file path) turns everything on; apps with argparse also
+# take --instrument [PATH]. A path ending in .prom gets Prometheus text.
+ENV_VAR = "INSTRUMENT"
+ENV_INTERVAL = "INSTRUMENT_INTERVAL"
+ENV_PROFILE = "INSTRUMENT_PROFILE"
+DEFAULT_FILE = "instrument_stats.json"
+DEFAULT_INTERVAL = 10.0
+
+# Histogram bucket upper bounds in seconds: 1-2.5-5 steps from 1 us to 10 s
+BUCKETS = tuple(float(f"{m}e{e}") for e in range(-6, 1) for m in (1, 2.5, 5)) + (10.0,)
+
+ENABLED = False
+
+_lock = threading.Lock()
+_histograms = {}
+_counters = {}
+_sites = []  # (class, attribute, plain function, timing wrapper) per @timed method
+_dumper = None
+_profiler = None
+
+
+class Histogram:
+    """Latency histogram with fixed log-scale buckets, plus count/sum/min/max."""
+
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # last slot: above the top bucket
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, pct):
+        """Upper bound of the bucket holding the pct-th observation."""
+        if not self.count:
+            return 0.0
+        rank = self.count * pct / 100
+        seen = 0
+        for bound, n in zip(BUCKETS, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {"count": self.count, "sum": self.sum,
+                "min": self.min if self.count else 0.0, "max": self.max,
+                "mean": self.sum / self.count if self.count else 0.0,
+                "p50": self.percentile(50), "p95": self.percentile(95), "p99": self.percentile(99),
+                "buckets": dict(zip([f"{b:g}" for b in BUCKETS] + ["+Inf"], self.counts))}
+
+
+# --- RECORDING ---
+
+def observe(name, seconds):
+    with _lock:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = Histogram()
+        hist.observe(seconds)
+
+
+def count(name, n=1):
+    if ENABLED:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + n
+
+
+class _TimedMethod:
+    """What @timed leaves in a class body. Once the class exists it replaces
+    itself with the plain function or the timing wrapper, whichever matches
+    ENABLED, and enable()/disable() swap them later - so a method timer that
+    is off costs nothing at all."""
+
+    def __init__(self, func, wrapper):
+        self.func = func
+        self.wrapper = wrapper
+
+    def __set_name__(self, owner, name):
+        _sites.append((owner, name, self.func, self.wrapper))
+        setattr(owner, name, self.wrapper if ENABLED else self.func)
+
+    def __call__(self, *args, **kwargs):
+        return self.wrapper(*args, **kwargs)
+
+
+def timed(name=None):
+    """Decorator: records each call's duration under `name` (default: qualname).
+
+    On methods the disabled cost is zero (see _TimedMethod); a plain function
+    keeps the wrapper, which only checks one global flag while disabled.
+    """
+    def decorate(func):
+        metric = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(metric, time.perf_counter() - start)
+        return _TimedMethod(func, wrapper)
+    return decorate
+
+
+def _install():
+    for owner, name, func, wrapper in _sites:
+        setattr(owner, name, wrapper if ENABLED else func)
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.name, time.perf_counter() - self.start)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(name):
+    """with timer("Storage.fsync"): ... records the block's duration."""
+    return _Timer(name) if ENABLED else _NULL_TIMER
+
+
+# --- EXPORT ---
+
+def snapshot():
+    with _lock:
+        return {"time": time.time(),
+                "counters": dict(_counters),
+                "timers": {name: h.to_dict() for name, h in sorted(_histograms.items())}}
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+
+
+def _metric_name(name):
+    import re
+    return "app_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def to_prometheus(stats):
+    lines = []
+    for name, value in sorted(stats["counters"].items()):
+        metric = _metric_name(name) + "_total"
+        lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+    for name, h in stats["timers"].items():
+        metric = _metric_name(name) + "_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        cumulative = 0
+        for bound, n in h["buckets"].items():
+            cumulative += n
+            lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+        lines += [f"{metric}_sum {h['sum']}", f"{metric}_count {h['count']}"]
+    return "\n".join(lines) + "\n"
+
+
+def dump(path):
+    """Writes the current stats to path (JSON, or Prometheus text for .prom)."""
+    import json
+    stats = snapshot()
+    text = to_prometheus(stats) if path.endswith(".prom") else json.dumps(stats, indent=2)
+    # Temp file + rename, so a scraper never reads half a dump
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+class StatsDumper:
+    """Daemon thread that rewrites the stats file every `interval` seconds."""
+
+    def __init__(self, path, interval=DEFAULT_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="instrument-dump", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                dump(self.path)
+            except OSError:
+                pass  # Try again next interval; stats are never worth crashing for
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        dump(self.path)
+
+
+# --- SETUP ---
+
+def add_arguments(parser):
+    group = parser.add_argument_group("instrumentation")
+    group.add_argument("--instrument", nargs="?", const=DEFAULT_FILE, metavar="PATH",
+                       help=f"record hot-path timings and dump them to PATH (default {DEFAULT_FILE}; .prom = Prometheus)")
+    group.add_argument("--instrument-interval", type=float, metavar="SECONDS",
+                       help=f"seconds between stats dumps (default {DEFAULT_INTERVAL:g})")
+    group.add_argument("--profile", metavar="PATH", help="run under cProfile and write pstats to PATH at exit")
+
+
+def configure(args=None):
+    """Turns instrumentation on from parsed --instrument/--profile arguments,
+    falling back to the INSTRUMENT, INSTRUMENT_INTERVAL and INSTRUMENT_PROFILE
+    environment variables. Call once from the app's entry point."""
+    path = getattr(args, "instrument", None)
+    if path is None:
+        value = os.environ.get(ENV_VAR, "").strip()
+        if value and value.lower() not in ("0", "false", "no", "off"):
+            path = DEFAULT_FILE if value.lower() in ("1", "true", "yes", "on") else value
+    interval = getattr(args, "instrument_interval", None) or float(os.environ.get(ENV_INTERVAL) or DEFAULT_INTERVAL)
+    profile = getattr(args, "profile", None) or os.environ.get(ENV_PROFILE)
+    if path:
+        enable(path, interval)
+    if profile:
+        start_profile(profile)
+
+
+def enable(path=None, interval=DEFAULT_INTERVAL):
+    """Starts recording; with a path, stats are dumped periodically and at exit."""
+    global ENABLED, _dumper
+    ENABLED = True
+    _install()
+    if path and _dumper is None:
+        _dumper = StatsDumper(path, interval)
+        atexit.register(disable)
+
+
+def disable():
+    global ENABLED, _dumper
+    ENABLED = False
+    _install()
+    if _dumper is not None:
+        dumper, _dumper = _dumper, None
+        dumper.stop()
+        atexit.unregister(disable)
+
+
+def start_profile(path):
+    """cProfile for this session (the calling thread); pstats written at exit."""
+    global _profiler
+    import cProfile
+    if _profiler is not None:
+        return
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+    atexit.register(stop_profile, path)
+
+
+def stop_profile(path):
+    global _profiler
+    if _profiler is not None:
+        profiler, _profiler = _profiler, None
+        profiler.disable()
+        profiler.dump_stats(path)
+        atexit.unregister(stop_profile)
+
+
+def report(stats):
+    lines = [f"{'timer':<40} {'count':>9} {'mean ms':>9} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}"]
+    for name, h in stats["timers"].items():
+        lines.append(f"{name:<40} {h['count']:>9,} {h['mean'] * 1000:>9.3f} {h['p50'] * 1000:>8.3f} "
+                     f"{h['p99'] * 1000:>8.3f} {h['max'] * 1000:>8.3f}")
+    for name, value in sorted(stats["counters"].items()):
+        lines.append(f"{name:<40} {value:>9,}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+    # python instrument.py instrument_stats.json  -> table of a JSON dump
+    # python instrument.py session.pstats [N]      -> top N functions by cumulative time
+    target = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_FILE
+    if target.endswith(".json"):
+        with open(target) as f:
+            print(report(json.load(f)))
+    else:
+        import pstats
+        pstats.Stats(target).sort_stats("cumulative").print_stats(int(sys.argv[2]) if len(sys.argv) > 2 else 25)
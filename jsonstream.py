@@ -0,0 +1,61 @@
+"""Incremental JSON reading shared by StudyAlert.py and Student_Project.
+
+ChunkReader reads a file chunk by chunk and decodes one JSON value at a
+time, so a huge array or object can be walked without loading it whole.
+"""
+import json
+import re
+
+CHUNK_SIZE = 1 << 16
+_decoder = json.JSONDecoder()
+_WS = re.compile(r"[ \t\n\r]*")
+_NUM_TAIL = "0123456789.eE+-"
+
+
+class ChunkReader:
+    """Incremental JSON tokenizer: decodes one value at a time from a file."""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _more(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what was already consumed, so the buffer stays one chunk or so
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character ('' at EOF)."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._more():
+                return ""
+
+    def expect(self, ch):
+        if self.peek() != ch:
+            raise json.JSONDecodeError(f"Expecting '{ch}'", self.buf, self.pos)
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+                # A number cut at the buffer edge ("-1." / "12e") may be truncated
+                if self.eof or (end < len(self.buf) and self.buf[end] not in _NUM_TAIL):
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._more()
@@ -0,0 +1,177 @@
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+DB_FILE = "leaderboard.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id     INTEGER PRIMARY KEY,
+    player TEXT    NOT NULL,
+    level  INTEGER NOT NULL,
+    score  INTEGER NOT NULL,
+    ts     REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_level  ON scores (level, score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_player ON scores (player, score DESC);
+"""
+
+_STOP = object()
+
+
+def connect(path, timeout=30.0):
+    # WAL lets readers run while another game instance is writing; the busy
+    # timeout makes concurrent writers wait for each other instead of failing
+    conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class Leaderboard:
+    """SQLite-backed score history with top-K queries per level and per player.
+
+    submit() only puts the score on a queue and returns; a writer thread
+    drains the queue and inserts everything waiting in one transaction, so
+    gameplay never waits on disk. Any number of game instances (threads or
+    processes) may share one database file. Queries flush this instance's
+    pending scores first, so a player always sees their own latest result.
+    """
+
+    def __init__(self, path=DB_FILE, max_batch=500, write_behind=True):
+        self.path = path
+        self.max_batch = max_batch
+        self.write_behind = write_behind
+        self.error = None
+        self.submitted = 0
+        self.written = 0
+        self._lock = threading.Lock()
+        self._conn = connect(path)
+        self._queue = queue.Queue()
+        self._thread = None
+        if write_behind:
+            self._thread = threading.Thread(target=self._run, name="leaderboard-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    # --- WRITES ---
+
+    def submit(self, player, level, score, ts=None):
+        row = (player, int(level), int(score), time.time() if ts is None else ts)
+        self.submitted += 1
+        if self.write_behind:
+            self._queue.put(row)
+        else:
+            self._write([row])
+
+    def _write(self, rows):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO scores (player, level, score, ts) VALUES (?, ?, ?, ?)", rows)
+        self.written += len(rows)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            rows, markers, stop = [], [], False
+            # Take whatever else is already waiting, up to one batch
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    rows.append(item)
+                if stop or len(rows) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if rows:
+                try:
+                    self._write(rows)
+                except sqlite3.Error as e:
+                    # Keep the game running; flush()/close() report it
+                    self.error = e
+            for event in markers:
+                event.set()
+            if stop:
+                return
+
+    def flush(self, timeout=None):
+        """Blocks until every score submitted so far is on disk."""
+        if self._thread is not None and self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait(timeout)
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def close(self):
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        atexit.unregister(self.close)
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    # --- QUERIES ---
+
+    def _query(self, sql, args):
+        self.flush()
+        with self._lock:
+            return self._conn.execute(sql, args).fetchall()
+
+    def top_for_level(self, level, k=10):
+        """Best k (player, score, ts) rows on one level, earliest first on ties."""
+        return self._query(
+            "SELECT player, score, ts FROM scores WHERE level = ? "
+            "ORDER BY score DESC, ts LIMIT ?", (level, k))
+
+    def top_for_player(self, player, k=10):
+        """Best k (level, score, ts) rows for one player."""
+        return self._query(
+            "SELECT level, score, ts FROM scores WHERE player = ? "
+            "ORDER BY score DESC, ts LIMIT ?", (player, k))
+
+    def player_best(self, player):
+        """{level: best score} for one player."""
+        return dict(self._query(
+            "SELECT level, MAX(score) FROM scores WHERE player = ? GROUP BY level", (player,)))
+
+    def high_score(self, player=None):
+        if player is None:
+            rows = self._query("SELECT MAX(score) FROM scores", ())
+        else:
+            rows = self._query("SELECT MAX(score) FROM scores WHERE player = ?", (player,))
+        return rows[0][0] or 0
+
+    def rank(self, level, score):
+        """1-based position a score would take on a level's board."""
+        rows = self._query("SELECT COUNT(*) FROM scores WHERE level = ? AND score > ?", (level, score))
+        return rows[0][0] + 1
+
+    def __len__(self):
+        return self._query("SELECT COUNT(*) FROM scores", ())[0][0]
+
+
+if __name__ == "__main__":
+    import sys
+    board = Leaderboard(sys.argv[1] if len(sys.argv) > 1 else DB_FILE)
+    levels = sorted({lvl for (lvl,) in board._query("SELECT DISTINCT level FROM scores", ())})
+    for lvl in levels:
+        print(f"Level {lvl}")
+        for i, (player, score, ts) in enumerate(board.top_for_level(lvl, 5), 1):
+            print(f"  {i}. {player:<16} {score:>6}  {time.strftime('%Y-%m-%d %H:%M', time.localtime(ts))}")
+    board.close()
+    print(f"{os.path.abspath(board.path)}: {len(levels)} level(s)")
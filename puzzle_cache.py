@@ -0,0 +1,129 @@
+import queue
+import threading
+from collections import OrderedDict, deque
+
+from Level import LevelManager
+
+
+def config_key(config):
+    return (config['size'], config['moves'], config['difficulty'])
+
+
+def level_config(level):
+    lm = LevelManager()
+    lm.current_level = level
+    return lm.get_current_config()
+
+
+class PuzzleCache:
+    """Bounded LRU cache of ready-made (grid, target) puzzles.
+
+    Puzzles are keyed by LevelManager config (size, moves, difficulty) and
+    handed out once each. A background thread fills keys asked for with
+    prefetch(), so GameEngine.reset_for_next_level() normally finds the next
+    board already generated and validated. When more than `capacity` puzzles
+    are held, the least recently used key is dropped first.
+    """
+
+    def __init__(self, capacity=32, per_key=1, make_engine=None):
+        self.capacity = capacity
+        self.per_key = per_key
+        self._make_engine = make_engine
+        self._entries = OrderedDict()   # key -> deque of puzzles, LRU order
+        self._size = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._pending = set()
+        self._engines = {}
+        self._thread = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.generated = 0
+
+    # --- CONSUMER SIDE (Tk / game thread) ---
+
+    def get(self, config):
+        key = config_key(config)
+        with self._lock:
+            bucket = self._entries.get(key)
+            if bucket:
+                self._entries.move_to_end(key)
+                self._size -= 1
+                self.hits += 1
+                return bucket.popleft()
+            self.misses += 1
+            return None
+
+    def prefetch(self, config):
+        key = config_key(config)
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        self._queue.put(key)
+        self.start()
+
+    def prefetch_level(self, level, ahead=1):
+        for lvl in range(level, level + ahead):
+            self.prefetch(level_config(lvl))
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses,
+                    "hit_rate": self.hits / total if total else 0.0,
+                    "evictions": self.evictions, "generated": self.generated,
+                    "cached": self._size}
+
+    # --- PRODUCER SIDE (background thread) ---
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="puzzle-prefetch", daemon=True)
+            self._thread.start()
+
+    def put(self, config, puzzle):
+        key = config_key(config)
+        with self._lock:
+            self._entries.setdefault(key, deque()).append(puzzle)
+            self._entries.move_to_end(key)
+            self._size += 1
+            while self._size > self.capacity:
+                old_key, bucket = next(iter(self._entries.items()))
+                bucket.popleft()
+                self._size -= 1
+                self.evictions += 1
+                if not bucket:
+                    del self._entries[old_key]
+
+    def _engine_for(self, key):
+        # One scratch engine per key; its reset_for_next_level() does the
+        # same generation + solver validation as the live game
+        engine = self._engines.get(key)
+        if engine is None:
+            from Game import GameEngine
+            lm = LevelManager()
+            lm.current_level = key[2]
+            engine = self._make_engine(lm) if self._make_engine else GameEngine(lm)
+            self._engines[key] = engine
+        else:
+            engine.reset_for_next_level()
+        return engine
+
+    def _run(self):
+        while True:
+            key = self._queue.get()
+            try:
+                while True:
+                    with self._lock:
+                        have = len(self._entries.get(key, ()))
+                    if have >= self.per_key:
+                        break
+                    engine = self._engine_for(key)
+                    config = {'size': key[0], 'moves': key[1], 'difficulty': key[2]}
+                    self.put(config, (engine.grid, engine.target_sum))
+                    self.generated += 1
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
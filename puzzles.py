@@ -0,0 +1,267 @@
+import argparse
+import json
+import random
+import struct
+import sys
+from array import array
+
+from Game import MAX_REROLLS
+from solver import PathSolver
+
+# NumPy is optional - the pure Python path produces the same layout
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+MAGIC = b"MSPZ"
+
+
+class PuzzleBatch:
+    """N puzzles of one size stored flat: grids[i*cells:(i+1)*cells], targets[i]."""
+
+    def __init__(self, size, grids, targets):
+        self.size = size
+        self.cells = size * size
+        self.grids = grids
+        self.targets = targets
+
+    def __len__(self):
+        return len(self.targets)
+
+    def grid(self, i):
+        flat = self.grids[i * self.cells:(i + 1) * self.cells]
+        return [[int(v) for v in flat[r * self.size:(r + 1) * self.size]] for r in range(self.size)]
+
+    def target(self, i):
+        return int(self.targets[i])
+
+    def puzzle(self, i):
+        return self.grid(i), self.target(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.puzzle(i)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(MAGIC + struct.pack("<II", self.size, len(self)))
+            # array('b'/'i') and NumPy int8/int32 arrays both expose tobytes()
+            f.write(self.grids.tobytes())
+            f.write(self.targets.tobytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            if f.read(4) != MAGIC:
+                raise ValueError(f"{path} is not a puzzle batch file")
+            size, n = struct.unpack("<II", f.read(8))
+            grids = array('b', f.read(n * size * size))
+            targets = array('i')
+            targets.frombytes(f.read(n * targets.itemsize))
+        return cls(size, grids, targets)
+
+
+def _neighbours(size):
+    # Flat index -> adjacent flat indices, same order GameEngine walks them
+    table = []
+    for i in range(size * size):
+        r, c = divmod(i, size)
+        adj = [(r, c + 1), (r + 1, c), (r, c - 1), (r - 1, c)]
+        table.append(tuple(nr * size + nc for nr, nc in adj if 0 <= nr < size and 0 <= nc < size))
+    return table
+
+
+def _batch_python(n, size, seed):
+    rng = random.Random(seed)
+    cells = size * size
+    grids = array('b', rng.choices(range(1, 10), k=n * cells))
+    targets = array('i', bytes(4 * n))
+    nbrs = _neighbours(size)
+    choice, randint = rng.choice, rng.randint
+
+    for p in range(n):
+        base = p * cells
+        # Same random walk as GameEngine._calculate_valid_target
+        pos = 0
+        total = grids[base]
+        visited = {0}
+        for _ in range(randint(3, size + 1) - 1):
+            adj = [q for q in nbrs[pos] if q not in visited]
+            if not adj: break
+            pos = choice(adj)
+            total += grids[base + pos]
+            visited.add(pos)
+        targets[p] = total
+    return PuzzleBatch(size, grids, targets)
+
+
+def _batch_numpy(n, size, seed):
+    rng = np.random.default_rng(seed)
+    cells = size * size
+    grids = rng.integers(1, 10, size=(n, cells), dtype=np.int8)
+
+    nbr = np.full((cells, 4), -1, dtype=np.intp)
+    for i, adj in enumerate(_neighbours(size)):
+        nbr[i, :len(adj)] = adj
+
+    rows = np.arange(n)
+    steps = rng.integers(3, size + 2, size=n) - 1
+    pos = np.zeros(n, dtype=np.intp)
+    visited = np.zeros((n, cells), dtype=bool)
+    visited[:, 0] = True
+    targets = grids[:, 0].astype(np.int32)
+    walking = np.ones(n, dtype=bool)
+
+    # All N walks advance together, one step per iteration
+    for step in range(size):
+        active = walking & (steps > step)
+        cand = nbr[pos]
+        valid = (cand >= 0) & ~visited[rows[:, None], np.maximum(cand, 0)] & active[:, None]
+        stuck = active & ~valid.any(axis=1)
+        walking &= ~stuck
+        move = active & ~stuck
+        pick = np.where(valid, rng.random((n, 4)), -1.0).argmax(axis=1)
+        pos = np.where(move, cand[rows, pick], pos)
+        visited[rows[move], pos[move]] = True
+        targets += np.where(move, grids[rows, pos], 0).astype(np.int32)
+
+    return PuzzleBatch(size, grids.reshape(-1), targets)
+
+
+def _is_degenerate(grid, target, moves):
+    # Same rule as GameEngine._generate_puzzle: unwinnable, or won in 1-2 clicks.
+    # Cells are 1-9, so only targets up to 18 can be won in 1-2 clicks - look
+    # for such a cell or adjacent pair before paying for the solver
+    size = len(grid)
+    if target <= 18:
+        for r in range(size):
+            row = grid[r]
+            for c in range(size):
+                v = row[c]
+                if v == target or (c + 1 < size and v + row[c + 1] == target) \
+                        or (r + 1 < size and v + grid[r + 1][c] == target):
+                    return True
+    # The target walk has at most size + 1 cells, so with that many moves the
+    # board is always winnable
+    if moves >= size + 1:
+        return False
+    return PathSolver(grid, target, moves).shortest_length() is None
+
+
+def _select(batch, indices):
+    """PuzzleBatch of the given puzzles of batch, in that order."""
+    cells = batch.cells
+    if HAS_NUMPY and isinstance(batch.targets, np.ndarray):
+        return PuzzleBatch(batch.size, batch.grids.reshape(-1, cells)[indices].reshape(-1), batch.targets[indices])
+    grids = array('b')
+    for i in indices:
+        grids += batch.grids[i * cells:(i + 1) * cells]
+    return PuzzleBatch(batch.size, grids, array('i', (batch.targets[i] for i in indices)))
+
+
+def _concat(parts):
+    if len(parts) == 1:
+        return parts[0]
+    if HAS_NUMPY and isinstance(parts[0].targets, np.ndarray):
+        return PuzzleBatch(parts[0].size, np.concatenate([p.grids for p in parts]),
+                           np.concatenate([p.targets for p in parts]))
+    grids, targets = array('b'), array('i')
+    for p in parts:
+        grids += p.grids
+        targets += p.targets
+    return PuzzleBatch(parts[0].size, grids, targets)
+
+
+def _reroll_seed(seed, attempt, use_numpy):
+    if seed is None:
+        return None
+    return [seed, attempt] if use_numpy else f"{seed}:{attempt}"
+
+
+def generate_batch(n, size, seed=None, use_numpy=None, moves=None, reject_degenerate=False):
+    """Generates n puzzles (grid + reachable target) of the given size at once.
+
+    With reject_degenerate=True, boards that cannot be won within `moves`
+    clicks (default size + 1, the longest target walk) or are won in 1-2
+    clicks are re-rolled like GameEngine does: the missing puzzles are
+    generated again, up to MAX_REROLLS times, and whatever is still
+    degenerate after that is kept. The check is off by default because it
+    runs per board in Python: about 10 us a board when `moves` covers the
+    target walk, but a PathSolver run (0.5-4 ms, 4x4-6x6) for boards that
+    pass the 1-2 click test when it does not - versus well under 1 us a
+    board for the generators themselves.
+
+    Output is reproducible for a given seed and backend; the NumPy and pure
+    Python backends use different random streams.
+    """
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    if use_numpy and not HAS_NUMPY:
+        raise RuntimeError("NumPy is not installed")
+    make = _batch_numpy if use_numpy else _batch_python
+    batch = make(n, size, seed)
+    if not reject_degenerate:
+        return batch
+
+    moves = size + 1 if moves is None else moves
+    parts = []
+    have = 0
+    for attempt in range(MAX_REROLLS + 1):
+        if attempt:
+            batch = make(n - have, size, _reroll_seed(seed, attempt, use_numpy))
+        good, bad = [], []
+        for i in range(len(batch)):
+            (bad if _is_degenerate(batch.grid(i), batch.target(i), moves) else good).append(i)
+        parts.append(_select(batch, good))
+        have += len(good)
+        if have == n:
+            break
+    else:
+        parts.append(_select(batch, bad))
+    return _concat(parts)
+
+
+def generate_for_level(n, level, seed=None, use_numpy=None, reject_degenerate=False):
+    from Level import LevelManager
+    lm = LevelManager()
+    lm.current_level = level
+    config = lm.get_current_config()
+    return generate_batch(n, config['size'], seed, use_numpy, moves=config['moves'],
+                          reject_degenerate=reject_degenerate)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-generate MindStrike puzzles in bulk.")
+    parser.add_argument("-n", "--count", type=int, default=1000)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--size", type=int, default=4)
+    group.add_argument("--level", type=int, help="take the grid size from LevelManager")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--pure", action="store_true", help="do not use NumPy")
+    parser.add_argument("--reject-degenerate", action="store_true",
+                        help="re-roll unwinnable and 1-2 click boards (much slower, see generate_batch)")
+    parser.add_argument("-o", "--output", help="write a .bin batch (or .jsonl) instead of a summary")
+    args = parser.parse_args(argv)
+
+    use_numpy = False if args.pure else None
+    if args.level is not None:
+        batch = generate_for_level(args.count, args.level, args.seed, use_numpy,
+                                   reject_degenerate=args.reject_degenerate)
+    else:
+        batch = generate_batch(args.count, args.size, args.seed, use_numpy,
+                               reject_degenerate=args.reject_degenerate)
+
+    if not args.output:
+        print(f"{len(batch)} puzzles of size {batch.size}, first target {batch.target(0) if len(batch) else '-'}")
+    elif args.output.endswith(".jsonl"):
+        with open(args.output, "w") as f:
+            for grid, target in batch:
+                f.write(json.dumps({"grid": grid, "target": target}) + "\n")
+    else:
+        batch.save(args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
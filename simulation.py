@@ -0,0 +1,240 @@
+import argparse
+import importlib
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import instrument
+from Game import GameEngine
+from Level import LevelManager
+from solver import PathSolver
+
+# Matches the Tk app: focus hitting 0 costs 50 points and refills to 50
+FOCUS_PENALTY = 50
+MAX_REJECTED = 100
+
+
+class SimClock:
+    """Manually advanced clock for GameEngine(clock=...)."""
+
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+# --- AGENTS ---
+# An agent picks the next cell for an engine, or None to give up the attempt.
+# think_time(rng) is how long the simulated player takes per click.
+
+class RandomAgent:
+    name = "random"
+
+    def think_time(self, rng):
+        return rng.uniform(0.5, 3.0)
+
+    def candidates(self, engine):
+        size = engine.grid_size
+        if not engine.path:
+            return [(r, c) for r in range(size) for c in range(size)]
+        r, c = engine.path[-1]
+        out = []
+        for nr, nc in ((r, c + 1), (r + 1, c), (r, c - 1), (r - 1, c)):
+            if 0 <= nr < size and 0 <= nc < size and not engine.visited & (1 << (nr * size + nc)):
+                out.append((nr, nc))
+        return out
+
+    def choose(self, engine, rng):
+        options = self.candidates(engine)
+        return rng.choice(options) if options else None
+
+
+class GreedyAgent(RandomAgent):
+    """Takes the biggest value that does not overshoot the target."""
+    name = "greedy"
+
+    def think_time(self, rng):
+        return rng.uniform(0.5, 1.5)
+
+    def choose(self, engine, rng):
+        room = engine.target_sum - engine.current_sum
+        options = [(engine.grid[r][c], rng.random(), (r, c)) for r, c in self.candidates(engine)]
+        fitting = [o for o in options if o[0] <= room]
+        if not fitting:
+            return None
+        return max(fitting)[2]
+
+
+class SolverAgent(RandomAgent):
+    """Plays a winning path found by the exhaustive solver."""
+    name = "solver"
+
+    def __init__(self):
+        self.plan = []
+
+    def think_time(self, rng):
+        return rng.uniform(0.3, 1.0)
+
+    def choose(self, engine, rng):
+        if not engine.path:
+            moves = engine.level_manager.get_current_config()['moves']
+            self.plan = PathSolver(engine.grid, engine.target_sum, moves).find_path() or []
+        step = len(engine.path)
+        return self.plan[step] if step < len(self.plan) else None
+
+
+AGENTS = {cls.name: cls for cls in (RandomAgent, GreedyAgent, SolverAgent)}
+
+
+def load_agent(spec):
+    """'greedy' or 'package.module:ClassName' for a custom strategy."""
+    if spec in AGENTS:
+        return AGENTS[spec]()
+    module, _, cls = spec.partition(":")
+    return getattr(importlib.import_module(module), cls)()
+
+
+# --- CAMPAIGN ---
+
+def play_campaign(agent_spec, seed, max_attempts=5):
+    """Plays all LevelManager levels headless; gives up after max_attempts losses on one level."""
+    rng = random.Random(seed)
+    clock = SimClock()
+    agent = load_agent(agent_spec)
+    lm = LevelManager()
+    engine = GameEngine(lm, clock=clock, rng=rng)
+    score = 0
+    moves = 0
+    levels = {}
+
+    while True:
+        stats = levels.setdefault(lm.current_level, [0, 0])  # attempts, wins
+        stats[0] += 1
+        result = "CONTINUE"
+        rejected = 0
+        while result == "CONTINUE":
+            cell = agent.choose(engine, rng)
+            if cell is None:
+                result = "LOSE"
+                break
+            # Focus drains from the simulated clock, like wall time in the app
+            clock.advance(agent.think_time(rng))
+            if engine.focus_level <= 0:
+                engine.focus_level = 50
+                score = max(0, score - FOCUS_PENALTY)
+            result = engine.process_move(*cell)
+            moves += 1
+            if result in ("ALREADY_VISITED", "INVALID_MOVE"):
+                # A misbehaving agent must not spin forever on one attempt
+                rejected += 1
+                result = "LOSE" if rejected > MAX_REJECTED else "CONTINUE"
+
+        if result == "WIN":
+            stats[1] += 1
+            score += engine.calculate_round_score()
+            if not lm.next_level():
+                break
+            engine.reset_for_next_level()
+        elif stats[0] >= max_attempts:
+            break
+        else:
+            engine.reset_current_level()
+
+    finished = lm.current_level == lm.max_levels and levels[lm.max_levels][1] > 0
+    return {"score": score, "level": lm.current_level, "finished": finished,
+            "moves": moves, "levels": levels}
+
+
+def _play_chunk(agent_spec, seeds, max_attempts):
+    return [play_campaign(agent_spec, s, max_attempts) for s in seeds]
+
+
+def _percentile(sorted_vals, pct):
+    if not sorted_vals:
+        return 0
+    return sorted_vals[min(len(sorted_vals) - 1, int(len(sorted_vals) * pct / 100))]
+
+
+def run(campaigns, agent_spec="greedy", workers=None, seed=0, max_attempts=5, chunk=50):
+    """Runs campaigns across a process pool and aggregates the results."""
+    seeds = [seed * 1_000_003 + i for i in range(campaigns)]
+    chunks = [seeds[i:i + chunk] for i in range(0, len(seeds), chunk)]
+    start = time.perf_counter()
+    results = []
+    if workers == 1:
+        for c in chunks:
+            results.extend(_play_chunk(agent_spec, c, max_attempts))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_play_chunk, agent_spec, c, max_attempts) for c in chunks]
+            for f in futures:
+                results.extend(f.result())
+    elapsed = time.perf_counter() - start
+    return summarize(results, elapsed, agent_spec)
+
+
+def summarize(results, elapsed, agent_spec):
+    scores = sorted(r["score"] for r in results)
+    per_level = {}
+    for r in results:
+        for lvl, (attempts, wins) in r["levels"].items():
+            agg = per_level.setdefault(lvl, [0, 0])
+            agg[0] += attempts
+            agg[1] += wins
+    total_moves = sum(r["moves"] for r in results)
+    n = len(results) or 1
+    return {
+        "agent": agent_spec,
+        "campaigns": len(results),
+        "finished_rate": sum(r["finished"] for r in results) / n,
+        "score": {"mean": sum(scores) / n, "min": scores[0] if scores else 0,
+                  "p10": _percentile(scores, 10), "p50": _percentile(scores, 50),
+                  "p90": _percentile(scores, 90), "max": scores[-1] if scores else 0},
+        "win_rate_per_level": {lvl: round(w / a, 3) for lvl, (a, w) in sorted(per_level.items())},
+        "reached_per_level": {lvl: sum(1 for r in results if r["level"] >= lvl) for lvl in sorted(per_level)},
+        "elapsed_s": round(elapsed, 3),
+        "campaigns_per_s": round(len(results) / elapsed, 1) if elapsed else None,
+        "moves_per_s": round(total_moves / elapsed) if elapsed else None,
+    }
+
+
+def print_report(summary):
+    s = summary["score"]
+    print(f"agent={summary['agent']} campaigns={summary['campaigns']} "
+          f"finished={summary['finished_rate'] * 100:.1f}%")
+    print(f"score  mean {s['mean']:.0f} | min {s['min']} p10 {s['p10']} p50 {s['p50']} p90 {s['p90']} max {s['max']}")
+    print("level  win-rate  reached")
+    for lvl, rate in summary["win_rate_per_level"].items():
+        print(f"  {lvl:>3}   {rate * 100:6.1f}%  {summary['reached_per_level'][lvl]:>7}")
+    print(f"throughput {summary['campaigns_per_s']} campaigns/s, {summary['moves_per_s']} moves/s "
+          f"({summary['elapsed_s']} s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless MindStrike campaign simulator.")
+    parser.add_argument("--campaigns", type=int, default=1000)
+    parser.add_argument("--agent", default="greedy", help=f"{', '.join(AGENTS)} or module:Class")
+    parser.add_argument("--workers", type=int, help="process count (1 = run in-process)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-attempts", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    # Timings and the profile cover this process only, so pair them with --workers 1
+    instrument.add_arguments(parser)
+    args = parser.parse_args(argv)
+    instrument.configure(args)
+
+    summary = run(args.campaigns, args.agent, args.workers, args.seed, args.max_attempts)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
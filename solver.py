@@ -0,0 +1,141 @@
+import sys
+
+
+class PathSolver:
+    """Exhaustive solver for a MindStrike board.
+
+    A solution is a simple path of orthogonally adjacent cells, starting
+    anywhere, of at most max_moves cells, whose values add up to target.
+    Cells are always 1-9, so a running sum only grows: a branch is cut as
+    soon as it overshoots, or when even all 9s could not reach the target in
+    the moves left. Visited cells are a bitmask, and (cell, mask, remaining)
+    states are memoised - different orders over the same cells ending on
+    the same cell share one count.
+    """
+
+    def __init__(self, grid, target, max_moves):
+        self.size = len(grid)
+        self.values = [v for row in grid for v in row]
+        self.target = target
+        self.max_moves = max_moves
+        self.nbrs = []
+        for i in range(self.size * self.size):
+            r, c = divmod(i, self.size)
+            adj = [(r, c + 1), (r + 1, c), (r, c - 1), (r - 1, c)]
+            self.nbrs.append(tuple(nr * self.size + nc for nr, nc in adj
+                                   if 0 <= nr < self.size and 0 <= nc < self.size))
+        self._memo = {}
+
+    def _solve(self, pos, mask, remaining, moves):
+        """(solutions, fewest extra cells) for `remaining` > 0 still to collect in <= moves cells"""
+        if remaining > 9 * moves:
+            return 0, None
+        key = (pos, mask, remaining)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        total, best = 0, None
+        values = self.values
+        for q in self.nbrs[pos]:
+            bit = 1 << q
+            if mask & bit:
+                continue
+            v = values[q]
+            if v == remaining:
+                total, best = total + 1, 1
+            elif v < remaining and moves > 1:
+                count, length = self._solve(q, mask | bit, remaining - v, moves - 1)
+                if count:
+                    total += count
+                    if best is None or length + 1 < best:
+                        best = length + 1
+        self._memo[key] = total, best
+        return total, best
+
+    def _summary(self):
+        # Memo is shared, so repeated calls only walk the start cells again
+        total, best = 0, None
+        for start, v in enumerate(self.values):
+            if v == self.target:
+                total, best = total + 1, 1
+            elif v < self.target and self.max_moves > 1:
+                count, length = self._solve(start, 1 << start, self.target - v, self.max_moves - 1)
+                if count:
+                    total += count
+                    if best is None or length + 1 < best:
+                        best = length + 1
+        return total, best
+
+    def count_paths(self):
+        """Number of distinct click sequences that win the board."""
+        return self._summary()[0]
+
+    def shortest_length(self):
+        """Fewest clicks needed to win, or None if the board cannot be won."""
+        return self._summary()[1]
+
+    def iter_paths(self, limit=None):
+        """Yields winning paths as lists of (row, col), depth-first from each start cell."""
+        found = 0
+        path = []
+
+        def walk(pos, mask, remaining, moves):
+            nonlocal found
+            path.append(pos)
+            v = self.values[pos]
+            if v == remaining:
+                found += 1
+                yield [divmod(p, self.size) for p in path]
+            elif v < remaining and moves > 1 and remaining - v <= 9 * (moves - 1):
+                for q in self.nbrs[pos]:
+                    if not mask & (1 << q):
+                        yield from walk(q, mask | (1 << q), remaining - v, moves - 1)
+                        if limit is not None and found >= limit:
+                            break
+            path.pop()
+
+        for start in range(len(self.values)):
+            yield from walk(start, 1 << start, self.target, self.max_moves)
+            if limit is not None and found >= limit:
+                return
+
+    def find_path(self):
+        return next(self.iter_paths(limit=1), None)
+
+    def is_solvable(self):
+        return self.find_path() is not None
+
+    def rate(self):
+        """Difficulty summary: fewer and longer solutions make a harder board."""
+        solutions, shortest = self._summary()
+        if not solutions:
+            score = None
+        else:
+            # Rarer solutions and longer minimum paths both push the score up
+            score = round((shortest / self.max_moves) * 50 + 50 / solutions ** 0.5, 1)
+        return {"solutions": solutions, "shortest": shortest, "score": score}
+
+
+def count_solutions(grid, target, max_moves):
+    return PathSolver(grid, target, max_moves).count_paths()
+
+
+def is_degenerate(grid, target, max_moves, min_length=3):
+    """True for boards that cannot be won or can be won in fewer than min_length clicks."""
+    shortest = PathSolver(grid, target, max_moves).shortest_length()
+    return shortest is None or shortest < min_length
+
+
+if __name__ == "__main__":
+    import time
+    from Game import GameEngine
+    from Level import LevelManager
+
+    lm = LevelManager()
+    lm.current_level = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    engine = GameEngine(lm)
+    start = time.perf_counter()
+    rating = PathSolver(engine.grid, engine.target_sum, lm.get_current_config()['moves']).rate()
+    print(f"level {lm.current_level}: target {engine.target_sum}, {rating} "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms")
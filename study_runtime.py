@@ -0,0 +1,374 @@
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+import instrument
+from StudyAlert import MAX_SLEEP, AlertIntervals, MentorEngine, StudyAlert, StudyAlertApp, StudyScheduler
+
+FOCUS_TICK = 60  # Countdown is printed once a minute, not every second
+
+
+class AsyncNotifier:
+    """Hands notifications to a thread pool; send() returns immediately.
+
+    A slow or hanging desktop backend (plyer) only ties up a pool thread,
+    never the event loop, so the next alert still fires on time.
+    """
+
+    def __init__(self, workers: int = 4, deliver=MentorEngine.send_notification):
+        self.deliver = deliver
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notify")
+        self.sent = 0
+        self.delivered = 0
+        self.failed = 0
+        self._pending = set()
+
+    def send(self, title: str, message: str, urgent: bool = False):
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, self.deliver, title, message, urgent)
+        self.sent += 1
+        self._pending.add(future)
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        self._pending.discard(future)
+        if future.cancelled() or future.exception() is not None:
+            self.failed += 1
+        else:
+            self.delivered += 1
+
+    async def drain(self, timeout: float = 5.0):
+        if self._pending:
+            await asyncio.wait(list(self._pending), timeout=timeout)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncStudyScheduler(StudyScheduler):
+    """StudyScheduler run as an asyncio task and shared by many profiles.
+
+    Same heap and repeat rules as StudyScheduler; instead of a thread waiting
+    on the condition variable, run() awaits an asyncio.Event that add() /
+    remove() set (thread-safely). Each alert remembers the profile it
+    belongs to, and the midnight re-arm walks every attached profile.
+    """
+
+    def __init__(self, notifier: AsyncNotifier, clock=time.time):
+        super().__init__(None, clock)
+        self.notifier = notifier
+        self.apps: Dict[int, StudyAlertApp] = {}
+        self.owners: Dict[int, StudyAlertApp] = {}  # id(alert) -> profile
+        self._wake = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _changed(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def attach(self, app: StudyAlertApp) -> "ProfileScheduler":
+        with self._cond:
+            self.apps[id(app)] = app
+            now = self.clock()
+            stale = False
+            for alert in app.alerts:
+                self.owners[id(alert)] = app
+                stale |= self.refresh_status(alert, now)
+                self._arm(alert, now)
+            self._changed()
+        if stale:
+            app.save_state()
+        app.scheduler = ProfileScheduler(self, app)
+        return app.scheduler
+
+    def detach(self, app: StudyAlertApp):
+        with self._cond:
+            if self.apps.pop(id(app), None) is None:
+                return
+            for alert in app.alerts:
+                self.owners.pop(id(alert), None)
+                self._disarm(alert)
+            self._changed()
+
+    def add(self, alert: StudyAlert, owner: Optional[StudyAlertApp] = None):
+        with self._cond:
+            if owner is not None:
+                self.owners[id(alert)] = owner
+            self._arm(alert, self.clock())
+            self._changed()
+
+    def remove(self, alert: StudyAlert):
+        with self._cond:
+            self.owners.pop(id(alert), None)
+            self._disarm(alert)
+            self._changed()
+
+    def rebuild(self):
+        with self._cond:
+            now = self.clock()
+            self._heap = []
+            self._entries = {}
+            stale = set()
+            for app in self.apps.values():
+                for alert in app.alerts:
+                    if self.refresh_status(alert, now):
+                        stale.add(app)
+                    self._arm(alert, now)
+            self._push(self._next_midnight(now), self._MIDNIGHT)
+            self._changed()
+        for app in stale:
+            app.save_state()
+
+    async def run(self):
+        self._loop = asyncio.get_running_loop()
+        self.rebuild()
+        while self.running:
+            self._wake.clear()
+            with self._cond:
+                when, item = self._pop_ready()
+            if item is not None:
+                self._dispatch(when, item)
+                continue
+            timeout = MAX_SLEEP if when is None else min(when, MAX_SLEEP)
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self):
+        self.running = False
+        self._changed()
+
+    def rearm_day(self):
+        for app in list(self.apps.values()):
+            for alert in app.alerts:
+                if alert.repeat != "Once" and alert.status != "Pending":
+                    alert.status = "Pending"
+            app.save_state()
+
+    def trigger_alert(self, alert: StudyAlert):
+        self.fired += 1
+        self.mark(alert, "Notified")
+        owner = self.owners.get(id(alert))
+        who = f" ({owner.profile.name})" if owner is not None and owner.profile else ""
+        self.notifier.send(
+            f"STUDY SESSION STARTING{who}",
+            f"Subject: {alert.subject}\nTopic: {alert.topic}\nDuration: {alert.duration_mins}m",
+            True,
+        )
+
+
+class ProfileScheduler:
+    """What StudyAlertApp sees as its `scheduler` when attached to the shared one."""
+
+    def __init__(self, shared: AsyncStudyScheduler, app: StudyAlertApp):
+        self.shared = shared
+        self.app = app
+
+    def add(self, alert: StudyAlert):
+        self.shared.add(alert, self.app)
+
+    def remove(self, alert: StudyAlert):
+        self.shared.remove(alert)
+
+    def reschedule(self, alert: StudyAlert):
+        self.shared.remove(alert)
+        self.shared.add(alert, self.app)
+
+    def stop(self):
+        self.shared.detach(self.app)
+
+
+class StdinReader:
+    """Reads stdin lines on a daemon thread and feeds them to the loop.
+
+    A daemon thread (rather than run_in_executor) so a pending input() never
+    keeps the process alive after the runtime exits.
+    """
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._lines: asyncio.Queue = asyncio.Queue()
+        threading.Thread(target=self._read, name="stdin", daemon=True).start()
+
+    def _read(self):
+        for line in sys.stdin:
+            self._loop.call_soon_threadsafe(self._lines.put_nowait, line.rstrip("\n"))
+        self._loop.call_soon_threadsafe(self._lines.put_nowait, None)
+
+    async def ask(self, prompt: str) -> str:
+        print(prompt, end="", flush=True)
+        line = await self._lines.get()
+        if line is None:
+            raise EOFError
+        return line
+
+
+class AsyncCLI:
+    """The StudyAlertApp dashboard with every wait turned into an await."""
+
+    def __init__(self, app: StudyAlertApp, stdin: StdinReader):
+        self.app = app
+        self.stdin = stdin
+        self.focus_task: Optional[asyncio.Task] = None
+
+    async def history(self):
+        # The history streams in on a thread; wait for it without blocking the loop
+        if not self.app.logs_loaded.is_set():
+            await asyncio.get_running_loop().run_in_executor(None, self.app.logs_loaded.wait)
+
+    async def focus(self, duration_mins: int, subject: str, topic: str):
+        print(f"\n🔥 FOCUS MODE ACTIVATED: {subject} - {topic} 🔥")
+        print("No excuses. No snoozing. Finish the mission.")
+        loop = asyncio.get_running_loop()
+        end = loop.time() + duration_mins * 60
+        try:
+            while (remaining := end - loop.time()) > 0:
+                mins, secs = divmod(int(remaining + 0.5), 60)
+                print(f"\n[FOCUS] Remaining: {mins:02d}:{secs:02d} | Goal: {self.app.profile.goal}")
+                await asyncio.sleep(min(remaining, FOCUS_TICK))
+        except asyncio.CancelledError:
+            print("\n❌ SESSION ABANDONED. This will reflect in your discipline report.")
+            await self.history()
+            self.app.log_session(subject, 0, "Skipped")
+            raise
+        print("\n✅ Session Completed!")
+        await self.history()
+        self.app.log_session(subject, duration_mins, "Completed")
+
+    async def start_focus(self, duration_mins: int, subject: str, topic: str = "Intensive"):
+        if self.focus_task is not None and not self.focus_task.done():
+            if (await self.stdin.ask("A focus session is running. Abandon it? (y/n) ")).lower() != "y":
+                return
+            self.focus_task.cancel()
+        self.focus_task = asyncio.create_task(self.focus(duration_mins, subject, topic))
+        await asyncio.sleep(0)  # Let it start before the next prompt
+
+    async def ask_int(self, prompt: str, low: int = 1, high: Optional[int] = None) -> Optional[int]:
+        """Reads a whole number in [low, high]; prints an error and returns None otherwise."""
+        text = await self.stdin.ask(prompt)
+        try:
+            value = int(text)
+        except ValueError:
+            value = None
+        if value is None or value < low or (high is not None and value > high):
+            limit = f"{low}-{high}" if high is not None else f"at least {low}"
+            print(f"Error: expected a whole number ({limit}), got {text!r}")
+            return None
+        return value
+
+    async def manage_alerts(self):
+        print("\n--- CURRENT SCHEDULE ---")
+        for i, a in enumerate(self.app.alerts):
+            print(f"{i+1}. [{a.start_time}] {a.subject} - {a.topic} ({a.duration_mins}m) | {a.status}"
+                  + self.app.invalid_note(a))
+        cmd = await self.stdin.ask("\na) Add Alert  d) Delete Alert  b) Back\n>> ")
+        if cmd == "a":
+            print("\n--- ADD NEW STUDY ALERT ---")
+            sub = await self.stdin.ask("Subject: ")
+            topic = await self.stdin.ask("Topic: ")
+            t_start = await self.stdin.ask("Start Time (HH:MM 24h): ")
+            try:
+                AlertIntervals.minute_of_day(t_start)
+            except ValueError:
+                print(f"Error: start time must be HH:MM (24h), got {t_start!r}")
+                return
+            dur = await self.ask_int("Duration (minutes): ")
+            if dur is None:
+                return
+            if self.app.schedule_alert(StudyAlert(sub, topic, t_start, dur)):
+                print("Alert scheduled successfully.")
+            else:
+                print("Error: Conflict with existing alert!")
+        elif cmd == "d":
+            idx = await self.ask_int("Index to delete: ", 1, len(self.app.alerts))
+            if idx is not None:
+                self.app.delete_alert(idx - 1)
+
+    async def run(self):
+        app = self.app
+        try:
+            while True:
+                if app.load_error is not None:
+                    print(f"\n⚠️  Session history failed to load ({app.load_error}); nothing is saved this run.")
+                print(f"\n--- {app.profile.name.upper()}'S DASHBOARD ---")
+                print("1. View/Add Study Alerts")
+                print("2. Manual Focus Mode (Timer)")
+                print("3. Emergency Study Mode (90m Hardcore)")
+                print("4. Discipline Analytics")
+                print("5. Reset All Alerts for Today")
+                print("6. Exit")
+                choice = await self.stdin.ask("\nAction >> ")
+                if choice == "1":
+                    await self.manage_alerts()
+                elif choice == "2":
+                    sub = await self.stdin.ask("Subject: ")
+                    dur = await self.ask_int("Duration (mins): ")
+                    if dur is not None:
+                        await self.start_focus(dur, sub)
+                elif choice == "3":
+                    await self.start_focus(90, "HARDCORE", "Emergency Discipline")
+                elif choice == "4":
+                    await self.history()
+                    app.show_analytics()
+                elif choice == "5":
+                    for a in app.alerts: a.status = "Pending"
+                    print("All alerts reset.")
+                elif choice == "6":
+                    print("Mentor: Remember, results follow consistency. Goodbye.")
+                    break
+        except EOFError:
+            pass
+        finally:
+            if self.focus_task is not None and not self.focus_task.done():
+                self.focus_task.cancel()
+                await asyncio.gather(self.focus_task, return_exceptions=True)
+
+
+class StudyRuntime:
+    """One event loop running the shared scheduler, notifications and profiles."""
+
+    def __init__(self, clock=time.time, notify_workers: int = 4, deliver=MentorEngine.send_notification):
+        self.notifier = AsyncNotifier(notify_workers, deliver)
+        self.scheduler = AsyncStudyScheduler(self.notifier, clock)
+        self.apps = []
+
+    def attach(self, app: StudyAlertApp):
+        self.apps.append(app)
+        return self.scheduler.attach(app)
+
+    async def serve(self, main=None):
+        """Runs the scheduler until `main` (a coroutine) finishes, or forever."""
+        scheduler = asyncio.create_task(self.scheduler.run())
+        try:
+            if main is None:
+                await scheduler
+            else:
+                await main
+        finally:
+            self.scheduler.stop()
+            await asyncio.gather(scheduler, return_exceptions=True)
+            await self.notifier.drain()
+            self.notifier.close()
+            for app in self.apps:
+                app.shutdown()
+
+    async def run_cli(self, app: StudyAlertApp):
+        self.attach(app)
+        await self.serve(AsyncCLI(app, StdinReader()).run())
+
+
+def main():
+    instrument.configure()
+    app = StudyAlertApp()
+    try:
+        asyncio.run(StudyRuntime().run_cli(app))
+    except KeyboardInterrupt:
+        print("\nApp closed. Stay disciplined.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,462 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import signal
+import sys
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from datetime import date
+from typing import Dict, List, Optional
+
+import instrument
+from StudyAlert import (DATA_FILE, LOG_FILE, AlertIntervals, StorageManager, StudyAlert, StudyAlertApp,
+                        UserProfile)
+from study_runtime import AsyncStudyScheduler
+
+# resource is Unix-only; /stats just leaves the field out elsewhere
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
+
+USER_ID = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+HH_MM = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
+INBOX_SIZE = 100
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 409: "Conflict", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def storage_for(root: str, user_id: str) -> StorageManager:
+    """root/<2 hex chars of sha1>/<user_id>/, so no directory holds thousands of entries."""
+    shard = hashlib.sha1(user_id.encode()).hexdigest()[:2]
+    folder = os.path.join(root, shard, user_id)
+    return StorageManager(os.path.join(folder, DATA_FILE), os.path.join(folder, LOG_FILE))
+
+
+class ServiceScheduler(AsyncStudyScheduler):
+    """One heap holding every user's alerts, whether the profile is loaded or not.
+
+    Alerts are owned by user id. Their StudyAlert objects stay here for the
+    life of the server and a loaded StudyAlertApp shares the same list, so
+    evicting a profile never drops its alerts. Notifications go to the
+    user's inbox (GET /users/<id>/notifications).
+    """
+
+    def __init__(self, service: "StudyService", clock=time.time):
+        super().__init__(None, clock)
+        self.service = service
+        self.user_alerts: Dict[str, List[StudyAlert]] = {}
+
+    def register(self, user_id: str, alerts: List[StudyAlert]):
+        with self._cond:
+            self.user_alerts[user_id] = alerts
+            now = self.clock()
+            for alert in alerts:
+                self.owners[id(alert)] = user_id
+                # Written with the profile's next save, as after midnight
+                self.refresh_status(alert, now)
+                self._arm(alert, now)
+            self._changed()
+
+    def rebuild(self):
+        with self._cond:
+            now = self.clock()
+            self._heap = []
+            self._entries = {}
+            for alerts in self.user_alerts.values():
+                for alert in alerts:
+                    self.refresh_status(alert, now)
+                    self._arm(alert, now)
+            self._push(self._next_midnight(now), self._MIDNIGHT)
+            self._changed()
+
+    def rearm_day(self):
+        for alerts in self.user_alerts.values():
+            for alert in alerts:
+                if alert.repeat != "Once" and alert.status != "Pending":
+                    alert.status = "Pending"
+        # Unloaded profiles pick the reset up from here when next loaded
+        for app in self.service.loaded.values():
+            app.save_state()
+
+    def trigger_alert(self, alert: StudyAlert):
+        self.fired += 1
+        self.mark(alert, "Notified")
+        user_id = self.owners.get(id(alert))
+        if user_id is not None:
+            self.service.notify(user_id, {
+                "title": "STUDY SESSION STARTING",
+                "subject": alert.subject, "topic": alert.topic,
+                "start_time": alert.start_time, "duration_mins": alert.duration_mins,
+                "at": time.time(),
+            })
+
+
+class UserScheduler:
+    """StudyAlertApp.scheduler for a service profile (see ProfileScheduler)."""
+
+    def __init__(self, shared: ServiceScheduler, user_id: str):
+        self.shared = shared
+        self.user_id = user_id
+
+    def add(self, alert: StudyAlert):
+        self.shared.add(alert, self.user_id)
+
+    def remove(self, alert: StudyAlert):
+        self.shared.remove(alert)
+
+    def reschedule(self, alert: StudyAlert):
+        self.shared.remove(alert)
+        self.shared.add(alert, self.user_id)
+
+    def stop(self):
+        # Unloading a profile keeps its alerts armed
+        pass
+
+
+class StudyService:
+    """Many StudyAlert profiles in one process.
+
+    Each user's files live in their own shard directory (storage_for). At
+    start-up only profiles' alerts are read, to fill the shared scheduler.
+    A full StudyAlertApp (history, rollups, writer thread) is loaded on
+    first use and kept in an LRU of at most `max_loaded`. The least recently
+    used idle profile is flushed and unloaded when the LRU is full. Loading
+    and unloading run on a thread pool so the event loop never waits on disk.
+    """
+
+    def __init__(self, root: str, max_loaded: int = 256, clock=time.time, io_workers: int = 8):
+        self.root = root
+        self.max_loaded = max_loaded
+        self.scheduler = ServiceScheduler(self, clock)
+        self.loaded: "OrderedDict[str, StudyAlertApp]" = OrderedDict()
+        self.inbox: Dict[str, deque] = {}
+        self.executor = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="profile-io")
+        self._loading: Dict[str, asyncio.Future] = {}
+        self._closing: Dict[str, asyncio.Future] = {}
+        self._evicting: Optional[asyncio.Task] = None
+        self._busy: Dict[str, int] = {}
+        self.loads = 0
+        self.evictions = 0
+        self.requests = 0
+
+    # --- PROFILES ---
+
+    def scan(self) -> int:
+        """Registers the alerts of every profile on disk; returns the user count."""
+        if not os.path.isdir(self.root):
+            return 0
+        for shard in os.listdir(self.root):
+            shard_path = os.path.join(self.root, shard)
+            if not os.path.isdir(shard_path):
+                continue
+            for user_id in os.listdir(shard_path):
+                stream = storage_for(self.root, user_id).iter_load()
+                if stream is None:
+                    continue
+                alerts = []
+                for key, value in stream:
+                    if key == "alerts":
+                        alerts = [StudyAlert(**a) for a in value]
+                        break
+                stream.close()
+                self.scheduler.register(user_id, alerts)
+        return len(self.scheduler.user_alerts)
+
+    @instrument.timed("StudyService.open")
+    def _open(self, user_id: str, create: Optional[UserProfile]) -> StudyAlertApp:
+        storage = storage_for(self.root, user_id)
+        exists = os.path.exists(storage.data_file)
+        if create is None and not exists:
+            raise HTTPError(404, f"no such user: {user_id}")
+        if create is not None and exists:
+            raise HTTPError(409, f"user exists: {user_id}")
+        os.makedirs(os.path.dirname(storage.data_file), exist_ok=True)
+        app = StudyAlertApp(storage, profile=create)
+        app.scheduler = UserScheduler(self.scheduler, user_id)
+        shared = self.scheduler.user_alerts.get(user_id)
+        if shared is None:
+            self.scheduler.register(user_id, app.alerts)
+        else:
+            # The scheduler's objects carry today's statuses; the file may be older
+            app.alerts = shared
+            app.slots = AlertIntervals(shared)
+        return app
+
+    @instrument.timed("StudyService.close")
+    def _close(self, app: StudyAlertApp):
+        app.shutdown()
+
+    async def _load(self, user_id: str, create: Optional[UserProfile] = None) -> StudyAlertApp:
+        closing = self._closing.get(user_id)
+        if closing is not None:
+            # Still flushing after eviction; reading the files now would miss that write
+            await asyncio.wait([closing])
+        app = self.loaded.get(user_id)
+        if app is not None:
+            if create is not None:
+                raise HTTPError(409, f"user exists: {user_id}")
+            self.loaded.move_to_end(user_id)
+            return app
+        pending = self._loading.get(user_id)
+        if pending is not None:
+            return await pending
+
+        loop = asyncio.get_running_loop()
+        pending = self._loading[user_id] = loop.create_future()
+        try:
+            app = await loop.run_in_executor(self.executor, self._open, user_id, create)
+        except BaseException as e:
+            pending.set_exception(e)
+            pending.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            del self._loading[user_id]
+        self.loaded[user_id] = app
+        self.loads += 1
+        pending.set_result(app)
+        return app
+
+    async def _evict(self):
+        loop = asyncio.get_running_loop()
+        while len(self.loaded) > self.max_loaded:
+            idle = [u for u in self.loaded if not self._busy.get(u)]
+            victims = idle[:len(self.loaded) - self.max_loaded]
+            if not victims:
+                return
+            closes = []
+            for user_id in victims:
+                app = self.loaded.pop(user_id)
+                self.evictions += 1
+                self._closing[user_id] = loop.run_in_executor(self.executor, self._close, app)
+                closes.append(user_id)
+            await asyncio.gather(*(self._closing[u] for u in closes), return_exceptions=True)
+            for user_id in closes:
+                del self._closing[user_id]
+
+    @asynccontextmanager
+    async def using(self, user_id: str, create: Optional[UserProfile] = None):
+        """Loads (or creates) a profile and pins it in memory for one request."""
+        if not USER_ID.match(user_id):
+            raise HTTPError(400, "user id must be 1-64 of [A-Za-z0-9_.-]")
+        self._busy[user_id] = self._busy.get(user_id, 0) + 1
+        try:
+            yield await self._load(user_id, create)
+        finally:
+            self._busy[user_id] -= 1
+            if not self._busy[user_id]:
+                del self._busy[user_id]
+        if len(self.loaded) > self.max_loaded and (self._evicting is None or self._evicting.done()):
+            # In the background, so no request waits for another profile's flush
+            self._evicting = asyncio.create_task(self._evict())
+
+    async def history(self, app: StudyAlertApp):
+        if not app.logs_loaded.is_set():
+            await asyncio.get_running_loop().run_in_executor(self.executor, app.logs_loaded.wait)
+        if app.load_error is not None:
+            raise HTTPError(500, f"session history failed to load: {app.load_error}")
+
+    def notify(self, user_id: str, message: Dict):
+        self.inbox.setdefault(user_id, deque(maxlen=INBOX_SIZE)).append(message)
+
+    # --- API ---
+
+    async def create_user(self, user_id: str, body: Dict):
+        profile = UserProfile(str(body["name"]), str(body.get("goal", "")), int(body.get("daily_hours_goal", 0)))
+        async with self.using(user_id, create=profile) as app:
+            return 201, {"profile": asdict(app.profile)}
+
+    async def get_user(self, user_id: str, body: Dict):
+        async with self.using(user_id) as app:
+            return 200, {"profile": asdict(app.profile), "alerts": [asdict(a) for a in app.alerts]}
+
+    async def add_alert(self, user_id: str, body: Dict):
+        if not HH_MM.match(str(body.get("start_time", ""))):
+            raise HTTPError(400, "start_time must be HH:MM (24h)")
+        alert = StudyAlert(str(body["subject"]), str(body.get("topic", "")), body["start_time"],
+                           int(body["duration_mins"]), str(body.get("repeat", "Daily")))
+        async with self.using(user_id) as app:
+            if not app.schedule_alert(alert):
+                slot = app.slots.next_free(alert.duration_mins, alert.start_time, alert.repeat)
+                raise HTTPError(409, f"overlaps an existing alert; next free slot {slot or 'none'}")
+            return 201, {"index": len(app.alerts) - 1, "alert": asdict(alert)}
+
+    async def delete_alert(self, user_id: str, index: str):
+        async with self.using(user_id) as app:
+            idx = int(index)
+            if not 0 <= idx < len(app.alerts):
+                raise HTTPError(404, f"no alert {idx}")
+            return 200, {"deleted": asdict(app.delete_alert(idx))}
+
+    async def log_session(self, user_id: str, body: Dict):
+        if body.get("status") not in ("Completed", "Skipped"):
+            raise HTTPError(400, "status must be Completed or Skipped")
+        async with self.using(user_id) as app:
+            await self.history(app)
+            app.log_session(str(body["subject"]), int(body.get("minutes", 0)), body["status"])
+            return 201, {"sessions": app.rollup.completed + app.rollup.skipped}
+
+    async def report(self, user_id: str, body: Dict):
+        async with self.using(user_id) as app:
+            await self.history(app)
+            rollup = app.rollup
+            today = date.today()
+            total = rollup.completed + rollup.skipped
+            return 200, {
+                "today_minutes": rollup.day(today)[0],
+                "completed": rollup.completed,
+                "skipped": rollup.skipped,
+                "consistency": rollup.completed / total if total else 1.0,
+                "week_minutes": rollup.window(today, 7)[0],
+                "month_minutes": rollup.window(today, 30)[0],
+                "streak": rollup.current_streak(today),
+                "best_streak": rollup.longest_streak,
+                "subjects": {s: {"minutes": m, "completed": c, "skipped": k}
+                             for s, (m, c, k) in rollup.subjects()},
+            }
+
+    async def notifications(self, user_id: str, body: Dict):
+        messages = self.inbox.pop(user_id, ())
+        return 200, {"notifications": list(messages)}
+
+    async def stats(self):
+        out = {"users": len(self.scheduler.user_alerts), "loaded": len(self.loaded),
+               "max_loaded": self.max_loaded, "loads": self.loads, "evictions": self.evictions,
+               "alerts_fired": self.scheduler.fired, "requests": self.requests,
+               "next_alert": self.scheduler.next_due()}
+        if HAS_RESOURCE:
+            # ru_maxrss is KiB on Linux
+            out["max_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+        return 200, out
+
+    async def dispatch(self, method: str, path: str, body: Dict):
+        parts = [p for p in path.split("?", 1)[0].split("/") if p]
+        if parts == ["stats"] and method == "GET":
+            return await self.stats()
+        if len(parts) < 2 or parts[0] != "users":
+            raise HTTPError(404, f"no route for {path}")
+        user_id, rest = parts[1], parts[2:]
+        routes = {
+            ("POST", ()): self.create_user,
+            ("GET", ()): self.get_user,
+            ("POST", ("alerts",)): self.add_alert,
+            ("POST", ("sessions",)): self.log_session,
+            ("GET", ("report",)): self.report,
+            ("GET", ("notifications",)): self.notifications,
+        }
+        if method == "DELETE" and len(rest) == 2 and rest[0] == "alerts":
+            return await self.delete_alert(user_id, rest[1])
+        handler = routes.get((method, tuple(rest)))
+        if handler is None:
+            raise HTTPError(405 if any(r == tuple(rest) for _, r in routes) else 404, f"{method} {path}")
+        return await handler(user_id, body)
+
+    # --- HTTP ---
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Minimal HTTP/1.1 with keep-alive: JSON bodies in, JSON out."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                raw = await reader.readexactly(length) if length else b""
+
+                self.requests += 1
+                with instrument.timer("StudyService.request"):
+                    try:
+                        body = json.loads(raw) if raw else {}
+                        if not isinstance(body, dict):
+                            raise HTTPError(400, "body must be a JSON object")
+                        status, payload = await self.dispatch(method, target, body)
+                    except HTTPError as e:
+                        status, payload = e.status, {"error": str(e)}
+                    except (KeyError, ValueError, TypeError) as e:
+                        status, payload = 400, {"error": f"bad request: {e}"}
+                    except Exception as e:
+                        status, payload = 500, {"error": repr(e)}
+                instrument.count(f"http.{status}")
+
+                data = json.dumps(payload).encode()
+                writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                             f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, unix: Optional[str] = None):
+        loop = asyncio.get_running_loop()
+        users = await loop.run_in_executor(self.executor, self.scan)
+        scheduler = asyncio.create_task(self.scheduler.run())
+        if unix:
+            server = await asyncio.start_unix_server(self.handle, path=unix)
+            where = unix
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+            where = "%s:%d" % server.sockets[0].getsockname()[:2]
+        print(f"StudyAlert service on {where} ({users} users, max {self.max_loaded} loaded)", flush=True)
+        stop = asyncio.Event()
+        try:
+            # SIGTERM shuts down like Ctrl+C, flushing every loaded profile
+            loop.add_signal_handler(signal.SIGTERM, stop.set)
+        except (NotImplementedError, AttributeError):
+            pass
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            self.scheduler.stop()
+            await asyncio.gather(scheduler, return_exceptions=True)
+            apps = list(self.loaded.values())
+            self.loaded.clear()
+            for app in apps:
+                await loop.run_in_executor(self.executor, self._close, app)
+            self.executor.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-profile StudyAlert service with a JSON HTTP API.")
+    parser.add_argument("--root", default="study_users", help="directory holding the per-user shards")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0 picks a free port")
+    parser.add_argument("--unix", help="listen on a Unix socket path instead of TCP")
+    parser.add_argument("--max-loaded", type=int, default=256, help="profiles kept in memory")
+    instrument.add_arguments(parser)
+    args = parser.parse_args(argv)
+    instrument.configure(args)
+
+    service = StudyService(args.root, args.max_loaded)
+    try:
+        asyncio.run(service.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("\nService stopped.")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
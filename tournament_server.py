@@ -0,0 +1,301 @@
+import argparse
+import asyncio
+import heapq
+import importlib.util
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from importlib.machinery import SourceFileLoader
+
+import instrument
+from Game import GameEngine
+from Level import LevelManager
+from leaderboard import Leaderboard
+
+# ScoreSystem lives in ScoreData.js (Python despite the extension), which a
+# plain import will not find
+_loader = SourceFileLoader("ScoreData", os.path.join(os.path.dirname(os.path.abspath(__file__)), "ScoreData.js"))
+ScoreData = importlib.util.module_from_spec(importlib.util.spec_from_loader("ScoreData", _loader))
+_loader.exec_module(ScoreData)
+ScoreSystem = ScoreData.ScoreSystem
+
+# Same rule as the Tk app: focus running out costs 50 points and refills to 50
+FOCUS_PENALTY = 50
+FOCUS_REFILL = 50
+MAX_LINE = 1 << 16
+
+
+class TournamentBoards:
+    """One board per level, shared by every player so the tournament is fair.
+
+    Passed to GameEngine as its puzzle_cache: get() hands out the level's
+    board and prefetch_level() has nothing to do, so no session pays for
+    generating or solver-validating a board.
+    """
+
+    def __init__(self, seed=None):
+        self.boards = {}
+        lm = LevelManager()
+        engine = GameEngine(lm, rng=random.Random(seed))
+        for level in range(1, lm.max_levels + 1):
+            lm.current_level = level
+            engine.reset_for_next_level()
+            self.boards[level] = (engine.grid, engine.target_sum)
+
+    def get(self, config):
+        grid, target = self.boards[config['difficulty']]
+        # Sessions never mutate the grid, so every engine can share one copy
+        return grid, target
+
+    def prefetch_level(self, level, ahead=1):
+        pass
+
+
+class Session:
+    __slots__ = ("id", "player", "level_manager", "engine", "score", "conn", "timer_version", "finished")
+
+    def __init__(self, sid, player, boards, leaderboard, conn):
+        self.id = sid
+        self.player = player
+        self.level_manager = LevelManager()
+        self.engine = GameEngine(self.level_manager, puzzle_cache=boards)
+        self.score = ScoreSystem(player, leaderboard, file_path=None)
+        self.conn = conn
+        self.timer_version = 0
+        self.finished = False
+
+    def board(self):
+        e = self.engine
+        return {"level": self.level_manager.current_level, "grid": e.grid, "target": e.target_sum,
+                "moves_left": e.moves_left}
+
+    def status(self):
+        e = self.engine
+        return {"sum": e.current_sum, "moves_left": e.moves_left, "score": self.score.total_score,
+                "focus": round(e.focus_level, 1), "level": self.level_manager.current_level}
+
+
+class Tournament:
+    """Hosts many GameEngine sessions on one event loop.
+
+    Focus is computed on demand by GameEngine, so instead of a timer per
+    session there is one heap of "focus hits 0" deadlines and a single task
+    that sleeps until the earliest, applies the penalty and re-arms. Entries
+    are versioned; anything that changes a session's drain (a move that
+    advances the level, focus in/out, a penalty) pushes a new entry and
+    the stale one is skipped when it surfaces.
+    """
+
+    def __init__(self, seed=None, leaderboard=None):
+        self.boards = TournamentBoards(seed)
+        self.leaderboard = leaderboard
+        self.sessions = {}
+        self._ids = itertools.count(1)
+        self._timers = []
+        self._wake = asyncio.Event()
+        self.moves = 0
+        self.penalties = 0
+
+    # --- SESSIONS ---
+
+    def join(self, player, conn):
+        session = Session(next(self._ids), player, self.boards, self.leaderboard, conn)
+        self.sessions[session.id] = session
+        self._arm(session)
+        return session
+
+    def leave(self, session):
+        self.sessions.pop(session.id, None)
+        session.timer_version += 1
+
+    # --- FOCUS TIMER ---
+
+    def _arm(self, session):
+        session.timer_version += 1
+        due = time.monotonic() + session.engine.seconds_until_focus(0)
+        heapq.heappush(self._timers, (due, session.timer_version, session.id))
+        if self._timers[0][2] == session.id:
+            self._wake.set()
+
+    async def focus_timer(self):
+        while True:
+            self._wake.clear()
+            now = time.monotonic()
+            while self._timers and self._timers[0][0] <= now:
+                _, version, sid = heapq.heappop(self._timers)
+                session = self.sessions.get(sid)
+                if session is None or session.timer_version != version:
+                    continue
+                if session.engine.focus_level <= 0:
+                    session.engine.focus_level = FOCUS_REFILL
+                    session.score.penalty(FOCUS_PENALTY)
+                    self.penalties += 1
+                    session.conn.push({"event": "focus_depleted", "session": sid,
+                                       "penalty": FOCUS_PENALTY, **session.status()})
+                self._arm(session)
+            delay = self._timers[0][0] - now if self._timers else None
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    # --- REQUESTS ---
+
+    def handle(self, session, msg):
+        op = msg.get("op")
+        engine = session.engine
+        if op == "move":
+            if session.finished:
+                return {"error": "tournament finished"}
+            r, c = int(msg["r"]), int(msg["c"])
+            n = engine.grid_size
+            # Negative indices would wrap around the grid lists instead of failing
+            if not (0 <= r < n and 0 <= c < n):
+                return {"error": f"cell ({r}, {c}) is outside the {n}x{n} board"}
+            result = engine.process_move(r, c)
+            self.moves += 1
+            reply = {"result": result}
+            if result == "WIN":
+                level = session.level_manager.current_level
+                session.score.add_points(engine.calculate_round_score())
+                session.score.finish_level(level)
+                if session.level_manager.next_level():
+                    engine.reset_for_next_level()
+                    reply["board"] = session.board()
+                    self._arm(session)  # New level, new drain rate
+                else:
+                    session.finished = True
+                    reply["finished"] = True
+            elif result == "LOSE":
+                engine.reset_current_level()
+            reply.update(session.status())
+            return reply
+        if op == "undo":
+            return {"undone": engine.undo(), **session.status()}
+        if op == "focus":
+            if msg.get("focused", True):
+                engine.handle_focus_gain()
+            else:
+                engine.handle_focus_loss()
+            self._arm(session)
+            return session.status()
+        if op == "state":
+            return {**session.board(), **session.status(), "path": engine.path}
+        return {"error": f"unknown op {op!r}"}
+
+    def top(self, level, k=10):
+        if self.leaderboard is None:
+            return []
+        return [{"player": p, "score": s} for p, s, _ in self.leaderboard.top_for_level(level, k)]
+
+
+class Connection:
+    """One TCP client speaking newline-delimited JSON.
+
+    A client may join several sessions on one connection; each request
+    names its "session" (default: the last one joined) and may carry an
+    "id" that is echoed back so replies can be matched to requests.
+    """
+
+    def __init__(self, tournament, writer):
+        self.tournament = tournament
+        self.writer = writer
+        self.sessions = {}
+        self.default = None
+
+    def push(self, payload):
+        if not self.writer.is_closing():
+            self.writer.write(json.dumps(payload, separators=(",", ":")).encode() + b"\n")
+
+    async def request(self, msg):
+        op = msg.get("op")
+        if op == "join":
+            session = self.tournament.join(str(msg.get("player", "player")), self)
+            self.sessions[session.id] = session
+            self.default = session
+            return {"session": session.id, **session.board(), **session.status()}
+        if op == "top":
+            # A SQLite query (and a wait for pending writes): keep it off the loop
+            level, k = int(msg.get("level", 1)), int(msg.get("k", 10))
+            top = await asyncio.get_running_loop().run_in_executor(None, self.tournament.top, level, k)
+            return {"top": top}
+        sid = msg.get("session")
+        session = self.sessions.get(sid) if sid is not None else self.default
+        if session is None:
+            return {"error": "join first (or unknown session)"}
+        if op == "leave":
+            self.tournament.leave(self.sessions.pop(session.id))
+            if self.default is session:
+                self.default = None
+            return {"left": session.id, "score": session.score.total_score}
+        return self.tournament.handle(session, msg)
+
+    def close(self):
+        for session in self.sessions.values():
+            self.tournament.leave(session)
+        self.sessions.clear()
+
+
+async def serve_client(tournament, reader, writer):
+    conn = Connection(tournament, writer)
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                msg = json.loads(line)
+                with instrument.timer("Tournament.request"):
+                    reply = await conn.request(msg)
+            except (ValueError, KeyError, TypeError, IndexError, AttributeError) as e:
+                msg, reply = {}, {"error": f"bad request: {e}"}
+            if isinstance(msg, dict) and "id" in msg:
+                reply["id"] = msg["id"]
+            conn.push(reply)
+            # Replies to pipelined requests go out together
+            if writer.transport.get_write_buffer_size() > MAX_LINE:
+                await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        pass
+    finally:
+        conn.close()
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=8770, seed=None, db=None):
+    leaderboard = Leaderboard(db) if db else None
+    tournament = Tournament(seed, leaderboard)
+    timer = asyncio.create_task(tournament.focus_timer())
+    server = await asyncio.start_server(lambda r, w: serve_client(tournament, r, w), host, port,
+                                        limit=MAX_LINE)
+    where = "%s:%d" % server.sockets[0].getsockname()[:2]
+    print(f"MindStrike tournament on {where} (seed {seed})", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        timer.cancel()
+        if leaderboard is not None:
+            leaderboard.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MindStrike tournament server (newline-delimited JSON over TCP).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8770, help="0 picks a free port")
+    parser.add_argument("--seed", type=int, help="board seed; every player gets the same boards")
+    parser.add_argument("--db", help="SQLite leaderboard file (default: no leaderboard)")
+    instrument.add_arguments(parser)
+    args = parser.parse_args(argv)
+    instrument.configure(args)
+    try:
+        asyncio.run(serve(args.host, args.port, args.seed, args.db))
+    except KeyboardInterrupt:
+        print("\nTournament closed.")
+
+
+if __name__ == "__main__":
+    sys.exit(main())